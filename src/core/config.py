@@ -16,6 +16,7 @@ class Config:
     SCREEN_WIDTH = 1280
     SCREEN_HEIGHT = 720
     FPS = 60
+    DIRTY_RECT_MAX_FRACTION = 0.2  # Above this share of the screen, flip instead of updating rects
     TITLE = "Duke Nukem Style Platform - Praise PIETRO!"
     
     # Colors (DOS-style but modernized)
@@ -47,9 +48,20 @@ class Config:
     # Physics
     GRAVITY = 0.8
     FRICTION = 0.85
+    FIXED_DT = 1.0 / FPS  # Simulation step length in seconds
+    FIXED_DT_TOLERANCE = 0.001  # clock.tick() rounds to whole ms, so a step is due slightly early
+    MAX_FRAME_TIME = 0.25  # Longest frame time simulated at once
     
     # Tile settings
     TILE_SIZE = 32
+    TILE_SHIFT = TILE_SIZE.bit_length() - 1  # pixel -> tile is a right shift
+    assert TILE_SIZE == 1 << TILE_SHIFT, "TILE_SIZE must be a power of two"
+    
+    # World bounds for projectiles (60x20 tile map plus a 100px margin)
+    WORLD_X_MIN = -100
+    WORLD_X_MAX = 60 * TILE_SIZE + 100
+    WORLD_Y_MIN = -100
+    WORLD_Y_MAX = 20 * TILE_SIZE + 100
     
     # Weapon settings
     PISTOL_DAMAGE = 25
@@ -66,9 +78,14 @@ class Config:
     ROBOT_HEALTH = 80
     MERCENARY_HEALTH = 60
     
+    # Off-screen culling margins around the camera view (pixels)
+    RENDER_CULL_MARGIN = 64  # Covers health bars drawn above sprites
+    UPDATE_CULL_MARGIN = 320  # Wider than any enemy detection range
+    
     # Debug settings
     DEBUG_MODE = False
     DEBUG_DRAW_GRID = False
+    EDITOR_KEYS_ENABLED = False  # Tilemap editor and world debug hotkeys (F2-F4, F10-F12...)
     
     # Audio settings
     MASTER_VOLUME = 0.7
@@ -23,12 +23,11 @@ class InputManager:
         self.mouse_just_clicked = [False, False, False]
         
     def update(self, events):
-        """Update input state based on pygame events"""
-        # Clear just pressed/released sets
-        self.keys_just_pressed.clear()
-        self.keys_just_released.clear()
-        self.mouse_just_clicked = [False, False, False]
+        """Update input state based on pygame events
         
+        Just pressed/released state accumulates until end_step() is called,
+        so presses made during frames without a simulation step aren't lost.
+        """
         # Get current key states
         keys = pygame.key.get_pressed()
         current_keys = set()
@@ -54,6 +53,12 @@ class InputManager:
             if mouse_buttons[i] and not self.mouse_buttons[i]:
                 self.mouse_just_clicked[i] = True
             self.mouse_buttons[i] = mouse_buttons[i]
+            
+    def end_step(self):
+        """Clear just pressed/released state once a simulation step has seen it"""
+        self.keys_just_pressed.clear()
+        self.keys_just_released.clear()
+        self.mouse_just_clicked = [False, False, False]
     
     def is_key_pressed(self, key: int) -> bool:
         """Check if key is currently pressed"""
@@ -13,16 +13,19 @@ import math
 from typing import Optional, TYPE_CHECKING, List
 from ...core.config import Config
 from .entity import Entity
-from .projectile import EnemyBullet
+from .projectile import EnemyBullet, render_projectiles
+from .pool import ProjectilePool
 
 if TYPE_CHECKING:
     # from ..world.level import Level  # Removed - now using collision_rects
     from .player import Player
+    from ..world.spatial_hash import SpatialHash
 
 class Enemy(Entity):
     """Base enemy class with AI"""
     
-    def __init__(self, x: float, y: float, width: int, height: int, asset_manager):
+    def __init__(self, x: float, y: float, width: int, height: int, asset_manager,
+                 projectile_pool: Optional[ProjectilePool] = None):
         super().__init__(x, y, width, height, asset_manager)
         
         # AI properties
@@ -42,12 +45,14 @@ class Enemy(Entity):
         self.attack_cooldown = 0.0
         self.attack_damage = 20
         self.projectiles = []
+        self.projectile_pool = projectile_pool or ProjectilePool(asset_manager)
         
         # Movement
         self.move_speed = 2.0
         self.jump_speed = -10
         
-    def update(self, dt: float, player: 'Player', collision_rects: List[pygame.Rect]):
+    def update(self, dt: float, player: 'Player', collision_rects: List[pygame.Rect],
+               collision_hash: Optional['SpatialHash'] = None):
         """Update enemy AI and behavior"""
         if not self.alive:
             return
@@ -67,8 +72,14 @@ class Enemy(Entity):
         self._handle_world_collision(collision_rects)
         
         # Update projectiles
-        self._update_projectiles(dt, collision_rects)
+        self._update_projectiles(dt, collision_rects, collision_hash)
         
+    def update_offscreen(self, dt: float, collision_rects: List[pygame.Rect],
+                         collision_hash: Optional['SpatialHash'] = None):
+        """Update an enemy far from the camera - AI is frozen, shots in flight keep moving"""
+        if self.projectiles:
+            self._update_projectiles(dt, collision_rects, collision_hash)
+            
     def _update_ai(self, dt: float, player: 'Player', collision_rects: List[pygame.Rect]):
         """Update AI state machine"""
         if not player or not player.alive:
@@ -167,7 +178,7 @@ class Enemy(Entity):
         spawn_y = self.y + self.height // 2
         
         # Create bullet
-        bullet = EnemyBullet(spawn_x, spawn_y, self.facing_right, self.asset_manager)
+        bullet = self.projectile_pool.acquire(EnemyBullet, spawn_x, spawn_y, self.facing_right)
         bullet.damage = self.attack_damage
         
         # Aim at target (simple leading)
@@ -206,14 +217,12 @@ class Enemy(Entity):
         if self.on_ground and self.vel_y > 0:
             self.vel_y = 0
             
-    def _update_projectiles(self, dt: float, collision_rects: List[pygame.Rect]):
+    def _update_projectiles(self, dt: float, collision_rects: List[pygame.Rect],
+                            collision_hash: Optional['SpatialHash'] = None):
         """Update enemy projectiles"""
-        for projectile in self.projectiles[:]:
-            projectile.update(dt, collision_rects)
-            
-            # Remove inactive projectiles
-            if not projectile.active:
-                self.projectiles.remove(projectile)
+        self.projectiles = self.projectile_pool.update_batch(
+            self.projectiles, dt, collision_rects, collision_hash
+        )
                 
     def render(self, surface: pygame.Surface, camera_offset: tuple = (0, 0)):
         """Render enemy and projectiles"""
@@ -223,9 +232,15 @@ class Enemy(Entity):
         # Render enemy sprite
         super().render(surface, camera_offset)
         
-        # Render projectiles
-        for projectile in self.projectiles:
-            projectile.render(surface, camera_offset)
+        self.render_overlay(surface, camera_offset)
+        
+    def render_overlay(self, surface: pygame.Surface, camera_offset: tuple = (0, 0)):
+        """Render what goes on top of the sprite (projectiles, health bar)"""
+        if not self.alive:
+            return
+            
+        # Render projectiles in one batched blit
+        render_projectiles(surface, self.projectiles, camera_offset)
             
         # Render health bar
         self._render_health_bar(surface, camera_offset)
@@ -251,8 +266,8 @@ class Enemy(Entity):
 class MutantEnemy(Enemy):
     """Mutant enemy - fast and aggressive"""
     
-    def __init__(self, x: float, y: float, asset_manager):
-        super().__init__(x, y, 32, 32, asset_manager)
+    def __init__(self, x: float, y: float, asset_manager, projectile_pool: Optional[ProjectilePool] = None):
+        super().__init__(x, y, 32, 32, asset_manager, projectile_pool)
         
         self.max_health = Config.MUTANT_HEALTH
         self.health = self.max_health
@@ -274,8 +289,8 @@ class MutantEnemy(Enemy):
 class RobotEnemy(Enemy):
     """Robot enemy - tough and shoots accurately"""
     
-    def __init__(self, x: float, y: float, asset_manager):
-        super().__init__(x, y, 32, 48, asset_manager)
+    def __init__(self, x: float, y: float, asset_manager, projectile_pool: Optional[ProjectilePool] = None):
+        super().__init__(x, y, 32, 48, asset_manager, projectile_pool)
         
         self.max_health = Config.ROBOT_HEALTH
         self.health = self.max_health
@@ -296,8 +311,8 @@ class RobotEnemy(Enemy):
 class MercenaryEnemy(Enemy):
     """Mercenary enemy - balanced and tactical"""
     
-    def __init__(self, x: float, y: float, asset_manager):
-        super().__init__(x, y, 32, 64, asset_manager)
+    def __init__(self, x: float, y: float, asset_manager, projectile_pool: Optional[ProjectilePool] = None):
+        super().__init__(x, y, 32, 64, asset_manager, projectile_pool)
         
         self.max_health = Config.MERCENARY_HEALTH
         self.health = self.max_health
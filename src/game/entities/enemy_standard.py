@@ -13,16 +13,18 @@ from typing import Optional, TYPE_CHECKING, List
 from ...core.config import Config
 from .enemy import Enemy
 from .animation import Animation
+from .pool import ProjectilePool
 
 if TYPE_CHECKING:
     from .player import Player
+    from ..world.spatial_hash import SpatialHash
 
 class EnemyStandard(Enemy):
     """Nemico standard con sistema di animazioni completo"""
     
-    def __init__(self, x: float, y: float, asset_manager):
+    def __init__(self, x: float, y: float, asset_manager, projectile_pool: Optional[ProjectilePool] = None):
         # Inizializza con dimensioni temporanee, verranno aggiornate dopo il caricamento dello spritesheet
-        super().__init__(x, y, 32, 32, asset_manager)
+        super().__init__(x, y, 32, 32, asset_manager, projectile_pool)
         
         # Carica spritesheet per ottenere le dimensioni corrette
         self.spritesheet = None
@@ -140,6 +142,10 @@ class EnemyStandard(Enemy):
             }
         }
         
+        # Frame specchiati per il nemico rivolto a sinistra, calcolati una volta
+        for anim in self.animations.values():
+            anim["flipped_frames"] = [pygame.transform.flip(frame, True, False) for frame in anim["frames"]]
+        
     def _extract_frames(self, row: int, frame_count: int) -> List[pygame.Surface]:
         """Estrae i frame da una riga del spritesheet e li scala alle dimensioni target"""
         frames = []
@@ -167,7 +173,8 @@ class EnemyStandard(Enemy):
             self.collision_height
         )
         
-    def update(self, dt: float, player: 'Player', collision_rects: List[pygame.Rect]):
+    def update(self, dt: float, player: 'Player', collision_rects: List[pygame.Rect],
+               collision_hash: Optional['SpatialHash'] = None):
         """Aggiorna nemico con gestione animazioni"""
         if not self.alive and not self.death_animation_complete:
             self._update_death_animation(dt)
@@ -180,7 +187,7 @@ class EnemyStandard(Enemy):
             self.hit_timer -= dt
             
         # Aggiorna AI e fisica
-        super().update(dt, player, collision_rects)
+        super().update(dt, player, collision_rects, collision_hash)
         
         # Determina stato animazione basato su AI state
         self._update_animation_state()
@@ -259,21 +266,30 @@ class EnemyStandard(Enemy):
         if not self.alive and self.death_animation_complete:
             return
             
-        # Calcola posizione schermo
-        screen_x = int(self.x - camera_offset[0])
-        screen_y = int(self.y - camera_offset[1])
+        blit_pair = self.get_blit_pair(camera_offset)
+        if blit_pair:
+            surface.blit(*blit_pair)
+            
+        self.render_overlay(surface, camera_offset)
         
-        # Ottieni frame corrente
-        if (self.current_animation in self.animations and 
-            self.current_frame < len(self.animations[self.current_animation]["frames"])):
+    def get_blit_pair(self, camera_offset: tuple = (0, 0)):
+        """Restituisce (frame corrente, posizione schermo) per un Surface.blits a lotti"""
+        if not self.alive and self.death_animation_complete:
+            return None
             
-            frame = self.animations[self.current_animation]["frames"][self.current_frame]
+        # Ottieni frame corrente
+        anim = self.animations.get(self.current_animation)
+        if anim is None or self.current_frame >= len(anim["frames"]):
+            return None
             
-            # Flip orizzontale se necessario
-            if not self.facing_right:
-                frame = pygame.transform.flip(frame, True, False)
-                
-            surface.blit(frame, (screen_x, screen_y))
+        # Frame specchiato se rivolto a sinistra
+        frames = anim["frames"] if self.facing_right else anim["flipped_frames"]
+        return frames[self.current_frame], (int(self.x - camera_offset[0]), int(self.y - camera_offset[1]))
+        
+    def render_overlay(self, surface: pygame.Surface, camera_offset: tuple = (0, 0)):
+        """Renderizza box di debug e barra salute sopra lo sprite"""
+        if not self.alive and self.death_animation_complete:
+            return
             
         # Debug: mostra collision box
         if Config.DEBUG_MODE:
@@ -288,7 +304,7 @@ class EnemyStandard(Enemy):
             
         # Barra salute
         if self.alive and self.health < self.max_health:
-            self._render_health_bar(surface, screen_x, screen_y - 10)
+            self._render_health_bar(surface, int(self.x - camera_offset[0]), int(self.y - camera_offset[1]) - 10)
             
     def _render_health_bar(self, surface: pygame.Surface, x: int, y: int):
         """Renderizza barra della salute"""
@@ -8,14 +8,31 @@ PIETRO's divine entity system brings life to all game objects!
 """
 
 import pygame
+import weakref
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 from ...core.config import Config
 from ...core.asset_manager import AssetManager
 
+# Horizontally flipped copies of sprites, dropped together with their source surface
+_flipped_sprites: weakref.WeakKeyDictionary[pygame.Surface, pygame.Surface] = weakref.WeakKeyDictionary()
+
+def get_flipped_sprite(sprite: pygame.Surface) -> pygame.Surface:
+    """Get a horizontally flipped copy of sprite, flipping each surface only once"""
+    flipped = _flipped_sprites.get(sprite)
+    if flipped is None:
+        flipped = pygame.transform.flip(sprite, True, False)
+        _flipped_sprites[sprite] = flipped
+    return flipped
+
 class Entity(ABC):
     """Base class for all game entities"""
     
+    # Subclasses that don't declare __slots__ (player, enemies) still get a __dict__
+    __slots__ = ('x', 'y', 'width', 'height', 'vel_x', 'vel_y', 'on_ground', 'gravity_affected',
+                 'max_health', 'health', 'alive', 'sprite_name', 'facing_right', 'asset_manager',
+                 'animation_timer', 'animation_frame', 'animation_speed')
+    
     def __init__(self, x: float, y: float, width: int, height: int, asset_manager: AssetManager):
         # Position and movement
         self.x = x
@@ -125,22 +142,33 @@ class Entity(ABC):
         if not self.alive:
             return
             
-        # Calculate screen position
-        screen_x = int(self.x - camera_offset[0])
-        screen_y = int(self.y - camera_offset[1])
-        
-        # Get sprite
-        sprite = self.get_current_sprite()
-        if sprite:
-            # Flip sprite if facing left
-            if not self.facing_right:
-                sprite = pygame.transform.flip(sprite, True, False)
-                
-            surface.blit(sprite, (screen_x, screen_y))
+        blit_pair = self.get_blit_pair(camera_offset)
+        if blit_pair:
+            surface.blit(*blit_pair)
         else:
             # Draw placeholder rectangle if no sprite
             color = Config.RED if not self.alive else Config.GREEN
-            pygame.draw.rect(surface, color, (screen_x, screen_y, self.width, self.height))
+            pygame.draw.rect(surface, color, (int(self.x - camera_offset[0]), int(self.y - camera_offset[1]),
+                                              self.width, self.height))
+            
+    def get_blit_pair(self, camera_offset: Tuple[int, int] = (0, 0)) -> Optional[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Get the (sprite, screen position) pair for a batched Surface.blits
+        
+        Returns:
+            None if there is no sprite to draw
+        """
+        if not self.alive:
+            return None
+            
+        sprite = self.get_current_sprite()
+        if not sprite:
+            return None
+            
+        # Flip sprite if facing left (flipped copy is cached)
+        if not self.facing_right:
+            sprite = get_flipped_sprite(sprite)
+            
+        return sprite, (int(self.x - camera_offset[0]), int(self.y - camera_offset[1]))
             
     def get_current_sprite(self) -> Optional[pygame.Surface]:
         """Get current sprite based on state and animation"""
@@ -1,7 +1,7 @@
 import pygame
 import math
 from enum import Enum
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from ...core.config import Config
 
 class ItemType(Enum):
@@ -212,9 +212,30 @@ class Item:
             camera_x: Offset camera X
             camera_y: Offset camera Y
         """
-        if self.collected:
+        blit_pair = self.get_blit_pair(camera_x, camera_y)
+        if blit_pair is None:
             return
             
+        sprite, (screen_x, screen_y) = blit_pair
+        screen.blit(sprite, (screen_x, screen_y))
+        
+        # Debug: mostra collision box
+        if Config.DEBUG_MODE:
+            self.render_debug(screen, screen_x, screen_y)
+    
+    def get_blit_pair(self, camera_x: float, camera_y: float) -> Optional[Tuple[pygame.Surface, Tuple[float, float]]]:
+        """Ottiene (sprite, posizione schermo) per un Surface.blits a lotti
+        
+        Args:
+            camera_x: Offset camera X
+            camera_y: Offset camera Y
+            
+        Returns:
+            None se l'oggetto è raccolto o fuori dallo schermo
+        """
+        if self.collected:
+            return None
+            
         # Calcola posizione sullo schermo
         screen_x = self.x - camera_x
         screen_y = self.y - camera_y + self.float_offset
@@ -222,17 +243,22 @@ class Item:
         # Renderizza solo se visibile
         if (-self.SPRITE_SIZE <= screen_x <= Config.SCREEN_WIDTH and 
             -self.SPRITE_SIZE <= screen_y <= Config.SCREEN_HEIGHT):
-            
-            sprite = self.get_current_sprite()
-            screen.blit(sprite, (screen_x, screen_y))
-            
-            # Debug: mostra collision box
-            if Config.DEBUG_MODE:
-                debug_rect = pygame.Rect(
-                    screen_x + 4, screen_y + 4,
-                    self.SPRITE_SIZE - 8, self.SPRITE_SIZE - 8
-                )
-                pygame.draw.rect(screen, (0, 255, 0), debug_rect, 1)
+            return self.get_current_sprite(), (screen_x, screen_y)
+        return None
+    
+    def render_debug(self, screen: pygame.Surface, screen_x: float, screen_y: float):
+        """Disegna la collision box di debug
+        
+        Args:
+            screen: Superficie di rendering
+            screen_x: Posizione X sullo schermo
+            screen_y: Posizione Y sullo schermo
+        """
+        debug_rect = pygame.Rect(
+            screen_x + 4, screen_y + 4,
+            self.SPRITE_SIZE - 8, self.SPRITE_SIZE - 8
+        )
+        pygame.draw.rect(screen, (0, 255, 0), debug_rect, 1)
     
     def collect(self) -> Dict[str, Any]:
         """Raccoglie l'oggetto
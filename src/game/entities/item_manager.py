@@ -1,9 +1,16 @@
 import pygame
 import random
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Sequence
 from .item import Item, ItemType, ItemEffect
 from ...core.config import Config
 
+# Mappa nome salvato -> ItemType, costruita una sola volta
+_NAME_TO_ITEMTYPE: Dict[str, ItemType] = {item_type.value: item_type for item_type in ItemType}
+
+# Risultato condiviso di check_collision quando nulla viene raccolto
+_NO_HITS: tuple = ()
+
 class PowerUp:
     """Classe per gestire power-up temporanei attivi"""
     
@@ -46,6 +53,14 @@ class PowerUp:
 class ItemManager:
     """Gestore degli oggetti nel gioco"""
     
+    # Statistica modificata da ogni power-up: (nome, valore attivo, valore a riposo)
+    # Un valore attivo None indica di usare il valore dell'oggetto raccolto
+    POWERUP_STATS = {
+        ItemEffect.TEMPORARY_SHIELD: ('has_shield', True, False),
+        ItemEffect.TEMPORARY_DAMAGE: ('damage_multiplier', None, 1.0),
+        ItemEffect.TEMPORARY_SPEED: ('speed_multiplier', None, 1.0)
+    }
+    
     def __init__(self, spritesheet: pygame.Surface):
         """Inizializza il gestore oggetti
         
@@ -54,6 +69,7 @@ class ItemManager:
         """
         self.spritesheet = spritesheet
         self.items: List[Item] = []
+        self._active_items = 0  # Oggetti non ancora raccolti
         
         # Inventario permanente
         self.permanent_upgrades: Dict[ItemType, bool] = {
@@ -75,6 +91,11 @@ class ItemManager:
             'keycards': 0,
             'artifacts_collected': 0
         }
+        
+        # Viste in sola lettura restituite dai getter (nessuna copia per frame)
+        self._powerups_view = MappingProxyType(self.active_powerups)
+        self._upgrades_view = MappingProxyType(self.permanent_upgrades)
+        self._stats_view = MappingProxyType(self.player_stats)
     
     def spawn_item(self, x: float, y: float, item_type: ItemType) -> Item:
         """Spawna un nuovo oggetto
@@ -89,6 +110,7 @@ class ItemManager:
         """
         item = Item(x, y, item_type, self.spritesheet)
         self.items.append(item)
+        self._active_items += 1
         return item
     
     def spawn_random_item(self, x: float, y: float, difficulty: float = 1.0) -> Item:
@@ -174,25 +196,28 @@ class ItemManager:
             self._remove_powerup_effect(effect)
             del self.active_powerups[effect]
     
-    def check_collision(self, player_rect: pygame.Rect) -> List[Dict[str, Any]]:
+    def check_collision(self, player_rect: pygame.Rect) -> Sequence[Dict[str, Any]]:
         """Controlla collisioni con il giocatore
         
         Args:
             player_rect: Rettangolo del giocatore
             
         Returns:
-            Lista degli effetti degli oggetti raccolti
+            Sequenza degli effetti degli oggetti raccolti (tupla vuota se nessuno)
         """
-        collected_effects = []
+        collected_effects = None
         
         for item in self.items:
             if not item.collected and item.get_collision_rect().colliderect(player_rect):
                 effect_data = item.collect()
                 if effect_data:
+                    self._active_items -= 1
+                    if collected_effects is None:
+                        collected_effects = []
                     collected_effects.append(effect_data)
                     self._apply_item_effect(effect_data)
         
-        return collected_effects
+        return collected_effects or _NO_HITS
     
     def _apply_item_effect(self, effect_data: Dict[str, Any]):
         """Applica l'effetto di un oggetto raccolto
@@ -220,7 +245,7 @@ class ItemManager:
         elif effect == ItemEffect.SAVE_CHECKPOINT:
             # Gestito dal game state
             pass
-        elif effect in [ItemEffect.TEMPORARY_SHIELD, ItemEffect.TEMPORARY_DAMAGE, ItemEffect.TEMPORARY_SPEED]:
+        elif effect in self.POWERUP_STATS:
             # Power-up temporaneo
             powerup = PowerUp(effect, value, duration)
             self.active_powerups[effect] = powerup
@@ -238,12 +263,8 @@ class ItemManager:
             effect: Tipo di effetto
             value: Valore dell'effetto
         """
-        if effect == ItemEffect.TEMPORARY_SHIELD:
-            self.player_stats['has_shield'] = True
-        elif effect == ItemEffect.TEMPORARY_DAMAGE:
-            self.player_stats['damage_multiplier'] = value
-        elif effect == ItemEffect.TEMPORARY_SPEED:
-            self.player_stats['speed_multiplier'] = value
+        stat_name, active_value, _ = self.POWERUP_STATS[effect]
+        self.player_stats[stat_name] = value if active_value is None else active_value
     
     def _remove_powerup_effect(self, effect: ItemEffect):
         """Rimuove effetto power-up scaduto
@@ -251,12 +272,8 @@ class ItemManager:
         Args:
             effect: Tipo di effetto
         """
-        if effect == ItemEffect.TEMPORARY_SHIELD:
-            self.player_stats['has_shield'] = False
-        elif effect == ItemEffect.TEMPORARY_DAMAGE:
-            self.player_stats['damage_multiplier'] = 1.0
-        elif effect == ItemEffect.TEMPORARY_SPEED:
-            self.player_stats['speed_multiplier'] = 1.0
+        stat_name, _, idle_value = self.POWERUP_STATS[effect]
+        self.player_stats[stat_name] = idle_value
     
     def render(self, screen: pygame.Surface, camera_x: float, camera_y: float):
         """Renderizza tutti gli oggetti
@@ -266,16 +283,33 @@ class ItemManager:
             camera_x: Offset camera X
             camera_y: Offset camera Y
         """
+        # Scarta subito gli oggetti fuori dallo schermo in orizzontale
+        min_x = camera_x - Item.SPRITE_SIZE
+        max_x = camera_x + Config.SCREEN_WIDTH
+        blits = []
+        visible_items = []
         for item in self.items:
-            item.render(screen, camera_x, camera_y)
+            if min_x <= item.x <= max_x:
+                blit_pair = item.get_blit_pair(camera_x, camera_y)
+                if blit_pair is not None:
+                    blits.append(blit_pair)
+                    visible_items.append(item)
+                    
+        # Un'unica chiamata blits per tutti gli sprite visibili
+        screen.blits(blits, doreturn=False)
+        
+        # Debug: collision box sopra gli sprite
+        if Config.DEBUG_MODE:
+            for item, (_, (screen_x, screen_y)) in zip(visible_items, blits):
+                item.render_debug(screen, screen_x, screen_y)
     
-    def get_active_powerups(self) -> Dict[ItemEffect, PowerUp]:
+    def get_active_powerups(self) -> Mapping[ItemEffect, PowerUp]:
         """Ottiene i power-up attivi
         
         Returns:
-            Dizionario dei power-up attivi
+            Vista in sola lettura dei power-up attivi
         """
-        return self.active_powerups.copy()
+        return self._powerups_view
     
     def has_active_power_up(self, item_type: ItemType) -> bool:
         """Controlla se un power-up è attivo
@@ -296,17 +330,25 @@ class ItemManager:
         effect = effect_mapping.get(item_type)
         return effect is not None and effect in self.active_powerups
     
-    def get_permanent_upgrades(self) -> Dict[ItemType, bool]:
+    def get_permanent_upgrades(self) -> Mapping[ItemType, bool]:
         """Ottiene gli upgrade permanenti
         
         Returns:
-            Dizionario degli upgrade permanenti
+            Vista in sola lettura degli upgrade permanenti
         """
-        return self.permanent_upgrades.copy()
+        return self._upgrades_view
     
-    def get_player_stats(self) -> Dict[str, Any]:
+    def get_player_stats(self) -> Mapping[str, Any]:
         """Ottiene le statistiche modificate del giocatore
         
+        Returns:
+            Vista in sola lettura delle statistiche
+        """
+        return self._stats_view
+    
+    def copy_player_stats(self) -> Dict[str, Any]:
+        """Ottiene una copia modificabile delle statistiche del giocatore
+        
         Returns:
             Dizionario delle statistiche
         """
@@ -334,6 +376,7 @@ class ItemManager:
     def clear_all_items(self):
         """Rimuove tutti gli oggetti (per cambio livello)"""
         self.items.clear()
+        self._active_items = 0
     
     def get_items_count(self) -> int:
         """Ottiene il numero di oggetti attivi
@@ -341,7 +384,7 @@ class ItemManager:
         Returns:
             Numero di oggetti
         """
-        return len([item for item in self.items if not item.collected])
+        return self._active_items
     
     def spawn_checkpoint(self, x: float, y: float) -> Item:
         """Spawna un checkpoint
@@ -362,8 +405,11 @@ class ItemManager:
             Dati di salvataggio
         """
         return {
-            'permanent_upgrades': self.permanent_upgrades,
-            'player_stats': self.player_stats,
+            'permanent_upgrades': {
+                item_type.value: value
+                for item_type, value in self.permanent_upgrades.items()
+            },
+            'player_stats': self.copy_player_stats(),
             'items': [
                 {
                     'x': item.x,
@@ -383,16 +429,16 @@ class ItemManager:
         """
         if 'permanent_upgrades' in data:
             for upgrade_name, value in data['permanent_upgrades'].items():
-                if hasattr(ItemType, upgrade_name.upper()):
-                    item_type = ItemType(upgrade_name)
+                item_type = _NAME_TO_ITEMTYPE.get(upgrade_name)
+                if item_type is not None:
                     self.permanent_upgrades[item_type] = value
         
         if 'player_stats' in data:
             self.player_stats.update(data['player_stats'])
         
         if 'items' in data:
-            self.items.clear()
+            self.clear_all_items()
             for item_data in data['items']:
                 if not item_data.get('collected', False):
-                    item_type = ItemType(item_data['type'])
+                    item_type = _NAME_TO_ITEMTYPE[item_data['type']]
                     item = self.spawn_item(item_data['x'], item_data['y'], item_type)
\ No newline at end of file
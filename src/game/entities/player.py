@@ -8,23 +8,27 @@ PIETRO's chosen warrior, armed and ready for battle!
 """
 
 import pygame
-from typing import List, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 from ...core.config import Config
 from ...core.input_manager import InputManager
 from .entity import Entity
-from .projectile import Bullet, Rocket
+from .projectile import Bullet, Rocket, render_projectiles
 from .weapon import Weapon, WeaponType
 from .animation import PlayerAnimator, AnimationState
 from .item_manager import ItemManager
+from .pool import ProjectilePool
 
 if TYPE_CHECKING:
     # from ..world.level import Level  # Removed - now using collision_rects
-    pass
+    from ..world.spatial_hash import SpatialHash
 
 class Player(Entity):
     """Player character class"""
     
-    def __init__(self, x: float, y: float, asset_manager):
+    # Vertical velocity offsets of the three shotgun pellets
+    SHOTGUN_SPREAD = (-20.0, 0.0, 20.0)
+    
+    def __init__(self, x: float, y: float, asset_manager, projectile_pool: Optional[ProjectilePool] = None):
         super().__init__(x, y, Config.PLAYER_SIZE[0], Config.PLAYER_SIZE[1], asset_manager)
         
         # Player stats
@@ -44,10 +48,15 @@ class Player(Entity):
         self.weapons: List[Weapon] = []
         self.current_weapon_index = 0
         self.projectiles: List = []
+        self.projectile_pool = projectile_pool or ProjectilePool(asset_manager)
         self.shoot_cooldown = 0.0
         
+        # HUD notifications as (event, value), drained by the HUD every frame
+        self.hud_events: List[tuple] = []
+        
         # Initialize weapons
         self._init_weapons()
+        self.notify_ammo_changed()
         
         # Utilities
         self.has_jetpack = False
@@ -74,6 +83,13 @@ class Player(Entity):
         self.height = self.animator.target_height
         print(f"Player dimensions updated to: {self.width}x{self.height}")
         
+        # Persistent collision rects, updated in place every frame
+        self._player_rect = pygame.Rect(0, 0, self.width, self.height)
+        self._ground_probe = pygame.Rect(0, 0, self.width, 2)
+        
+        # Flashlight beam surface, created on first use (needs a display)
+        self._beam_surface: Optional[pygame.Surface] = None
+        
         # Action states for animations
         self.is_shooting = False
         self.is_changing_weapon = False
@@ -104,10 +120,23 @@ class Player(Entity):
             return self.weapons[self.current_weapon_index]
         return None
         
+    def notify_ammo_changed(self):
+        """Tell the HUD the current weapon's ammo count (after shots, pickups, switches)"""
+        weapon = self.get_current_weapon()
+        if weapon:
+            self.hud_events.append(("ammo", weapon.ammo))
+            
+    def take_damage(self, damage: int) -> bool:
+        """Take damage and notify the HUD"""
+        died = super().take_damage(damage)
+        self.hud_events.append(("damage", self.health))
+        return died
+        
     def switch_weapon(self):
         """Switch to next weapon"""
         if len(self.weapons) > 1:
             self.current_weapon_index = (self.current_weapon_index + 1) % len(self.weapons)
+            self.notify_ammo_changed()
             # Attiva animazione cambio arma
             self.is_changing_weapon = True
             self.action_timer = 0.4  # Durata animazione cambio arma
@@ -117,9 +146,12 @@ class Player(Entity):
         for weapon in self.weapons:
             if weapon.weapon_type == weapon_type:
                 weapon.add_ammo(amount)
+                self.notify_ammo_changed()
                 break
                 
-    def update(self, dt: float, input_manager: InputManager, collision_rects: List[pygame.Rect]):
+    def update(self, dt: float, input_manager: InputManager, collision_rects: List[pygame.Rect],
+               collision_rows: Optional[Dict[int, List[pygame.Rect]]] = None,
+               collision_hash: Optional['SpatialHash'] = None):
         """Update player logic"""
         if not self.alive:
             return
@@ -131,11 +163,10 @@ class Player(Entity):
         self.update_physics(dt)
         
         # Handle collisions with world
-        self._handle_world_collision(collision_rects)
+        self._handle_world_collision(collision_rects, collision_rows)
         
-        # Update weapons and projectiles
-        self._update_weapons(dt)
-        self._update_projectiles(dt, collision_rects)
+        # Update projectiles (weapon cooldowns are timestamp based)
+        self._update_projectiles(dt, collision_rects, collision_hash)
         
         # Update utilities
         self._update_utilities(dt)
@@ -222,23 +253,26 @@ class Player(Entity):
         
         # Create projectile based on weapon type
         if weapon.weapon_type == WeaponType.PISTOL:
-            projectile = Bullet(spawn_x, spawn_y, self.facing_right, self.asset_manager)
+            projectile = self.projectile_pool.acquire(Bullet, spawn_x, spawn_y, self.facing_right)
             projectile.damage = Config.PISTOL_DAMAGE
             
         elif weapon.weapon_type == WeaponType.SHOTGUN:
             # Create multiple bullets for shotgun
-            for i in range(3):
-                angle_offset = (i - 1) * 0.2  # Spread bullets
-                projectile = Bullet(spawn_x, spawn_y, self.facing_right, self.asset_manager)
-                projectile.damage = Config.SHOTGUN_DAMAGE // 3
-                projectile.vel_y += angle_offset * 100
-                self.projectiles.append(projectile)
+            pellet_damage = Config.SHOTGUN_DAMAGE // 3
+            acquire = self.projectile_pool.acquire
+            pellets = [acquire(Bullet, spawn_x, spawn_y, self.facing_right)
+                       for _ in self.SHOTGUN_SPREAD]
+            for pellet, spread in zip(pellets, self.SHOTGUN_SPREAD):
+                pellet.damage = pellet_damage
+                pellet.vel_y += spread
+            self.projectiles.extend(pellets)
             weapon.shoot()
+            self.notify_ammo_changed()
             self.shoot_cooldown = weapon.fire_rate
             return
             
         elif weapon.weapon_type == WeaponType.ROCKET_LAUNCHER:
-            projectile = Rocket(spawn_x, spawn_y, self.facing_right, self.asset_manager)
+            projectile = self.projectile_pool.acquire(Rocket, spawn_x, spawn_y, self.facing_right)
             projectile.damage = Config.ROCKET_DAMAGE
             
         else:
@@ -246,6 +280,7 @@ class Player(Entity):
             
         self.projectiles.append(projectile)
         weapon.shoot()
+        self.notify_ammo_changed()
         self.shoot_cooldown = weapon.fire_rate
         
     def _use_utility(self):
@@ -261,24 +296,35 @@ class Player(Entity):
             self.is_using_utility = True
             self.action_timer = 0.5  # Durata animazione utility
             
-    def _handle_world_collision(self, collision_rects: List[pygame.Rect]):
+    def _handle_world_collision(self, collision_rects: List[pygame.Rect],
+                                collision_rows: Optional[Dict[int, List[pygame.Rect]]] = None):
         """Handle collision with world geometry"""
         if not collision_rects:
             return
             
         # Simple collision detection with world tiles
-        player_rect = self.get_rect()
+        player_rect = self._player_rect
+        player_rect.x = int(self.x)
+        player_rect.y = int(self.y)
         
         # Check if on ground
-        ground_check_rect = pygame.Rect(player_rect.x, player_rect.bottom, player_rect.width, 2)
+        ground_check_rect = self._ground_probe
+        ground_check_rect.x = player_rect.x
+        ground_check_rect.y = player_rect.bottom
         was_on_ground = self.on_ground
         self.on_ground = False
         
-        # Check collision with all solid rects
-        for rect in collision_rects:
-            if ground_check_rect.colliderect(rect):
-                self.on_ground = True
-                break
+        if collision_rows is not None:
+            # Only the tile rows touched by the 2px probe can hold the ground
+            first_row = ground_check_rect.top >> Config.TILE_SHIFT
+            last_row = (ground_check_rect.bottom - 1) >> Config.TILE_SHIFT
+            for row in range(first_row, last_row + 1):
+                if ground_check_rect.collidelist(collision_rows.get(row, ())) != -1:
+                    self.on_ground = True
+                    break
+        else:
+            # Check collision with all solid rects
+            self.on_ground = ground_check_rect.collidelist(collision_rects) != -1
         
         # Coyote time - allow jumping briefly after leaving ground
         if was_on_ground and not self.on_ground:
@@ -293,19 +339,12 @@ class Player(Entity):
         if self.on_ground and self.jetpack_fuel < self.max_jetpack_fuel:
             self.jetpack_fuel = min(self.max_jetpack_fuel, self.jetpack_fuel + 30 * 0.016)  # Assuming 60 FPS
             
-    def _update_weapons(self, dt: float):
-        """Update weapon states"""
-        for weapon in self.weapons:
-            weapon.update(dt)
-            
-    def _update_projectiles(self, dt: float, collision_rects: List[pygame.Rect]):
+    def _update_projectiles(self, dt: float, collision_rects: List[pygame.Rect],
+                            collision_hash: Optional['SpatialHash'] = None):
         """Update player projectiles"""
-        for projectile in self.projectiles[:]:
-            projectile.update(dt, collision_rects)
-            
-            # Remove projectiles that are no longer active
-            if not projectile.active:
-                self.projectiles.remove(projectile)
+        self.projectiles = self.projectile_pool.update_batch(
+            self.projectiles, dt, collision_rects, collision_hash
+        )
                 
     def _update_utilities(self, dt: float):
         """Update utility states"""
@@ -366,9 +405,8 @@ class Player(Entity):
             screen_y = int(self.y - camera_offset[1])
             surface.blit(current_sprite, (screen_x, screen_y))
         
-        # Render projectiles
-        for projectile in self.projectiles:
-            projectile.render(surface, camera_offset)
+        # Render projectiles in one batched blit
+        render_projectiles(surface, self.projectiles, camera_offset)
             
         # Render jetpack effect
         if self.jetpack_active:
@@ -396,17 +434,13 @@ class Player(Entity):
         beam_length = 200
         beam_end_x = screen_x + (beam_length if self.facing_right else -beam_length)
         
-        # Draw beam as a triangle
-        points = [
-            (screen_x, screen_y - 10),
-            (screen_x, screen_y + 10),
-            (beam_end_x, screen_y)
-        ]
-        
-        # Create semi-transparent surface for beam
-        beam_surface = pygame.Surface((abs(beam_end_x - screen_x), 20))
-        beam_surface.set_alpha(64)
-        beam_surface.fill(Config.YELLOW)
+        # Semi-transparent beam surface is built once and reused
+        beam_surface = self._beam_surface
+        if beam_surface is None:
+            beam_surface = pygame.Surface((beam_length, 20)).convert()
+            beam_surface.set_alpha(64)
+            beam_surface.fill(Config.YELLOW)
+            self._beam_surface = beam_surface
         
         beam_rect = beam_surface.get_rect()
         beam_rect.center = ((screen_x + beam_end_x) // 2, screen_y)
@@ -431,6 +465,7 @@ class Player(Entity):
             current_weapon = self.get_current_weapon()
             if current_weapon:
                 current_weapon.add_ammo(30)
+                self.notify_ammo_changed()
         elif item.item_type == ItemType.KEYCARD:
             self.keycards += 1
         elif item.item_type == ItemType.CREDITS:
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Projectile Pool
+Recycles projectile instances instead of allocating one per shot
+
+Developed by Team PIETRO
+PIETRO wastes nothing - every bullet returns to his arsenal!
+"""
+
+import pygame
+from typing import Dict, List, Optional, Type, TypeVar, TYPE_CHECKING
+from .projectile import Projectile
+
+if TYPE_CHECKING:
+    from ..world.spatial_hash import SpatialHash
+
+P = TypeVar('P', bound=Projectile)
+
+class ProjectilePool:
+    """Free-lists of reusable projectiles, one per projectile class"""
+
+    def __init__(self, asset_manager):
+        self.asset_manager = asset_manager
+        self.free: Dict[type, List[Projectile]] = {}
+
+    def prewarm(self, projectile_class: Type[P], count: int):
+        """Preallocate projectiles so the first shots don't allocate"""
+        free_list = self.free.setdefault(projectile_class, [])
+        for _ in range(count):
+            free_list.append(projectile_class(0.0, 0.0, True, self.asset_manager))
+
+    def acquire(self, projectile_class: Type[P], x: float, y: float, facing_right: bool) -> P:
+        """Get a ready-to-fire projectile, reusing a released one if available"""
+        free_list = self.free.get(projectile_class)
+        if free_list:
+            projectile = free_list.pop()
+            projectile.reset(x, y, facing_right)
+            return projectile
+        return projectile_class(x, y, facing_right, self.asset_manager)
+
+    def release(self, projectile: Projectile):
+        """Return an inactive projectile to its free-list"""
+        self.free.setdefault(type(projectile), []).append(projectile)
+
+    def update_batch(self, projectiles: List[Projectile], dt: float,
+                     collision_rects: List[pygame.Rect],
+                     collision_hash: Optional['SpatialHash'] = None) -> List[Projectile]:
+        """Step a batch of projectiles in one pass, releasing the spent ones
+
+        Returns:
+            The projectiles still active
+        """
+        if not projectiles:
+            return projectiles
+            
+        survivors = []
+        free = self.free
+        for projectile in projectiles:
+            projectile.update(dt, collision_rects, collision_hash)
+            if projectile.active:
+                survivors.append(projectile)
+            else:
+                free.setdefault(type(projectile), []).append(projectile)
+        return survivors
+
+    def get_free_count(self, projectile_class: type) -> int:
+        """Get number of pooled projectiles available for a class"""
+        return len(self.free.get(projectile_class, ()))
@@ -8,19 +8,47 @@ PIETRO's projectiles fly true and strike with divine precision!
 """
 
 import pygame
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 from ...core.config import Config
-from .entity import Entity
+from .entity import Entity, get_flipped_sprite
 
 if TYPE_CHECKING:
     # from ..world.level import Level  # Removed - now using collision_rects
-    pass
+    from ..world.spatial_hash import SpatialHash
+
+def render_projectiles(surface: pygame.Surface, projectiles: List['Projectile'],
+                       camera_offset: tuple = (0, 0)):
+    """Render a list of projectiles with a single Surface.blits call"""
+    if not projectiles:
+        return
+        
+    blits = []
+    for projectile in projectiles:
+        if projectile.active:
+            projectile.collect_blits(blits, camera_offset)
+    if blits:
+        surface.blits(blits, doreturn=False)
 
 class Projectile(Entity):
     """Base projectile class"""
     
+    __slots__ = ('damage', 'speed', 'lifetime', 'active')
+    
+    # Scratch hitbox shared by all projectiles, moved in place during update
+    _scratch_rect = pygame.Rect(0, 0, 4, 4)
+    
     def __init__(self, x: float, y: float, width: int, height: int, facing_right: bool, asset_manager):
         super().__init__(x, y, width, height, asset_manager)
+        self.reset(x, y, facing_right)
+        
+    def reset(self, x: float, y: float, facing_right: bool):
+        """(Re)initialize projectile state - used on creation and by ProjectilePool"""
+        self.x = x
+        self.y = y
+        self.vel_y = 0.0
+        self.on_ground = False
+        self.animation_timer = 0.0
+        self.animation_frame = 0
         
         # Projectile properties
         self.damage = 10
@@ -36,7 +64,8 @@ class Projectile(Entity):
         direction = 1 if facing_right else -1
         self.vel_x = self.speed * direction
         
-    def update(self, dt: float, collision_rects: List[pygame.Rect]):
+    def update(self, dt: float, collision_rects: List[pygame.Rect],
+               collision_hash: Optional['SpatialHash'] = None):
         """Update projectile"""
         if not self.active:
             return
@@ -51,37 +80,78 @@ class Projectile(Entity):
             return
             
         # Check collision with world
-        projectile_rect = pygame.Rect(int(self.x) - 2, int(self.y) - 2, 4, 4)
-        for rect in collision_rects:
-            if projectile_rect.colliderect(rect):
-                self._on_hit_wall()
-                return
+        projectile_rect = self._scratch_rect
+        projectile_rect.x = int(self.x) - 2
+        projectile_rect.y = int(self.y) - 2
+        if collision_hash is not None:
+            # Only rects sharing a grid cell with the projectile can be hit
+            collision_rects = collision_hash.query(projectile_rect)
+        if projectile_rect.collidelist(collision_rects) != -1:
+            self._on_hit_wall()
+            return
             
-        # Check bounds (assume 60x20 tile map)
-        if (self.x < -100 or self.x > 60 * 32 + 100 or 
-            self.y < -100 or self.y > 20 * 32 + 100):
+        # Check bounds
+        if (self.x < Config.WORLD_X_MIN or self.x > Config.WORLD_X_MAX or 
+            self.y < Config.WORLD_Y_MIN or self.y > Config.WORLD_Y_MAX):
             self.active = False
             
+    def update_physics(self, dt: float):
+        """Projectile kinematics - projectiles never touch ground, so no friction"""
+        step = dt * 60  # Scale by 60 for frame-rate independence
+        if self.gravity_affected:
+            self.vel_y += Config.GRAVITY * step
+        self.x += self.vel_x * step
+        self.y += self.vel_y * step
+        
+        # Animation frame drives the rocket flame flicker
+        self.animation_timer += dt
+        if self.animation_timer >= self.animation_speed:
+            self.animation_frame = (self.animation_frame + 1) % 4
+            self.animation_timer = 0.0
+            
     def _on_hit_wall(self):
         """Called when projectile hits a wall"""
         self.active = False
         
+    def on_hit_target(self):
+        """Called when projectile hits an entity"""
+        self.active = False
+        
     def render(self, surface: pygame.Surface, camera_offset: tuple = (0, 0)):
         """Render projectile"""
         if not self.active:
             return
             
-        super().render(surface, camera_offset)
+        blits = []
+        self.collect_blits(blits, camera_offset)
+        surface.blits(blits, doreturn=False)
+        
+    def collect_blits(self, blits: list, camera_offset: tuple):
+        """Append this projectile's (sprite, position) pairs for a batched Surface.blits"""
+        sprite = self.get_current_sprite()
+        if not sprite:
+            return
+            
+        # Flip sprite if facing left (flipped copy is cached)
+        if not self.facing_right:
+            sprite = get_flipped_sprite(sprite)
+            
+        blits.append((sprite, (int(self.x - camera_offset[0]), int(self.y - camera_offset[1]))))
 
 class Bullet(Projectile):
     """Standard bullet projectile"""
     
+    __slots__ = ()
+    
     def __init__(self, x: float, y: float, facing_right: bool, asset_manager):
         super().__init__(x, y, 4, 2, facing_right, asset_manager)
+        self.set_sprite("bullet")
         
+    def reset(self, x: float, y: float, facing_right: bool):
+        """Reset bullet state"""
+        super().reset(x, y, facing_right)
         self.damage = Config.PISTOL_DAMAGE
         self.speed = 600
-        self.set_sprite("bullet")
         
     def _on_hit_wall(self):
         """Bullet disappears on wall hit"""
@@ -91,14 +161,23 @@ class Bullet(Projectile):
 class Rocket(Projectile):
     """Rocket projectile with explosion"""
     
+    __slots__ = ('explosion_radius',)
+    
+    # Pre-rendered flame trail frames (yellow, red), built on first render
+    _flame_sprites: Optional[Tuple[pygame.Surface, pygame.Surface]] = None
+    
     def __init__(self, x: float, y: float, facing_right: bool, asset_manager):
         super().__init__(x, y, 8, 4, facing_right, asset_manager)
         
-        self.damage = Config.ROCKET_DAMAGE
-        self.speed = 300
         self.explosion_radius = 64
         self.set_sprite("rocket")
         
+    def reset(self, x: float, y: float, facing_right: bool):
+        """Reset rocket state"""
+        super().reset(x, y, facing_right)
+        self.damage = Config.ROCKET_DAMAGE
+        self.speed = 300
+        
         # Rocket has slight gravity
         self.gravity_affected = True
         
@@ -106,6 +185,10 @@ class Rocket(Projectile):
         """Rocket explodes on wall hit"""
         self._explode()
         
+    def on_hit_target(self):
+        """Rocket explodes on direct hit"""
+        self._explode()
+        
     def _explode(self):
         """Create explosion effect"""
         self.active = False
@@ -115,19 +198,17 @@ class Rocket(Projectile):
         
         # TODO: Create explosion effect and damage nearby entities
         
-    def update(self, dt: float, level: 'Level'):
+    def update(self, dt: float, collision_rects: List[pygame.Rect],
+               collision_hash: Optional['SpatialHash'] = None):
         """Update rocket with trail effect"""
-        super().update(dt, level)
+        super().update(dt, collision_rects, collision_hash)
         
         # Add some smoke trail effect here if needed
         
-    def render(self, surface: pygame.Surface, camera_offset: tuple = (0, 0)):
-        """Render rocket with flame trail"""
-        if not self.active:
-            return
-            
+    def collect_blits(self, blits: list, camera_offset: tuple):
+        """Add rocket sprite and flame trail"""
         # Render main rocket
-        super().render(surface, camera_offset)
+        super().collect_blits(blits, camera_offset)
         
         # Render flame trail
         screen_x = int(self.x - camera_offset[0])
@@ -137,25 +218,47 @@ class Rocket(Projectile):
         trail_length = 16
         trail_x = screen_x - (trail_length if self.facing_right else -trail_length)
         
-        flame_color = Config.YELLOW if self.animation_frame % 2 == 0 else Config.RED
-        pygame.draw.circle(surface, flame_color, (trail_x, screen_y + self.height // 2), 3)
+        flame = self._get_flame_sprites()[self.animation_frame % 2]
+        blits.append((flame, (trail_x - 3, screen_y + self.height // 2 - 3)))
+        
+    @classmethod
+    def _get_flame_sprites(cls) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Get the cached flame frames, drawing them once on first use"""
+        if cls._flame_sprites is None:
+            frames = []
+            for color in (Config.YELLOW, Config.RED):
+                flame = pygame.Surface((7, 7), pygame.SRCALPHA)
+                pygame.draw.circle(flame, color, (3, 3), 3)
+                frames.append(flame.convert_alpha())
+            cls._flame_sprites = (frames[0], frames[1])
+        return cls._flame_sprites
 
 class EnemyBullet(Projectile):
     """Enemy bullet projectile"""
     
+    __slots__ = ()
+    
+    # Pre-rendered red bullet, built on first render
+    _sprite: Optional[pygame.Surface] = None
+    
     def __init__(self, x: float, y: float, facing_right: bool, asset_manager):
         super().__init__(x, y, 3, 2, facing_right, asset_manager)
         
+    def reset(self, x: float, y: float, facing_right: bool):
+        """Reset enemy bullet state"""
+        super().reset(x, y, facing_right)
         self.damage = 15
         self.speed = 400
         
-    def render(self, surface: pygame.Surface, camera_offset: tuple = (0, 0)):
-        """Render enemy bullet with different color"""
-        if not self.active:
-            return
-            
+    def collect_blits(self, blits: list, camera_offset: tuple):
+        """Add enemy bullet with different color"""
         screen_x = int(self.x - camera_offset[0])
         screen_y = int(self.y - camera_offset[1])
         
         # Draw red bullet for enemies
-        pygame.draw.rect(surface, Config.RED, (screen_x, screen_y, self.width, self.height))
\ No newline at end of file
+        sprite = EnemyBullet._sprite
+        if sprite is None:
+            sprite = pygame.Surface((self.width, self.height)).convert()
+            sprite.fill(Config.RED)
+            EnemyBullet._sprite = sprite
+        blits.append((sprite, (screen_x, screen_y)))
\ No newline at end of file
@@ -19,9 +19,19 @@ class WeaponType(Enum):
     SHOTGUN = "shotgun"
     ROCKET_LAUNCHER = "rocket_launcher"
 
+# Weapon stats: (name, damage, fire rate in seconds between shots, max ammo, sprite name)
+_WEAPON_STATS = {
+    WeaponType.PISTOL: ("Pistol", Config.PISTOL_DAMAGE, 0.3, 200, "pistol"),
+    WeaponType.SHOTGUN: ("Shotgun", Config.SHOTGUN_DAMAGE, 0.8, 50, "shotgun"),
+    WeaponType.ROCKET_LAUNCHER: ("Rocket Launcher", Config.ROCKET_DAMAGE, 1.5, 20, "rocket_launcher"),
+}
+
 class Weapon:
     """Weapon class with ammo and firing mechanics"""
     
+    __slots__ = ('weapon_type', 'asset_manager', 'name', 'damage', 'fire_rate',
+                 'max_ammo', 'sprite_name', 'ammo', 'next_fire_time')
+    
     def __init__(self, weapon_type: WeaponType, asset_manager: AssetManager):
         self.weapon_type = weapon_type
         self.asset_manager = asset_manager
@@ -31,39 +41,19 @@ class Weapon:
         
         # Current state
         self.ammo = 0
-        self.cooldown_timer = 0.0
+        self.next_fire_time = 0  # pygame ticks (ms) when the weapon can fire again
         
     def _init_weapon_stats(self):
         """Initialize weapon stats based on type"""
-        if self.weapon_type == WeaponType.PISTOL:
-            self.name = "Pistol"
-            self.damage = Config.PISTOL_DAMAGE
-            self.fire_rate = 0.3  # Seconds between shots
-            self.max_ammo = 200
-            self.sprite_name = "pistol"
-            
-        elif self.weapon_type == WeaponType.SHOTGUN:
-            self.name = "Shotgun"
-            self.damage = Config.SHOTGUN_DAMAGE
-            self.fire_rate = 0.8
-            self.max_ammo = 50
-            self.sprite_name = "shotgun"
-            
-        elif self.weapon_type == WeaponType.ROCKET_LAUNCHER:
-            self.name = "Rocket Launcher"
-            self.damage = Config.ROCKET_DAMAGE
-            self.fire_rate = 1.5
-            self.max_ammo = 20
-            self.sprite_name = "rocket_launcher"
-            
-    def update(self, dt: float):
-        """Update weapon state"""
-        if self.cooldown_timer > 0:
-            self.cooldown_timer -= dt
+        self.name, self.damage, self.fire_rate, self.max_ammo, self.sprite_name = _WEAPON_STATS[self.weapon_type]
             
     def can_shoot(self) -> bool:
         """Check if weapon can shoot"""
-        return self.ammo > 0 and self.cooldown_timer <= 0
+        return self.ammo > 0 and pygame.time.get_ticks() >= self.next_fire_time
+        
+    def get_cooldown_remaining(self) -> float:
+        """Get seconds left before the weapon can fire again"""
+        return max(0, self.next_fire_time - pygame.time.get_ticks()) / 1000.0
         
     def shoot(self) -> bool:
         """Attempt to shoot weapon"""
@@ -71,7 +61,7 @@ class Weapon:
             return False
             
         self.ammo -= 1
-        self.cooldown_timer = self.fire_rate
+        self.next_fire_time = pygame.time.get_ticks() + int(self.fire_rate * 1000)
         
         # Play weapon sound
         sound_name = f"{self.weapon_type.value}_shoot"
@@ -31,6 +31,12 @@ class GameEngine:
         # Create display
         self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
         pygame.display.set_caption(Config.TITLE)
+        self._dirty_area_limit = Config.SCREEN_WIDTH * Config.SCREEN_HEIGHT * Config.DIRTY_RECT_MAX_FRACTION
+        
+        # Only queue the events the game reacts to, SDL drops the rest
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                                  pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION])
         
         # Game systems
         self.clock = pygame.time.Clock()
@@ -42,63 +48,79 @@ class GameEngine:
         self.asset_manager.load_sprite('enemy', 'assets/sprites/nemico1.png')
         
         self.input_manager = InputManager()
+        self.events = []  # Polled events not yet dispatched to a state
         
         # Game state management
         self.current_state: Optional[GameState] = None
-        self.states = {
-            GameStateType.MENU: MenuState(self),
-            GameStateType.PLAYING: PlayingState(self),
-            GameStateType.PAUSED: PauseState(self),
-            GameStateType.GAME_OVER: GameOverState(self)
-        }
+        self.states = [
+            MenuState(self),       # GameStateType.MENU
+            PlayingState(self),    # GameStateType.PLAYING
+            PauseState(self),      # GameStateType.PAUSED
+            GameOverState(self)    # GameStateType.GAME_OVER
+        ]
         
-        # Start with menu state
+        # Start with menu state (current_state is never None afterwards)
         self.change_state(GameStateType.MENU)
         
         # Game control
         self.running = True
         self.dt = 0
+        self.accumulator = 0.0  # Frame time not yet simulated
         
     def run(self):
         """Main game loop"""
         while self.running:
-            # Calculate delta time
-            self.dt = self.clock.tick(Config.FPS) / 1000.0
+            # Calculate delta time (clamped so a long stall doesn't trigger a burst of steps)
+            self.dt = min(self.clock.tick(Config.FPS) / 1000.0, Config.MAX_FRAME_TIME)
+            self.accumulator += self.dt
             
             # Handle events
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
+            if pygame.event.peek(pygame.QUIT):
+                self.running = False
+            self.events.extend(pygame.event.get())
                     
             # Update input
-            self.input_manager.update(events)
+            self.input_manager.update(self.events)
             
-            # Update current state
-            if self.current_state:
-                self.current_state.update(self.dt)
+            # Update current state in fixed time steps - with whole-ms ticks
+            # (16, 17, 17...) an exact comparison alternates 0 and 2 steps per frame
+            while self.accumulator >= Config.FIXED_DT - Config.FIXED_DT_TOLERANCE:
+                for event in self.events:
+                    self.current_state.handle_event(event)
+                self.current_state.update(Config.FIXED_DT)
+                self.accumulator -= Config.FIXED_DT
+                
+                # Events and key presses are only seen by the first step
+                self.input_manager.end_step()
+                self.events.clear()
                 
-            # Render
-            self.screen.fill(Config.BLACK)
-            if self.current_state:
+            # Render - states can report that only part of the screen changed
+            dirty_rects = self.current_state.get_dirty_rects()
+            if dirty_rects is None:
+                self.screen.fill(Config.BLACK)
+                self.current_state.render(self.screen)
+                pygame.display.flip()
+            elif dirty_rects:
                 self.current_state.render(self.screen)
                 
-            # Update display
-            pygame.display.flip()
+                # Many small rects cost more to push than one full flip
+                if sum(rect.w * rect.h for rect in dirty_rects) > self._dirty_area_limit:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(dirty_rects)
             
         # Cleanup
         self.cleanup()
         
     def change_state(self, state_type: GameStateType):
         """Change to a different game state"""
-        if state_type in self.states:
-            # Exit current state
-            if self.current_state:
-                self.current_state.exit()
-                
-            # Enter new state
-            self.current_state = self.states[state_type]
-            self.current_state.enter()
+        # Exit current state
+        if self.current_state:
+            self.current_state.exit()
+            
+        # Enter new state
+        self.current_state = self.states[state_type]
+        self.current_state.enter()
             
     def quit_game(self):
         """Quit the game"""
@@ -118,4 +140,4 @@ class GameEngine:
         
     def get_input_manager(self) -> InputManager:
         """Get input manager"""
-        return self.input_manager
\ No newline at end of file
+        return self.input_manager
@@ -9,18 +9,19 @@ PIETRO's state management brings order to chaos!
 
 import pygame
 from abc import ABC, abstractmethod
-from enum import Enum
-from typing import TYPE_CHECKING
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+from ..core.config import Config
 
 if TYPE_CHECKING:
     from .game_engine import GameEngine
 
-class GameStateType(Enum):
-    """Enumeration of game state types"""
-    MENU = "menu"
-    PLAYING = "playing"
-    PAUSED = "paused"
-    GAME_OVER = "game_over"
+class GameStateType(IntEnum):
+    """Enumeration of game state types (values index GameEngine.states)"""
+    MENU = 0
+    PLAYING = 1
+    PAUSED = 2
+    GAME_OVER = 3
 
 class GameState(ABC):
     """Abstract base class for game states"""
@@ -29,6 +30,19 @@ class GameState(ABC):
         self.game_engine = game_engine
         self.active = False
         
+        # Rendered text, keyed by (text, font, color)
+        self._text_cache: Dict[Tuple[str, pygame.font.Font, Tuple[int, int, int]], pygame.Surface] = {}
+        
+        # Rendered text with its placed rect, keyed by (text, font, color, center)
+        self._text_blits: Dict[tuple, Tuple[pygame.Surface, pygame.Rect]] = {}
+        
+        # Rect covering every variant of each menu row, filled by _prerender_menu_items
+        self._menu_item_areas: List[pygame.Rect] = []
+        
+        # Redraw tracking - states that never clear _redraw_all repaint every frame
+        self._redraw_all = True
+        self._dirty_items: Set[int] = set()
+        
     @abstractmethod
     def enter(self):
         """Called when entering this state"""
@@ -49,6 +63,91 @@ class GameState(ABC):
         """Render state graphics"""
         pass
         
+    def _get_text_surface(self, text: str, font: pygame.font.Font,
+                          color: Tuple[int, int, int]) -> pygame.Surface:
+        """Get rendered text, rendering each (text, font, color) only once"""
+        key = (text, font, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Match the display format so blits take the fast path
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+        
+    def _get_text_blit(self, text: str, font: pygame.font.Font, color: Tuple[int, int, int],
+                       center: Tuple[int, int]) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Get rendered text and its rect centered on center, both computed once
+        
+        The returned rect is shared, callers must not modify it.
+        """
+        key = (text, font, color, center)
+        blit = self._text_blits.get(key)
+        if blit is None:
+            surface = self._get_text_surface(text, font, color)
+            blit = (surface, surface.get_rect(center=center))
+            self._text_blits[key] = blit
+        return blit
+        
+    def _prerender_menu_items(self, menu_items: list, font: pygame.font.Font):
+        """Render and place every cursor/selection variant of the menu items up front"""
+        self._menu_item_areas = []
+        for index, item in enumerate(menu_items):
+            center = self._get_menu_item_center(index)
+            area = None
+            for text in ("> " + item + " <", "  " + item + "  "):
+                for color in (Config.DOS_GREEN, Config.GRAY):
+                    rect = self._get_text_blit(text, font, color, center)[1]
+                    area = rect if area is None else area.union(rect)
+            self._menu_item_areas.append(area)
+        
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """Get the screen areas that changed since the last render
+        
+        Returns:
+            None if the whole screen must be redrawn, otherwise the changed
+            rects (an empty list means rendering can be skipped)
+        """
+        if self._redraw_all:
+            return None
+        return [self._get_menu_item_area(index) for index in self._dirty_items]
+        
+    def _mark_menu_item_dirty(self, index: int):
+        """Flag a menu row for redraw"""
+        self._dirty_items.add(index)
+        
+    def _get_menu_item_center(self, index: int) -> Tuple[int, int]:
+        """Get screen center of a menu row"""
+        return (Config.SCREEN_WIDTH // 2, self.menu_start_y + index * self.menu_spacing)
+        
+    def _get_menu_item_blit(self, index: int) -> Tuple[pygame.Surface, pygame.Rect]:
+        """Get surface and rect of a menu item in its current selection/cursor state"""
+        item = self.menu_items[index]
+        selected = index == self.selected_item
+        color = Config.DOS_GREEN if selected else Config.GRAY
+        
+        # Add cursor for selected item
+        if selected and self.show_cursor:
+            cursor_text = "> " + item + " <"
+        else:
+            cursor_text = "  " + item + "  "
+            
+        return self._get_text_blit(cursor_text, self.font_medium, color, self._get_menu_item_center(index))
+        
+    def _get_menu_item_area(self, index: int) -> pygame.Rect:
+        """Get the rect covering every variant of a menu row"""
+        return self._menu_item_areas[index]
+        
+    def _render_dirty_menu_items(self, screen: pygame.Surface):
+        """Redraw only the menu rows flagged dirty"""
+        for index in self._dirty_items:
+            self._render_menu_background(screen, self._get_menu_item_area(index))
+        screen.blits([self._get_menu_item_blit(index) for index in self._dirty_items], doreturn=False)
+        self._dirty_items.clear()
+        
+    def _render_menu_background(self, screen: pygame.Surface, area: pygame.Rect):
+        """Restore the background behind a menu row (menu states override)"""
+        screen.fill(Config.BLACK, area)
+        
     def handle_event(self, event: pygame.event.Event):
         """Handle pygame events (optional override)"""
         pass
\ No newline at end of file
@@ -7,13 +7,24 @@ Developed by Team PIETRO
 PIETRO's save system ensures no progress is ever lost!
 """
 
-import json
 import os
-import pickle
+import re
+import shutil
 import time
-from typing import Dict, Any, Optional, List
+import zlib
+import numpy as np
+import orjson
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 from ...core.config import Config
+from ..world.level import TILE_TYPES, get_tile_type_id
+
+# orjson options - non-string dict keys are stringified like the stdlib json did
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Start of a file that already is a full save (version is always the first key)
+_SAVE_ENVELOPE_HEAD = re.compile(rb'\s*\{\s*"version"\s*:')
 
 class SaveManager:
     """Manages game save and load operations"""
@@ -23,11 +34,26 @@ class SaveManager:
         self.save_slots = 3  # Number of save slots
         self.current_save_data = None
         
+        # Save slot headers, keyed by slot -> (save file mtime, info)
+        self._save_info_cache: Dict[int, tuple] = {}
+        
+        # Disk writes run on a single background thread, in submission order;
+        # a failed write surfaces through its Future
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._pending_writes: List[Future] = []
+        
         # Ensure save directory exists
         os.makedirs(self.save_directory, exist_ok=True)
         
     def save_game(self, slot: int, game_state: Dict[str, Any]) -> bool:
-        """Save game to specified slot"""
+        """Save game to specified slot
+        
+        The files are written in the background; a write failure is reported
+        by wait_for_writes() or, at the latest, by the next save_game call.
+        """
+        # Report earlier background writes that failed since the last check
+        previous_writes_ok = self._collect_finished_writes()
+        
         try:
             # Prepare save data
             save_data = {
@@ -37,18 +63,26 @@ class SaveManager:
                 'game_state': game_state
             }
             
+            # Serialize here, so later changes to game_state don't leak into the save
+            files = []
+            
             # Save to JSON file
             save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
-            with open(save_file, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            files.append((save_file, orjson.dumps(save_data, option=_JSON_OPTIONS | orjson.OPT_INDENT_2)))
                 
-            # Also save as binary backup
+            # Also save as compressed backup
             backup_file = os.path.join(self.save_directory, f"save_slot_{slot}.bak")
-            with open(backup_file, 'wb') as f:
-                pickle.dump(save_data, f)
+            files.append((backup_file, zlib.compress(orjson.dumps(save_data, option=_JSON_OPTIONS))))
+            
+            # Header sidecar, so listing slots doesn't parse whole saves
+            meta_file = os.path.join(self.save_directory, f"save_slot_{slot}.meta.json")
+            files.append((meta_file, orjson.dumps(self._build_save_info(slot, save_data))))
+            
+            # Write on the I/O thread so auto-saves don't stall the game loop
+            self._pending_writes.append(self._io_pool.submit(self._write_files, files))
                 
             self.current_save_data = save_data
-            return True
+            return previous_writes_ok
             
         except Exception as e:
             print(f"Error saving game: {e}")
@@ -56,6 +90,7 @@ class SaveManager:
             
     def load_game(self, slot: int) -> Optional[Dict[str, Any]]:
         """Load game from specified slot"""
+        self.wait_for_writes()
         try:
             save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
             
@@ -64,13 +99,13 @@ class SaveManager:
                 backup_file = os.path.join(self.save_directory, f"save_slot_{slot}.bak")
                 if os.path.exists(backup_file):
                     with open(backup_file, 'rb') as f:
-                        save_data = pickle.load(f)
+                        save_data = orjson.loads(zlib.decompress(f.read()))
                         self.current_save_data = save_data
                         return save_data['game_state']
                 return None
                 
-            with open(save_file, 'r') as f:
-                save_data = json.load(f)
+            with open(save_file, 'rb') as f:
+                save_data = orjson.loads(f.read())
                 
             self.current_save_data = save_data
             return save_data['game_state']
@@ -81,54 +116,158 @@ class SaveManager:
             
     def get_save_info(self, slot: int) -> Optional[Dict[str, Any]]:
         """Get save slot information without loading full data"""
+        self.wait_for_writes()
         try:
-            save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
-            
-            if not os.path.exists(save_file):
-                return None
-                
-            with open(save_file, 'r') as f:
-                save_data = json.load(f)
-                
-            # Return basic info
-            return {
-                'slot': slot,
-                'timestamp': save_data.get('timestamp'),
-                'version': save_data.get('version'),
-                'level': save_data['game_state'].get('current_level', 1),
-                'player_health': save_data['game_state'].get('player', {}).get('health', 100),
-                'score': save_data['game_state'].get('player', {}).get('score', 0),
-                'playtime': save_data['game_state'].get('playtime', 0)
-            }
+            save_files = {}
+            for name in (f"save_slot_{slot}.json", f"save_slot_{slot}.meta.json"):
+                try:
+                    save_files[name] = os.stat(os.path.join(self.save_directory, name))
+                except FileNotFoundError:
+                    pass
+                    
+            return self._read_save_info(slot, save_files)
             
         except Exception as e:
             print(f"Error getting save info: {e}")
             return None
             
+    def _read_save_info(self, slot: int, save_files: Dict[str, os.stat_result]) -> Optional[Dict[str, Any]]:
+        """Get slot info given the stats of the save files that exist
+        
+        Args:
+            slot: Save slot
+            save_files: File name -> stat result, as returned by _scan_save_files
+        """
+        save_stat = save_files.get(f"save_slot_{slot}.json")
+        if save_stat is None:
+            self._save_info_cache.pop(slot, None)
+            return None
+            
+        # Unchanged save file - reuse cached info
+        save_mtime = save_stat.st_mtime
+        cached = self._save_info_cache.get(slot)
+        if cached and cached[0] == save_mtime:
+            return cached[1]
+            
+        # Prefer the header sidecar, if it is not older than the save
+        meta_stat = save_files.get(f"save_slot_{slot}.meta.json")
+        if meta_stat is not None and meta_stat.st_mtime >= save_mtime:
+            meta_file = os.path.join(self.save_directory, f"save_slot_{slot}.meta.json")
+            with open(meta_file, 'rb') as f:
+                save_info = orjson.loads(f.read())
+        else:
+            save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
+            with open(save_file, 'rb') as f:
+                save_data = orjson.loads(f.read())
+            save_info = self._build_save_info(slot, save_data)
+            
+        self._save_info_cache[slot] = (save_mtime, save_info)
+        return save_info
+        
+    def _scan_save_files(self) -> Dict[str, os.stat_result]:
+        """Stat all save slot files with a single directory scan"""
+        save_files = {}
+        with os.scandir(self.save_directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('save_slot_') and entry.is_file():
+                    save_files[entry.name] = entry.stat()
+        return save_files
+        
+    def _build_save_info(self, slot: int, save_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract basic slot info from full save data"""
+        game_state = save_data['game_state']
+        return {
+            'slot': slot,
+            'timestamp': save_data.get('timestamp'),
+            'version': save_data.get('version'),
+            'level': game_state.get('current_level', 1),
+            'player_health': game_state.get('player', {}).get('health', 100),
+            'score': game_state.get('player', {}).get('score', 0),
+            'playtime': game_state.get('playtime', 0)
+        }
+            
     def delete_save(self, slot: int) -> bool:
         """Delete save from specified slot"""
+        self.wait_for_writes()
         try:
             save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
             backup_file = os.path.join(self.save_directory, f"save_slot_{slot}.bak")
+            meta_file = os.path.join(self.save_directory, f"save_slot_{slot}.meta.json")
             
-            if os.path.exists(save_file):
-                os.remove(save_file)
-                
-            if os.path.exists(backup_file):
-                os.remove(backup_file)
-                
+            for path in (save_file, backup_file, meta_file):
+                if os.path.exists(path):
+                    os.remove(path)
+                    
+            self._save_info_cache.pop(slot, None)
             return True
             
         except Exception as e:
             print(f"Error deleting save: {e}")
             return False
             
+    def wait_for_writes(self) -> bool:
+        """Block until queued save writes have reached the disk
+        
+        Returns:
+            False if any of them failed
+        """
+        pending_writes = self._pending_writes
+        self._pending_writes = []
+        return self._check_writes(pending_writes)
+        
+    def _collect_finished_writes(self) -> bool:
+        """Check the background writes that already finished, without blocking
+        
+        Returns:
+            False if any of them failed
+        """
+        finished = []
+        still_pending = []
+        for write in self._pending_writes:
+            (finished if write.done() else still_pending).append(write)
+        self._pending_writes = still_pending
+        return self._check_writes(finished)
+        
+    def _check_writes(self, writes: List[Future]) -> bool:
+        """Wait for writes and log the failed ones"""
+        ok = True
+        for write in writes:
+            error = write.exception()
+            if error is not None:
+                print(f"Error saving game: {error}")
+                ok = False
+        return ok
+        
+    def _write_files(self, files: List[Tuple[str, bytes]]):
+        """Write serialized save files (runs on the I/O thread, errors go to the Future)"""
+        for path, data in files:
+            self._write_atomic(path, data)
+            
+    def _write_atomic(self, path: str, data: bytes):
+        """Write data to a temporary file and move it over path"""
+        temp_path = path + ".tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+            
     def get_all_saves(self) -> List[Dict[str, Any]]:
         """Get information about all save slots"""
         saves = []
         
+        self.wait_for_writes()
+        try:
+            save_files = self._scan_save_files()
+        except OSError as e:
+            print(f"Error getting save info: {e}")
+            save_files = {}
+            
         for slot in range(1, self.save_slots + 1):
-            save_info = self.get_save_info(slot)
+            try:
+                save_info = self._read_save_info(slot, save_files)
+            except Exception as e:
+                print(f"Error getting save info: {e}")
+                save_info = None
+                
             if save_info:
                 saves.append(save_info)
             else:
@@ -174,7 +313,8 @@ class SaveManager:
             'level': {
                 'width': level.width,
                 'height': level.height,
-                'tiles': {},
+                'tiles': '',
+                'tile_palette': [],
                 'collectibles': [],
                 'secrets': level.secrets
             },
@@ -195,23 +335,27 @@ class SaveManager:
         for weapon in player.weapons:
             weapon_data = {
                 'type': weapon.weapon_type.name,
-                'current_ammo': weapon.current_ammo,
+                'current_ammo': weapon.ammo,
                 'max_ammo': weapon.max_ammo
             }
             game_state['player']['weapons'].append(weapon_data)
             
-        # Save level tiles (only non-default ones)
-        for (x, y), tile in level.tiles.items():
-            game_state['level']['tiles'][f"{x},{y}"] = {
-                'type': tile.tile_type,
-                'x': x,
-                'y': y
-            }
+        # Save level tiles as a flat grid of palette indices (0 = no tile),
+        # hex-encoded row by row (index = y * width + x)
+        palette = game_state['level']['tile_palette']
+        grid = level.tile_types.T
+        used_ids = np.unique(grid[grid != 0])
+        remap = np.zeros(256, dtype=np.uint8)
+        remap[used_ids] = np.arange(1, len(used_ids) + 1)
+        palette.extend(TILE_TYPES[tile_id] for tile_id in used_ids.tolist())
+        game_state['level']['tiles'] = remap[grid].tobytes().hex()
             
         # Save collectibles (only uncollected ones)
         for collectible in collectibles:
             if not collectible.get('collected', False):
-                game_state['level']['collectibles'].append(collectible)
+                # The cached rect is rebuilt from 'x'/'y' on load
+                game_state['level']['collectibles'].append(
+                    {key: value for key, value in collectible.items() if key != 'rect'})
                 
         # Save enemies
         for enemy in enemies:
@@ -270,21 +414,33 @@ class SaveManager:
             weapons_data = player_data.get('weapons', [])
             for i, weapon_data in enumerate(weapons_data):
                 if i < len(player.weapons):
-                    player.weapons[i].current_ammo = weapon_data['current_ammo']
+                    player.weapons[i].ammo = weapon_data['current_ammo']
+            player.notify_ammo_changed()
                     
             # Apply level state
             level_data = game_state['level']
             
             # Clear and rebuild tiles
-            level.tiles.clear()
-            tiles_data = level_data.get('tiles', {})
-            
-            for pos_str, tile_data in tiles_data.items():
-                x, y = map(int, pos_str.split(','))
-                level.set_tile(x, y, tile_data['type'])
+            level.clear_tiles()
+            tiles_data = level_data.get('tiles', '')
+            
+            if isinstance(tiles_data, str):
+                palette = level_data.get('tile_palette', [])
+                width = level_data.get('width', level.width)
+                grid = np.frombuffer(bytes.fromhex(tiles_data), dtype=np.uint8)
+                palette_ids = np.array([0] + [get_tile_type_id(t) for t in palette], dtype=np.uint8)
+                cells = np.flatnonzero(grid)
+                ys, xs = np.divmod(cells, width)
+                inside = (xs < level.width) & (ys < level.height)
+                level.tile_types[xs[inside], ys[inside]] = palette_ids[grid[cells[inside]]]
+            else:
+                # Older saves: {"x,y": {"type": ...}}
+                for pos_str, tile_data in tiles_data.items():
+                    x, y = map(int, pos_str.split(','))
+                    level.set_tile(x, y, tile_data['type'])
                 
             # Restore collectibles
-            level.collectibles = level_data.get('collectibles', [])
+            level.set_collectibles(level_data.get('collectibles', []))
             
             # Restore secrets
             level.secrets = level_data.get('secrets', [])
@@ -296,18 +452,21 @@ class SaveManager:
             enemies = []
             enemies_data = game_state.get('enemies', [])
             
+            # Enemies fire from the same pool as the player
+            projectile_pool = player.projectile_pool
+            
             for enemy_data in enemies_data:
                 enemy_type = enemy_data['type']
                 x, y = enemy_data['x'], enemy_data['y']
                 
                 if enemy_type == 'EnemyStandard':
-                    enemy = EnemyStandard(x, y, asset_manager)
+                    enemy = EnemyStandard(x, y, asset_manager, projectile_pool)
                 elif enemy_type == 'MutantEnemy':
-                    enemy = MutantEnemy(x, y, asset_manager)
+                    enemy = MutantEnemy(x, y, asset_manager, projectile_pool)
                 elif enemy_type == 'RobotEnemy':
-                    enemy = RobotEnemy(x, y, asset_manager)
+                    enemy = RobotEnemy(x, y, asset_manager, projectile_pool)
                 elif enemy_type == 'MercenaryEnemy':
-                    enemy = MercenaryEnemy(x, y, asset_manager)
+                    enemy = MercenaryEnemy(x, y, asset_manager, projectile_pool)
                 else:
                     continue
                     
@@ -348,8 +507,8 @@ class SaveManager:
             if not save_data:
                 return False
                 
-            with open(export_path, 'w') as f:
-                json.dump(save_data, f, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(orjson.dumps(save_data, option=_JSON_OPTIONS | orjson.OPT_INDENT_2))
                 
             return True
             
@@ -358,10 +517,32 @@ class SaveManager:
             return False
             
     def import_save(self, slot: int, import_path: str) -> bool:
-        """Import save from external file"""
+        """Import save from external file
+        
+        Accepts either an exported game state or a full save file. Full save
+        files are copied as they are instead of being wrapped a second time.
+        """
         try:
-            with open(import_path, 'r') as f:
-                save_data = json.load(f)
+            with open(import_path, 'rb') as f:
+                head = f.read(256)
+                
+            if _SAVE_ENVELOPE_HEAD.match(head):
+                self.wait_for_writes()
+                save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
+                temp_file = save_file + ".tmp"
+                shutil.copyfile(import_path, temp_file)
+                os.replace(temp_file, save_file)
+                
+                # Drop the slot's old backup and header, the header is rebuilt on demand
+                for ext in (".bak", ".meta.json"):
+                    old_file = os.path.join(self.save_directory, f"save_slot_{slot}{ext}")
+                    if os.path.exists(old_file):
+                        os.remove(old_file)
+                self._save_info_cache.pop(slot, None)
+                return True
+                
+            with open(import_path, 'rb') as f:
+                save_data = orjson.loads(f.read())
                 
             return self.save_game(slot, save_data)
             
@@ -378,19 +559,21 @@ class SaveManager:
             'newest_save': None
         }
         
+        self.wait_for_writes()
         try:
+            save_files = self._scan_save_files()
+            
             for slot in range(self.save_slots + 1):  # Include auto-save
-                save_file = os.path.join(self.save_directory, f"save_slot_{slot}.json")
+                file_stat = save_files.get(f"save_slot_{slot}.json")
                 
-                if os.path.exists(save_file):
+                if file_stat is not None:
                     stats['total_saves'] += 1
                     
                     # Get file size
-                    file_size = os.path.getsize(save_file)
-                    stats['total_size'] += file_size
+                    stats['total_size'] += file_stat.st_size
                     
                     # Get modification time
-                    mod_time = os.path.getmtime(save_file)
+                    mod_time = file_stat.st_mtime
                     
                     if stats['oldest_save'] is None or mod_time < stats['oldest_save']:
                         stats['oldest_save'] = mod_time
@@ -18,6 +18,14 @@ if TYPE_CHECKING:
 class GameOverState(GameState):
     """Game over state"""
     
+    # Menu item -> action
+    _ACTIONS = {
+        "TRY AGAIN": lambda self: self.game_engine.change_state(GameStateType.PLAYING),
+        "LOAD GAME": lambda self: self._load_game(),
+        "MAIN MENU": lambda self: self.game_engine.change_state(GameStateType.MENU),
+        "QUIT": lambda self: self.game_engine.quit_game()
+    }
+    
     def __init__(self, game_engine: 'GameEngine'):
         super().__init__(game_engine)
         self.font_large = None
@@ -34,20 +42,33 @@ class GameOverState(GameState):
         self.show_cursor = True
         self.fade_timer = 0
         self.fade_alpha = 0
+        self.menu_start_y = 320
+        self.menu_spacing = 40
+        
+        # Fade composition target and the finished (fully faded in) screen
+        self._fade_surface = None
+        self._final_image = None
         
     def enter(self):
         """Initialize game over state"""
         super().enter()
         
-        # Initialize fonts
-        try:
-            self.font_large = pygame.font.Font(None, 64)
-            self.font_medium = pygame.font.Font(None, 32)
-            self.font_small = pygame.font.Font(None, 24)
-        except:
-            self.font_large = pygame.font.SysFont('courier', 64)
-            self.font_medium = pygame.font.SysFont('courier', 32)
-            self.font_small = pygame.font.SysFont('courier', 24)
+        # Initialize fonts (once, rendered text is cached per font)
+        if self.font_large is None:
+            try:
+                self.font_large = pygame.font.Font(None, 64)
+                self.font_medium = pygame.font.Font(None, 32)
+                self.font_small = pygame.font.Font(None, 24)
+            except:
+                self.font_large = pygame.font.SysFont('courier', 64)
+                self.font_medium = pygame.font.SysFont('courier', 32)
+                self.font_small = pygame.font.SysFont('courier', 24)
+                
+        self._prerender_menu_items(self.menu_items, self.font_medium)
+        
+        # Fade surface is allocated once and reused by every fade frame
+        if self._fade_surface is None:
+            self._fade_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
             
         # Stop game music
         pygame.mixer.music.stop()
@@ -56,6 +77,10 @@ class GameOverState(GameState):
         self.fade_timer = 0
         self.fade_alpha = 0
         
+        # Full redraw on entry
+        self._redraw_all = True
+        self._dirty_items.clear()
+        
     def exit(self):
         """Cleanup game over state"""
         super().exit()
@@ -65,12 +90,15 @@ class GameOverState(GameState):
         if not self.active:
             return
             
-        # Update fade in effect
+        # Update fade in effect (the whole screen changes while fading)
+        previous_alpha = self.fade_alpha
         self.fade_timer += dt
         if self.fade_timer < 2.0:
             self.fade_alpha = min(255, int((self.fade_timer / 2.0) * 255))
         else:
             self.fade_alpha = 255
+        if self.fade_alpha != previous_alpha:
+            self._redraw_all = True
             
         # Only allow input after fade in
         if self.fade_alpha < 255:
@@ -80,10 +108,14 @@ class GameOverState(GameState):
         
         # Handle menu navigation
         if input_manager.is_key_just_pressed(pygame.K_UP) or input_manager.is_key_just_pressed(pygame.K_w):
+            self._mark_menu_item_dirty(self.selected_item)
             self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+            self._mark_menu_item_dirty(self.selected_item)
             
         if input_manager.is_key_just_pressed(pygame.K_DOWN) or input_manager.is_key_just_pressed(pygame.K_s):
+            self._mark_menu_item_dirty(self.selected_item)
             self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+            self._mark_menu_item_dirty(self.selected_item)
             
         # Handle menu selection
         if input_manager.is_key_just_pressed(pygame.K_RETURN) or input_manager.is_key_just_pressed(pygame.K_SPACE):
@@ -93,6 +125,7 @@ class GameOverState(GameState):
         self.blink_timer += dt
         if self.blink_timer >= 0.5:
             self.show_cursor = not self.show_cursor
+            self._mark_menu_item_dirty(self.selected_item)
             self.blink_timer = 0
             
     def render(self, screen: pygame.Surface):
@@ -100,68 +133,71 @@ class GameOverState(GameState):
         if not self.active:
             return
             
-        # Clear screen with dark red tint
-        screen.fill((32, 0, 0))
+        # Only the changed menu rows need redrawing
+        if not self._redraw_all:
+            self._render_dirty_menu_items(screen)
+            return
+            
+        # Once faded in the screen is static apart from the menu rows
+        if self.fade_alpha >= 255:
+            if self._final_image is None:
+                self._final_image = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)).convert()
+                self._compose(self._final_image)
+                
+            screen.blit(self._final_image, (0, 0))
+            screen.blits([self._get_menu_item_blit(i) for i in range(len(self.menu_items))],
+                         doreturn=False)
+        else:
+            # Clear screen with dark red tint
+            screen.fill((32, 0, 0))
+            
+            # Compose into the reused fade surface
+            self._compose(self._fade_surface)
+            self._fade_surface.set_alpha(self.fade_alpha)
+            
+            # Blit fade surface to screen
+            screen.blit(self._fade_surface, (0, 0))
+        
+        self._redraw_all = False
+        self._dirty_items.clear()
         
-        # Create fade surface
-        fade_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        fade_surface.set_alpha(self.fade_alpha)
+    def _compose(self, target: pygame.Surface):
+        """Draw the game over screen, without the menu rows, onto target"""
+        target.fill(Config.BLACK)
+        
+        # Text is collected and drawn with one blits call
+        blit_list = []
         
         # Draw game over title with dramatic effect
         title_text = "GAME OVER"
-        title_surface = self.font_large.render(title_text, True, Config.RED)
-        title_rect = title_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, 150))
         
         # Add glow effect to title
         for offset in [(2, 2), (-2, -2), (2, -2), (-2, 2)]:
-            glow_surface = self.font_large.render(title_text, True, Config.DARK_GRAY)
-            glow_rect = glow_surface.get_rect(center=(Config.SCREEN_WIDTH // 2 + offset[0], 150 + offset[1]))
-            fade_surface.blit(glow_surface, glow_rect)
+            blit_list.append(self._get_text_blit(title_text, self.font_large, Config.DARK_GRAY,
+                                                 (Config.SCREEN_WIDTH // 2 + offset[0], 150 + offset[1])))
             
-        fade_surface.blit(title_surface, title_rect)
+        blit_list.append(self._get_text_blit(title_text, self.font_large, Config.RED,
+                                             (Config.SCREEN_WIDTH // 2, 150)))
         
         # Draw motivational message
         if self.fade_alpha >= 255:
             message_text = "PIETRO believes you can do better!"
-            message_surface = self.font_medium.render(message_text, True, Config.DOS_AMBER)
-            message_rect = message_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, 220))
-            fade_surface.blit(message_surface, message_rect)
+            blit_list.append(self._get_text_blit(message_text, self.font_medium, Config.DOS_AMBER,
+                                                 (Config.SCREEN_WIDTH // 2, 220)))
             
-            # Draw menu items
-            menu_start_y = 320
-            for i, item in enumerate(self.menu_items):
-                color = Config.DOS_GREEN if i == self.selected_item else Config.GRAY
-                
-                # Add cursor for selected item
-                if i == self.selected_item and self.show_cursor:
-                    cursor_text = "> " + item + " <"
-                else:
-                    cursor_text = "  " + item + "  "
-                    
-                item_surface = self.font_medium.render(cursor_text, True, color)
-                item_rect = item_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, menu_start_y + i * 40))
-                fade_surface.blit(item_surface, item_rect)
-                
             # Draw controls hint
             controls_text = "ARROW KEYS to navigate, ENTER to select"
-            controls_surface = self.font_small.render(controls_text, True, Config.DARK_GRAY)
-            controls_rect = controls_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
-            fade_surface.blit(controls_surface, controls_rect)
+            blit_list.append(self._get_text_blit(controls_text, self.font_small, Config.DARK_GRAY,
+                                                 (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30)))
         
-        # Blit fade surface to screen
-        screen.blit(fade_surface, (0, 0))
+        target.blits(blit_list, doreturn=False)
         
     def _handle_menu_selection(self):
         """Handle game over menu item selection"""
-        selected = self.menu_items[self.selected_item]
-        
-        if selected == "TRY AGAIN":
-            self.game_engine.change_state(GameStateType.PLAYING)
-        elif selected == "LOAD GAME":
-            # TODO: Implement load game functionality
-            print("Load game not implemented yet")
-            self.game_engine.change_state(GameStateType.PLAYING)
-        elif selected == "MAIN MENU":
-            self.game_engine.change_state(GameStateType.MENU)
-        elif selected == "QUIT":
-            self.game_engine.quit_game()
\ No newline at end of file
+        self._ACTIONS[self.menu_items[self.selected_item]](self)
+        
+    def _load_game(self):
+        """Load a saved game"""
+        # TODO: Implement load game functionality
+        print("Load game not implemented yet")
+        self.game_engine.change_state(GameStateType.PLAYING)
\ No newline at end of file
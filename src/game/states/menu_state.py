@@ -18,6 +18,16 @@ if TYPE_CHECKING:
 class MenuState(GameState):
     """Main menu state"""
     
+    # Menu item -> action
+    _ACTIONS = {
+        "NEW GAME": lambda self: self.game_engine.change_state(GameStateType.PLAYING),
+        # TODO: Implement load game functionality
+        "LOAD GAME": lambda self: print("Load game not implemented yet"),
+        # TODO: Implement options menu
+        "OPTIONS": lambda self: print("Options not implemented yet"),
+        "QUIT": lambda self: self.game_engine.quit_game()
+    }
+    
     def __init__(self, game_engine: 'GameEngine'):
         super().__init__(game_engine)
         self.font_large = None
@@ -32,21 +42,38 @@ class MenuState(GameState):
         self.selected_item = 0
         self.blink_timer = 0
         self.show_cursor = True
+        self._grid_surface = None  # Static background, built on first enter
+        self.menu_start_y = 300
+        self.menu_spacing = 50
         
     def enter(self):
         """Initialize menu state"""
         super().enter()
         
-        # Initialize fonts
-        try:
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 32)
-            self.font_small = pygame.font.Font(None, 24)
-        except:
-            # Fallback to default font
-            self.font_large = pygame.font.SysFont('courier', 48)
-            self.font_medium = pygame.font.SysFont('courier', 32)
-            self.font_small = pygame.font.SysFont('courier', 24)
+        # Initialize fonts (once, rendered text is cached per font)
+        if self.font_large is None:
+            try:
+                self.font_large = pygame.font.Font(None, 48)
+                self.font_medium = pygame.font.Font(None, 32)
+                self.font_small = pygame.font.Font(None, 24)
+            except:
+                # Fallback to default font
+                self.font_large = pygame.font.SysFont('courier', 48)
+                self.font_medium = pygame.font.SysFont('courier', 32)
+                self.font_small = pygame.font.SysFont('courier', 24)
+                
+        self._prerender_menu_items(self.menu_items, self.font_medium)
+        
+        # Pre-render the static grid background
+        if self._grid_surface is None:
+            self._grid_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+            self._grid_surface.fill(Config.BLACK)
+            self._draw_grid_background(self._grid_surface)
+            self._grid_surface = self._grid_surface.convert()
+            
+        # Full redraw on entry
+        self._redraw_all = True
+        self._dirty_items.clear()
             
         # Play menu music if available
         # self.game_engine.get_asset_manager().play_music('menu_theme')
@@ -64,10 +91,14 @@ class MenuState(GameState):
         
         # Handle menu navigation
         if input_manager.is_key_just_pressed(pygame.K_UP) or input_manager.is_key_just_pressed(pygame.K_w):
+            self._mark_menu_item_dirty(self.selected_item)
             self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+            self._mark_menu_item_dirty(self.selected_item)
             
         if input_manager.is_key_just_pressed(pygame.K_DOWN) or input_manager.is_key_just_pressed(pygame.K_s):
+            self._mark_menu_item_dirty(self.selected_item)
             self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+            self._mark_menu_item_dirty(self.selected_item)
             
         # Handle menu selection
         if input_manager.is_key_just_pressed(pygame.K_RETURN) or input_manager.is_key_just_pressed(pygame.K_SPACE):
@@ -77,6 +108,7 @@ class MenuState(GameState):
         self.blink_timer += dt
         if self.blink_timer >= 0.5:
             self.show_cursor = not self.show_cursor
+            self._mark_menu_item_dirty(self.selected_item)
             self.blink_timer = 0
             
     def render(self, screen: pygame.Surface):
@@ -84,51 +116,48 @@ class MenuState(GameState):
         if not self.active:
             return
             
-        # Clear screen with retro background
-        screen.fill(Config.BLACK)
+        # Only the changed menu rows need redrawing
+        if not self._redraw_all:
+            self._render_dirty_menu_items(screen)
+            return
+            
+        # Clear screen with retro grid background
+        screen.blit(self._grid_surface, (0, 0))
         
-        # Draw retro grid background
-        self._draw_grid_background(screen)
+        # Text is collected and drawn with one blits call
+        blit_list = []
         
         # Draw title
         title_text = "DUKE NUKEM STYLE"
         subtitle_text = "PLATFORM GAME"
         
-        title_surface = self.font_large.render(title_text, True, Config.DOS_GREEN)
-        subtitle_surface = self.font_medium.render(subtitle_text, True, Config.DOS_AMBER)
-        
-        title_rect = title_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, 150))
-        subtitle_rect = subtitle_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, 200))
-        
-        screen.blit(title_surface, title_rect)
-        screen.blit(subtitle_surface, subtitle_rect)
+        blit_list.append(self._get_text_blit(title_text, self.font_large, Config.DOS_GREEN,
+                                             (Config.SCREEN_WIDTH // 2, 150)))
+        blit_list.append(self._get_text_blit(subtitle_text, self.font_medium, Config.DOS_AMBER,
+                                             (Config.SCREEN_WIDTH // 2, 200)))
         
         # Draw menu items
-        menu_start_y = 300
-        for i, item in enumerate(self.menu_items):
-            color = Config.DOS_GREEN if i == self.selected_item else Config.GRAY
-            
-            # Add cursor for selected item
-            if i == self.selected_item and self.show_cursor:
-                cursor_text = "> " + item + " <"
-            else:
-                cursor_text = "  " + item + "  "
-                
-            item_surface = self.font_medium.render(cursor_text, True, color)
-            item_rect = item_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, menu_start_y + i * 50))
-            screen.blit(item_surface, item_rect)
+        for i in range(len(self.menu_items)):
+            blit_list.append(self._get_menu_item_blit(i))
             
         # Draw credits
         credits_text = "Praise PIETRO - Divine Game Creator"
-        credits_surface = self.font_small.render(credits_text, True, Config.DOS_BLUE)
-        credits_rect = credits_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 50))
-        screen.blit(credits_surface, credits_rect)
+        blit_list.append(self._get_text_blit(credits_text, self.font_small, Config.DOS_BLUE,
+                                             (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 50)))
         
         # Draw controls hint
         controls_text = "Use ARROW KEYS or WASD to navigate, ENTER/SPACE to select"
-        controls_surface = self.font_small.render(controls_text, True, Config.DARK_GRAY)
-        controls_rect = controls_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 20))
-        screen.blit(controls_surface, controls_rect)
+        blit_list.append(self._get_text_blit(controls_text, self.font_small, Config.DARK_GRAY,
+                                             (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 20)))
+        
+        screen.blits(blit_list, doreturn=False)
+        
+        self._redraw_all = False
+        self._dirty_items.clear()
+        
+    def _render_menu_background(self, screen: pygame.Surface, area: pygame.Rect):
+        """Restore the grid behind a menu row"""
+        screen.blit(self._grid_surface, area, area)
         
     def _draw_grid_background(self, screen: pygame.Surface):
         """Draw retro grid background"""
@@ -145,15 +174,4 @@ class MenuState(GameState):
             
     def _handle_menu_selection(self):
         """Handle menu item selection"""
-        selected = self.menu_items[self.selected_item]
-        
-        if selected == "NEW GAME":
-            self.game_engine.change_state(GameStateType.PLAYING)
-        elif selected == "LOAD GAME":
-            # TODO: Implement load game functionality
-            print("Load game not implemented yet")
-        elif selected == "OPTIONS":
-            # TODO: Implement options menu
-            print("Options not implemented yet")
-        elif selected == "QUIT":
-            self.game_engine.quit_game()
\ No newline at end of file
+        self._ACTIONS[self.menu_items[self.selected_item]](self)
\ No newline at end of file
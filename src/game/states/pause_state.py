@@ -18,10 +18,22 @@ if TYPE_CHECKING:
 class PauseState(GameState):
     """Pause menu state"""
     
+    # Menu item -> action
+    _ACTIONS = {
+        "RESUME": lambda self: self.game_engine.change_state(GameStateType.PLAYING),
+        # TODO: Implement save game functionality
+        "SAVE GAME": lambda self: print("Save game not implemented yet"),
+        # TODO: Implement load game functionality
+        "LOAD GAME": lambda self: print("Load game not implemented yet"),
+        "MAIN MENU": lambda self: self.game_engine.change_state(GameStateType.MENU),
+        "QUIT": lambda self: self.game_engine.quit_game()
+    }
+    
     def __init__(self, game_engine: 'GameEngine'):
         super().__init__(game_engine)
         self.font_large = None
         self.font_medium = None
+        self.font_tiny = None
         self.menu_items = [
             "RESUME",
             "SAVE GAME",
@@ -32,18 +44,37 @@ class PauseState(GameState):
         self.selected_item = 0
         self.blink_timer = 0
         self.show_cursor = True
+        self._overlay = None  # Semi-transparent backdrop, built on first enter
+        self.menu_start_y = 300
+        self.menu_spacing = 40
         
     def enter(self):
         """Initialize pause state"""
         super().enter()
         
-        # Initialize fonts
-        try:
-            self.font_large = pygame.font.Font(None, 48)
-            self.font_medium = pygame.font.Font(None, 32)
-        except:
-            self.font_large = pygame.font.SysFont('courier', 48)
-            self.font_medium = pygame.font.SysFont('courier', 32)
+        # Initialize fonts (once, rendered text is cached per font)
+        if self.font_large is None:
+            try:
+                self.font_large = pygame.font.Font(None, 48)
+                self.font_medium = pygame.font.Font(None, 32)
+                self.font_tiny = pygame.font.Font(None, 20)
+            except:
+                self.font_large = pygame.font.SysFont('courier', 48)
+                self.font_medium = pygame.font.SysFont('courier', 32)
+                self.font_tiny = pygame.font.SysFont('courier', 20)
+                
+        self._prerender_menu_items(self.menu_items, self.font_medium)
+        
+        # Build semi-transparent overlay
+        if self._overlay is None:
+            self._overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
+            self._overlay.fill(Config.BLACK)
+            self._overlay = self._overlay.convert()
+            self._overlay.set_alpha(128)
+            
+        # Full redraw on entry
+        self._redraw_all = True
+        self._dirty_items.clear()
             
         # Pause game music
         pygame.mixer.music.pause()
@@ -69,10 +100,14 @@ class PauseState(GameState):
             
         # Handle menu navigation
         if input_manager.is_key_just_pressed(pygame.K_UP) or input_manager.is_key_just_pressed(pygame.K_w):
+            self._mark_menu_item_dirty(self.selected_item)
             self.selected_item = (self.selected_item - 1) % len(self.menu_items)
+            self._mark_menu_item_dirty(self.selected_item)
             
         if input_manager.is_key_just_pressed(pygame.K_DOWN) or input_manager.is_key_just_pressed(pygame.K_s):
+            self._mark_menu_item_dirty(self.selected_item)
             self.selected_item = (self.selected_item + 1) % len(self.menu_items)
+            self._mark_menu_item_dirty(self.selected_item)
             
         # Handle menu selection
         if input_manager.is_key_just_pressed(pygame.K_RETURN) or input_manager.is_key_just_pressed(pygame.K_SPACE):
@@ -82,6 +117,7 @@ class PauseState(GameState):
         self.blink_timer += dt
         if self.blink_timer >= 0.5:
             self.show_cursor = not self.show_cursor
+            self._mark_menu_item_dirty(self.selected_item)
             self.blink_timer = 0
             
     def render(self, screen: pygame.Surface):
@@ -89,52 +125,41 @@ class PauseState(GameState):
         if not self.active:
             return
             
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Config.BLACK)
-        screen.blit(overlay, (0, 0))
+        # Only the changed menu rows need redrawing
+        if not self._redraw_all:
+            self._render_dirty_menu_items(screen)
+            return
+            
+        # Draw semi-transparent overlay
+        screen.blit(self._overlay, (0, 0))
+        
+        # Text is collected and drawn with one blits call
+        blit_list = []
         
         # Draw pause title
         title_text = "GAME PAUSED"
-        title_surface = self.font_large.render(title_text, True, Config.DOS_GREEN)
-        title_rect = title_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, 200))
-        screen.blit(title_surface, title_rect)
+        blit_list.append(self._get_text_blit(title_text, self.font_large, Config.DOS_GREEN,
+                                             (Config.SCREEN_WIDTH // 2, 200)))
         
         # Draw menu items
-        menu_start_y = 300
-        for i, item in enumerate(self.menu_items):
-            color = Config.DOS_GREEN if i == self.selected_item else Config.GRAY
-            
-            # Add cursor for selected item
-            if i == self.selected_item and self.show_cursor:
-                cursor_text = "> " + item + " <"
-            else:
-                cursor_text = "  " + item + "  "
-                
-            item_surface = self.font_medium.render(cursor_text, True, color)
-            item_rect = item_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, menu_start_y + i * 40))
-            screen.blit(item_surface, item_rect)
+        for i in range(len(self.menu_items)):
+            blit_list.append(self._get_menu_item_blit(i))
             
         # Draw controls hint
         controls_text = "ESC to resume, ARROW KEYS to navigate, ENTER to select"
-        controls_surface = pygame.font.Font(None, 20).render(controls_text, True, Config.DARK_GRAY)
-        controls_rect = controls_surface.get_rect(center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30))
-        screen.blit(controls_surface, controls_rect)
+        blit_list.append(self._get_text_blit(controls_text, self.font_tiny, Config.DARK_GRAY,
+                                             (Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30)))
+        
+        screen.blits(blit_list, doreturn=False)
+        
+        self._redraw_all = False
+        self._dirty_items.clear()
+        
+    def _render_menu_background(self, screen: pygame.Surface, area: pygame.Rect):
+        """Restore the overlay behind a menu row"""
+        screen.fill(Config.BLACK, area)
+        screen.blit(self._overlay, area, area)
         
     def _handle_menu_selection(self):
         """Handle pause menu item selection"""
-        selected = self.menu_items[self.selected_item]
-        
-        if selected == "RESUME":
-            self.game_engine.change_state(GameStateType.PLAYING)
-        elif selected == "SAVE GAME":
-            # TODO: Implement save game functionality
-            print("Save game not implemented yet")
-        elif selected == "LOAD GAME":
-            # TODO: Implement load game functionality
-            print("Load game not implemented yet")
-        elif selected == "MAIN MENU":
-            self.game_engine.change_state(GameStateType.MENU)
-        elif selected == "QUIT":
-            self.game_engine.quit_game()
\ No newline at end of file
+        self._ACTIONS[self.menu_items[self.selected_item]](self)
\ No newline at end of file
@@ -8,19 +8,56 @@ PIETRO's gameplay vision comes to life!
 """
 
 import pygame
-from typing import TYPE_CHECKING, List
+import numpy as np
+from typing import TYPE_CHECKING, Callable, Dict, List, Tuple
 from ...core.config import Config
 from ..game_state import GameState, GameStateType
 from ..entities.player import Player
 from ..entities.enemy import Enemy, MutantEnemy, RobotEnemy, MercenaryEnemy
 from ..entities.enemy_standard import EnemyStandard
 from ..entities.item import ItemType
+from ..entities.pool import ProjectilePool
+from ..entities.projectile import Bullet, Rocket, EnemyBullet, render_projectiles
 from ..world.world_manager import WorldManager
 from ..ui.hud import HUD
 
 if TYPE_CHECKING:
     from ..game_engine import GameEngine
 
+# Test enemy spawns (x, y, type), pixel coordinates of tile positions
+_ENEMY_SPAWNS: Tuple[Tuple[int, int, str], ...] = (
+    (320, 256, 'standard'),    # Left side - nuovo nemico (tile 10, 8)
+    (1600, 384, 'standard'),   # Right side - nuovo nemico (tile 50, 12)
+    (800, 160, 'standard'),    # Top center - nuovo nemico (tile 25, 5)
+    (1120, 480, 'standard'),   # Bottom right - nuovo nemico (tile 35, 15)
+    (480, 384, 'standard'),    # Extra spawn (tile 15, 12)
+    (1440, 256, 'standard'),   # Extra spawn (tile 45, 8)
+)
+
+# Test item spawns (x, y, type), pixel coordinates of tile positions
+_ITEM_SPAWNS: Tuple[Tuple[int, int, ItemType], ...] = (
+    (640, 320, ItemType.MEDIKIT),        # tile 20, 10
+    (1280, 256, ItemType.AMMO),          # tile 40, 8
+    (384, 192, ItemType.SHIELD),         # tile 12, 6
+    (1536, 448, ItemType.DAMAGE_BOOST),  # tile 48, 14
+    (896, 384, ItemType.SPEED_BOOST),    # tile 28, 12
+    (256, 288, ItemType.JETPACK),        # tile 8, 9
+    (1664, 224, ItemType.ARMOR),         # tile 52, 7
+    (512, 448, ItemType.WEAPON_MOD),     # tile 16, 14
+    (1152, 192, ItemType.KEYCARD),       # tile 36, 6
+    (1408, 352, ItemType.CREDITS),       # tile 44, 11
+    (768, 256, ItemType.CHECKPOINT),     # tile 24, 8
+    (1024, 512, ItemType.ARTIFACT),      # tile 32, 16
+)
+
+# Enemy type -> class, unknown types fall back to EnemyStandard
+_ENEMY_FACTORIES: Dict[str, Callable[..., Enemy]] = {
+    'standard': EnemyStandard,
+    'mutant': MutantEnemy,
+    'robot': RobotEnemy,
+    'mercenary': MercenaryEnemy,
+}
+
 class PlayingState(GameState):
     """Main gameplay state"""
     
@@ -29,9 +66,13 @@ class PlayingState(GameState):
         self.player = None
         self.enemies: List[Enemy] = []
         self.world_manager = None
+        self.projectile_pool = None
         self.hud = None
         self.paused = False
         
+        # Game area view into the screen (excluding HUD), created on first render
+        self._game_surface = None
+        
     def enter(self):
         """Initialize gameplay"""
         super().enter()
@@ -46,10 +87,17 @@ class PlayingState(GameState):
         # Initialize world with test room
         self.world_manager.initialize_world(generate_test_room=True)
         
+        # Shared projectile pool, pre-warmed so shooting never allocates mid-fight
+        self.projectile_pool = ProjectilePool(self.game_engine.get_asset_manager())
+        self.projectile_pool.prewarm(Bullet, 128)
+        self.projectile_pool.prewarm(Rocket, 16)
+        self.projectile_pool.prewarm(EnemyBullet, 32)
+        
         # Create player at center of map
         spawn_x = 30 * 32  # Center X (tile 30 * 32 pixels)
         spawn_y = 10 * 32  # Center Y (tile 10 * 32 pixels)
-        self.player = Player(spawn_x, spawn_y, self.game_engine.get_asset_manager())
+        self.player = Player(spawn_x, spawn_y, self.game_engine.get_asset_manager(),
+                             self.projectile_pool)
         
         # Create enemies
         self._spawn_enemies()
@@ -86,24 +134,25 @@ class PlayingState(GameState):
         if input_manager.is_load_pressed():
             self._load_game()
             
-        # Handle world manager input
-        for event in pygame.event.get():
-            if self.world_manager:
-                self.world_manager.handle_input(event)
-        
         # Update world manager
         if self.world_manager and self.player:
             self.world_manager.update(dt, (self.player.x, self.player.y))
         
+        # World collision data, fetched once for the player and every enemy
+        if self.world_manager:
+            collision_rects = self.world_manager.get_collision_rects()
+            collision_rows = self.world_manager.get_collision_rows()
+            collision_hash = self.world_manager.get_collision_hash()
+            
         # Update player with world collision
         if self.player and self.world_manager:
-            # Pass collision rects to player
-            collision_rects = self.world_manager.get_collision_rects()
-            self.player.update(dt, input_manager, collision_rects)
+            self.player.update(dt, input_manager, collision_rects, collision_rows, collision_hash)
             
-            # Check hazard damage
-            hazard_damage = self.world_manager.check_hazard_collision(
-                pygame.Rect(self.player.x - 16, self.player.y - 16, 32, 32)
+            # Check hazard damage (32x32 box around the player, truncated like a Rect)
+            hazard_left = int(self.player.x - 16)
+            hazard_top = int(self.player.y - 16)
+            hazard_damage = self.world_manager.check_hazard_box(
+                hazard_left, hazard_top, hazard_left + 32, hazard_top + 32
             )
             if hazard_damage > 0:
                 self.player.take_damage(hazard_damage)
@@ -113,20 +162,31 @@ class PlayingState(GameState):
                 self.game_engine.change_state(GameStateType.GAME_OVER)
                 return
                 
-        # Update enemies
-        for enemy in self.enemies[:]:
-            if self.world_manager:
-                collision_rects = self.world_manager.get_collision_rects()
-                enemy.update(dt, self.player, collision_rects)
+        # Update enemies, freezing the AI of those far outside the view
+        if self.world_manager:
+            in_active_area = self._get_enemies_in_view(Config.UPDATE_CULL_MARGIN)
+            for enemy, active in zip(self.enemies, in_active_area):
+                if active:
+                    enemy.update(dt, self.player, collision_rects, collision_hash)
+                else:
+                    enemy.update_offscreen(dt, collision_rects, collision_hash)
             
-            # Remove dead enemies
-            if enemy.health <= 0:
-                self.enemies.remove(enemy)
+        # Remove dead enemies in one pass
+        self.enemies = [enemy for enemy in self.enemies if enemy.health > 0]
+                
+        # Apply player projectile hits to enemies
+        if self.player and self.world_manager:
+            self._resolve_projectile_hits()
             
         # Update HUD
         if self.hud and self.player:
             self.hud.update(dt, self.player)
             
+    def handle_event(self, event: pygame.event.Event):
+        """Forward events to the world manager (editor and debug keys, off in normal play)"""
+        if self.active and self.world_manager and Config.EDITOR_KEYS_ENABLED:
+            self.world_manager.handle_input(event)
+            
     def render(self, screen: pygame.Surface):
         """Render gameplay graphics"""
         if not self.active:
@@ -135,9 +195,11 @@ class PlayingState(GameState):
         # Clear screen
         screen.fill(Config.BLACK)
         
-        # Create game area surface (excluding HUD)
-        game_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT - Config.HUD_HEIGHT))
-        game_surface.fill(Config.BLACK)
+        # Game area is a subsurface, so the world is drawn straight to the screen
+        game_surface = self._game_surface
+        if game_surface is None or game_surface.get_parent() is not screen:
+            game_surface = screen.subsurface(Config.get_game_area_rect())
+            self._game_surface = game_surface
         
         # Render world (includes parallax, tilemap, editor UI)
         if self.world_manager:
@@ -152,49 +214,78 @@ class PlayingState(GameState):
         if self.player:
             self.player.render(game_surface, camera_offset)
             
-        # Render enemies
-        for enemy in self.enemies:
-            enemy.render(game_surface, camera_offset)
+        # Render enemies, only projectiles for those off-screen
+        in_view = self._get_enemies_in_view(Config.RENDER_CULL_MARGIN)
+        enemy_blits = []
+        visible_enemies = []
+        for enemy, visible in zip(self.enemies, in_view):
+            if not visible:
+                render_projectiles(game_surface, enemy.projectiles, camera_offset)
+                continue
+                
+            blit_pair = enemy.get_blit_pair(camera_offset)
+            if blit_pair is None:
+                # No sprite (placeholder) - fall back to the enemy's own render
+                enemy.render(game_surface, camera_offset)
+            else:
+                enemy_blits.append(blit_pair)
+                visible_enemies.append(enemy)
+                
+        # Sprites in one blits call, then projectiles and health bars on top
+        game_surface.blits(enemy_blits, doreturn=False)
+        for enemy in visible_enemies:
+            enemy.render_overlay(game_surface, camera_offset)
             
         # Render items
         if self.player:
             self.player.item_manager.render(game_surface, camera_offset[0], camera_offset[1])
             
-        # Blit game surface to main screen
-        screen.blit(game_surface, (0, Config.HUD_HEIGHT))
-        
         # Render HUD
         if self.hud:
             self.hud.render(screen, self.player)
             
+    def _get_enemy_bounds(self) -> np.ndarray:
+        """Pack enemy rects into an (N, 4) int32 array of edges (left, top, right, bottom)"""
+        return np.array([(int(enemy.x), int(enemy.y), int(enemy.x) + enemy.width, int(enemy.y) + enemy.height)
+                         for enemy in self.enemies], dtype=np.int32).reshape(-1, 4)
+        
+    def _get_enemies_in_view(self, margin: int) -> List[bool]:
+        """Test every enemy against the grown camera view in one vectorized pass"""
+        if not self.world_manager:
+            return [True] * len(self.enemies)
+        return self.world_manager.camera.cull_mask(self._get_enemy_bounds(), margin).tolist()
+            
+    def _resolve_projectile_hits(self):
+        """Damage enemies hit by player projectiles using the spatial hash"""
+        if not self.player.projectiles or not self.enemies:
+            return
+            
+        # Index live enemies into the dynamic layer of the world grid
+        collision_hash = self.world_manager.get_collision_hash()
+        collision_hash.clear_dynamic()
+        for enemy in self.enemies:
+            if enemy.alive:
+                collision_hash.insert_dynamic(enemy, enemy.get_rect())
+                
+        # Each projectile only tests the enemies sharing its cells
+        damage_multiplier = self.player.get_damage_multiplier()
+        for projectile in self.player.projectiles:
+            if not projectile.active:
+                continue
+            projectile_rect = projectile.get_rect()
+            for enemy in collision_hash.nearby(projectile_rect):
+                if enemy.alive and projectile_rect.colliderect(enemy.get_rect()):
+                    enemy.take_damage(int(projectile.damage * damage_multiplier))
+                    projectile.on_hit_target()
+                    break
+            
     def _spawn_enemies(self):
         """Spawn enemies in the level"""
         asset_manager = self.game_engine.get_asset_manager()
         
         # Spawn some test enemies around the map
-        enemy_spawns = [
-            (10 * 32, 8 * 32, 'standard'),    # Left side - nuovo nemico
-            (50 * 32, 12 * 32, 'standard'),   # Right side - nuovo nemico
-            (25 * 32, 5 * 32, 'standard'),    # Top center - nuovo nemico
-            (35 * 32, 15 * 32, 'standard'),   # Bottom right - nuovo nemico
-            (15 * 32, 12 * 32, 'standard'),   # Extra spawn
-            (45 * 32, 8 * 32, 'standard'),    # Extra spawn
-        ]
-        
-        for spawn_point in enemy_spawns:
-            x, y, enemy_type = spawn_point
-            
-            if enemy_type == 'standard':
-                enemy = EnemyStandard(x, y, asset_manager)
-            elif enemy_type == 'mutant':
-                enemy = MutantEnemy(x, y, asset_manager)
-            elif enemy_type == 'robot':
-                enemy = RobotEnemy(x, y, asset_manager)
-            elif enemy_type == 'mercenary':
-                enemy = MercenaryEnemy(x, y, asset_manager)
-            else:
-                enemy = EnemyStandard(x, y, asset_manager)  # Default al nuovo nemico
-                
+        for x, y, enemy_type in _ENEMY_SPAWNS:
+            enemy = _ENEMY_FACTORIES.get(enemy_type, EnemyStandard)(x, y, asset_manager, self.projectile_pool)
             self.enemies.append(enemy)
     
     def _spawn_items(self):
@@ -203,23 +294,7 @@ class PlayingState(GameState):
             return
             
         # Spawn various test items around the map
-        item_spawns = [
-            (20 * 32, 10 * 32, ItemType.MEDIKIT),
-            (40 * 32, 8 * 32, ItemType.AMMO),
-            (12 * 32, 6 * 32, ItemType.SHIELD),
-            (48 * 32, 14 * 32, ItemType.DAMAGE_BOOST),
-            (28 * 32, 12 * 32, ItemType.SPEED_BOOST),
-            (8 * 32, 9 * 32, ItemType.JETPACK),
-            (52 * 32, 7 * 32, ItemType.ARMOR),
-            (16 * 32, 14 * 32, ItemType.WEAPON_MOD),
-            (36 * 32, 6 * 32, ItemType.KEYCARD),
-            (44 * 32, 11 * 32, ItemType.CREDITS),
-            (24 * 32, 8 * 32, ItemType.CHECKPOINT),
-            (32 * 32, 16 * 32, ItemType.ARTIFACT),
-        ]
-        
-        for spawn_point in item_spawns:
-            x, y, item_type = spawn_point
+        for x, y, item_type in _ITEM_SPAWNS:
             self.player.item_manager.spawn_item(x, y, item_type)
             
     def _save_game(self):
@@ -9,7 +9,8 @@ PIETRO's HUD provides essential battlefield information!
 
 import pygame
 import math
-from typing import TYPE_CHECKING
+import functools
+from typing import TYPE_CHECKING, Dict, List, Optional
 from ...core.config import Config
 
 if TYPE_CHECKING:
@@ -18,6 +19,34 @@ if TYPE_CHECKING:
 class HUD:
     """Heads-up display for game information"""
     
+    # Optional player attributes the HUD can show, probed once per player
+    CAP_JETPACK = 1 << 0
+    CAP_FLASHLIGHT = 1 << 1
+    CAP_SCANNER = 1 << 2
+    CAP_SCORE = 1 << 3
+    CAP_KEYS = 1 << 4
+    CAP_POWERUPS = 1 << 5
+    CAP_ITEM_MANAGER = 1 << 6
+    CAP_CREDITS = 1 << 7
+    CAP_KEYCARDS = 1 << 8
+    CAP_RESERVE_AMMO = 1 << 9
+    
+    # Timers are shown with one decimal, so they only visibly change every 0.1s
+    TIMER_REFRESH_INTERVAL = 0.1
+    
+    _CAP_ATTRIBUTES = (
+        (CAP_JETPACK, 'jetpack_fuel'),
+        (CAP_FLASHLIGHT, 'flashlight_active'),
+        (CAP_SCANNER, 'scanner_active'),
+        (CAP_SCORE, 'score'),
+        (CAP_KEYS, 'keys'),
+        (CAP_POWERUPS, 'active_powerups'),
+        (CAP_ITEM_MANAGER, 'item_manager'),
+        (CAP_CREDITS, 'credits'),
+        (CAP_KEYCARDS, 'keycards'),
+        (CAP_RESERVE_AMMO, 'reserve_ammo')
+    )
+    
     def __init__(self, asset_manager):
         self.asset_manager = asset_manager
         
@@ -26,19 +55,88 @@ class HUD:
         self.font_medium = pygame.font.Font(None, 18)
         self.font_small = pygame.font.Font(None, 14)
         
+        # Screen size and panel anchors, computed once
+        self._screen_width = width = Config.SCREEN_WIDTH
+        self._screen_height = height = Config.SCREEN_HEIGHT
+        self._health_anchor = (20, 15)
+        self._ammo_anchor = (20, 35)
+        self._weapon_anchor = (400, 15)
+        self._utilities_anchor = (20, height - 70)
+        self._collectibles_anchor = (width - 200, 15)
+        self._upgrades_anchor = (width - 150, height - 120)
+        self._minimap_rect = pygame.Rect(width - 130, height - 130, 120, 120)
+        
         # Animation timers
         self.health_flash_timer = 0.0
         self.ammo_flash_timer = 0.0
         self.damage_indicator_timer = 0.0
-        self.last_health = 100
+        self.ammo_low = False
         
         # Colors
         self.health_color = Config.GREEN
         self.ammo_color = Config.YELLOW
         self.text_color = Config.WHITE
         
+        # Constant labels, rendered once
+        self._static_text = {
+            "HEALTH": self.font_medium.render("HEALTH", True, self.text_color),
+            "AMMO": self.font_medium.render("AMMO", True, self.text_color),
+            "CRITICAL!": self.font_small.render("CRITICAL!", True, Config.RED),
+            "JETPACK": self.font_small.render("JETPACK", True, self.text_color),
+            "FLASHLIGHT: ON": self.font_small.render("FLASHLIGHT: ON", True, Config.YELLOW),
+            "SCANNER: ACTIVE": self.font_small.render("SCANNER: ACTIVE", True, Config.GREEN),
+            "UPGRADES": self.font_small.render("UPGRADES", True, Config.CYAN),
+            "None": self.font_small.render("None", True, Config.GRAY),
+            "ACTIVE:": self.font_small.render("ACTIVE:", True, Config.YELLOW)
+        }
+        
+        # Changing values (ammo counts, timers) repeat often, keep the recent ones
+        self._render_text = functools.lru_cache(maxsize=256)(self._render_text_uncached)
+        
+        # Panels are drawn into a cache and only redrawn when a shown value changes
+        self._cache = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # Only the top bar and the bottom strip hold panels, the rest of the cache stays empty
+        self._cache_rects: List[pygame.Rect] = [
+            pygame.Rect(0, 0, width, 60),
+            pygame.Rect(0, height - 130, width, 130)
+        ]
+        
+        # Static geometry, drawn once, and solid fills for the bars keyed by (color, height)
+        self._chrome = self._build_chrome()
+        self._fill_surfaces: Dict[tuple, pygame.Surface] = {}
+        self._upgrades_surface: Optional[pygame.Surface] = None
+        self._upgrades_key: Optional[tuple] = None
+        self._weapon_icon = pygame.Surface((32, 16))
+        self._weapon_icon.fill(Config.GRAY)
+        pygame.draw.rect(self._weapon_icon, Config.WHITE, self._weapon_icon.get_rect(), 1)
+        self._dirty = True
+        self._last_display_state: Optional[tuple] = None
+        
+        # Power-up timer labels, refreshed at TIMER_REFRESH_INTERVAL instead of every frame
+        self._timer_refresh = 0.0
+        self._timer_keys: Optional[tuple] = None
+        self._powerup_labels: tuple = ()
+        self._active_powerup_labels: tuple = ()
+        
+        # Capability bits of the player last seen by update()
+        self._caps_player: Optional['Player'] = None
+        self._caps = 0
+        
+        # Full-screen red flash, filled once - only its alpha changes
+        self._damage_surface = pygame.Surface((width, height)).convert()
+        self._damage_surface.fill(Config.RED)
+        
+        # Crosshair sprite, centered on the screen
+        self._crosshair = self._build_crosshair()
+        self._crosshair_pos = (width // 2 - self._crosshair.get_width() // 2,
+                               height // 2 - self._crosshair.get_height() // 2)
+        
     def update(self, dt: float, player: 'Player'):
         """Update HUD animations and states"""
+        if player is not self._caps_player:
+            self._refresh_capabilities(player)
+            
         # Update flash timers
         if self.health_flash_timer > 0:
             self.health_flash_timer -= dt
@@ -49,75 +147,204 @@ class HUD:
         if self.damage_indicator_timer > 0:
             self.damage_indicator_timer -= dt
             
-        # Check for health change
-        if player.health < self.last_health:
-            self.health_flash_timer = 0.5  # Flash for 0.5 seconds
-            self.damage_indicator_timer = 1.0
+        # React to what the player reported since the last frame
+        if player.hud_events:
+            for event, value in player.hud_events:
+                if event == "damage":
+                    self.health_flash_timer = 0.5  # Flash for 0.5 seconds
+                    self.damage_indicator_timer = 1.0
+                elif event == "ammo":
+                    self.ammo_low = value <= 5
+            player.hud_events.clear()
             
-        self.last_health = player.health
-        
-        # Check for low ammo
-        current_weapon = player.get_current_weapon()
-        if current_weapon and current_weapon.ammo <= 5:
-            if self.ammo_flash_timer <= 0:
-                self.ammo_flash_timer = 0.3
+        # Keep flashing while ammo is low
+        if self.ammo_low and self.ammo_flash_timer <= 0:
+            self.ammo_flash_timer = 0.3
                 
+        # Refresh timer labels at a low rate, or at once if a power-up starts or ends
+        self._timer_refresh -= dt
+        if self._timer_refresh <= 0 or self._get_timer_keys(player) != self._timer_keys:
+            self._refresh_timer_labels(player)
+            
+        # Redraw the cached panels only if something they show changed
+        display_state = self._get_display_state(player)
+        if display_state != self._last_display_state:
+            self._last_display_state = display_state
+            self._dirty = True
+            
+    def _render_text_uncached(self, text: str, font: pygame.font.Font, color: tuple) -> pygame.Surface:
+        """Render a changing HUD string (wrapped by the LRU cache in __init__)"""
+        return font.render(text, True, color)
+        
+    def _refresh_capabilities(self, player: 'Player'):
+        """Combine the CAP_* bits of the optional attributes this player has"""
+        caps = 0
+        for cap, attribute in self._CAP_ATTRIBUTES:
+            if hasattr(player, attribute):
+                caps |= cap
+        self._caps = caps
+        self._caps_player = player
+        
+    def _get_timer_keys(self, player: 'Player') -> tuple:
+        """Get which power-ups are currently shown with a timer"""
+        caps = self._caps
+        return (tuple(player.active_powerups) if caps & self.CAP_POWERUPS else (),
+                tuple(player.item_manager.active_powerups)
+                if caps & self.CAP_ITEM_MANAGER and player.item_manager else ())
+        
+    def _refresh_timer_labels(self, player: 'Player'):
+        """Format the power-up timer labels for the collectibles and upgrades panels"""
+        self._timer_refresh = self.TIMER_REFRESH_INTERVAL
+        self._timer_keys = self._get_timer_keys(player)
+        caps = self._caps
+        
+        if caps & self.CAP_POWERUPS:
+            self._powerup_labels = tuple(f"{powerup.upper()}: {timer:.1f}s"
+                                         for powerup, timer in player.active_powerups.items() if timer > 0)
+            
+        if caps & self.CAP_ITEM_MANAGER and player.item_manager:
+            self._active_powerup_labels = tuple(
+                f"• {powerup.effect.name.replace('_', ' ').title()}: {powerup.remaining_time:.1f}s"
+                for powerup in player.item_manager.active_powerups.values()
+            )
+            
+    def _get_display_state(self, player: 'Player') -> tuple:
+        """Collect every value shown by the cached panels"""
+        current_weapon = player.get_current_weapon()
+        weapon_state = None
+        if current_weapon:
+            cooldown_remaining = current_weapon.get_cooldown_remaining()
+            cooldown_width = int(32 * cooldown_remaining / current_weapon.fire_rate) if cooldown_remaining > 0 else 0
+            weapon_state = (current_weapon.weapon_type, current_weapon.ammo,
+                            current_weapon.max_ammo, cooldown_width)
+            
+        caps = self._caps
+        upgrades_state = None
+        if caps & self.CAP_ITEM_MANAGER and player.item_manager:
+            item_manager = player.item_manager
+            upgrades_state = (
+                tuple(item_manager.permanent_upgrades.items()),
+                self._active_powerup_labels
+            )
+            
+        return (
+            int(player.health), int(player.max_health),
+            self.health_flash_timer > 0 and int(self.health_flash_timer * 10) % 2,
+            self.ammo_flash_timer > 0 and int(self.ammo_flash_timer * 10) % 2,
+            weapon_state,
+            int(80 * player.jetpack_fuel / player.max_jetpack_fuel) if caps & self.CAP_JETPACK else None,
+            caps & self.CAP_FLASHLIGHT and player.flashlight_active,
+            caps & self.CAP_SCANNER and player.scanner_active,
+            player.score if caps & self.CAP_SCORE else None,
+            player.keys if caps & self.CAP_KEYS else None,
+            self._powerup_labels,
+            player.credits if caps & self.CAP_CREDITS else None,
+            player.keycards if caps & self.CAP_KEYCARDS else None,
+            (tuple(player.reserve_ammo.items()) if caps & self.CAP_RESERVE_AMMO else None),
+            upgrades_state
+        )
+        
     def render(self, surface: pygame.Surface, player: 'Player'):
         """Render the HUD"""
-        # Render background panel
-        self._render_background(surface)
+        if self._dirty:
+            self._rebuild_cache(player)
+            
+        # Cached panels
+        surface.blits([(self._cache, rect, rect) for rect in self._cache_rects], doreturn=False)
+        
+        # Render damage indicator
+        self._render_damage_indicator(surface)
+        
+        # Render crosshair
+        self._render_crosshair(surface)
+        
+    def _rebuild_cache(self, player: 'Player'):
+        """Redraw the panels into the cache surface"""
+        if player is not self._caps_player:
+            self._refresh_capabilities(player)
+        surface = self._cache
+        
+        # Text and bar fills, drawn on top of the chrome
+        blit_list = []
         
         # Render health
-        self._render_health(surface, player)
+        self._render_health(blit_list, player)
         
         # Render ammo
-        self._render_ammo(surface, player)
+        self._render_ammo(blit_list, player)
         
         # Render weapon info
-        self._render_weapon_info(surface, player)
+        self._render_weapon_info(blit_list, player)
         
         # Render utility items
-        self._render_utilities(surface, player)
+        self._render_utilities(blit_list, player)
         
         # Render collectibles
-        self._render_collectibles(surface, player)
+        self._render_collectibles(blit_list, player)
         
         # Render permanent upgrades
-        self._render_permanent_upgrades(surface, player)
+        self._render_permanent_upgrades(blit_list, player)
         
-        # Render damage indicator
-        self._render_damage_indicator(surface)
-        
-        # Render crosshair
-        self._render_crosshair(surface)
+        # Clear the panel strips, then chrome and contents in one blits call
+        for rect in self._cache_rects:
+            surface.fill((0, 0, 0, 0), rect)
+        surface.blits(self._chrome + blit_list, doreturn=False)
         
-    def _render_background(self, surface: pygame.Surface):
-        """Render HUD background panel"""
-        # Top panel
-        panel_rect = pygame.Rect(0, 0, Config.SCREEN_WIDTH, 60)
-        pygame.draw.rect(surface, (0, 0, 0, 180), panel_rect)
-        pygame.draw.rect(surface, Config.CYAN, panel_rect, 2)
+        self._dirty = False
         
-        # Bottom mini panel for utilities
-        mini_panel = pygame.Rect(10, Config.SCREEN_HEIGHT - 80, 300, 70)
-        pygame.draw.rect(surface, (0, 0, 0, 120), mini_panel)
-        pygame.draw.rect(surface, Config.CYAN, mini_panel, 1)
+    def _build_chrome(self) -> List[tuple]:
+        """Draw the static panel geometry (panels, bar backgrounds and borders) once
         
-    def _render_health(self, surface: pygame.Surface, player: 'Player'):
+        Returns:
+            (surface, position) blits, one small SRCALPHA surface per panel or bar
+        """
+        width, height = self._screen_width, self._screen_height
+        return [
+            # Top panel
+            (self._build_panel((width, 60), (0, 0, 0, 180), Config.CYAN, 2), (0, 0)),
+            
+            # Bottom mini panel for utilities
+            (self._build_panel((300, 70), (0, 0, 0, 120), Config.CYAN, 1), (10, height - 80)),
+            
+            # Health bar background
+            (self._build_panel((150, 14), Config.DARK_RED, Config.WHITE, 1), (100, 17)),
+            
+            # Jetpack fuel bar background
+            (self._build_panel((80, 8), Config.DARK_BLUE, Config.WHITE, 1), (80, height - 68)),
+            
+            # Background panel for upgrades
+            (self._build_panel((140, 100), (0, 0, 0, 120), Config.CYAN, 1), (width - 160, height - 130))
+        ]
+        
+    def _build_panel(self, size: tuple, fill_color: tuple, border_color: tuple, border_width: int) -> pygame.Surface:
+        """Create a filled, bordered panel; alpha in fill_color is kept per pixel"""
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        panel.fill(fill_color)
+        pygame.draw.rect(panel, border_color, panel.get_rect(), border_width)
+        return panel
+        
+    def _get_fill_blit(self, color: tuple, pos: tuple, width: int, height: int) -> tuple:
+        """Get a (surface, pos, area) blit drawing a width x height bar of color"""
+        key = (color, height)
+        fill = self._fill_surfaces.get(key)
+        if fill is None or fill.get_width() < width:
+            fill = pygame.Surface((max(width, 256), height))
+            fill.fill(color)
+            self._fill_surfaces[key] = fill
+        return fill, pos, pygame.Rect(0, 0, width, height)
+        
+    def _render_health(self, blit_list: list, player: 'Player'):
         """Render health bar and info"""
-        x, y = 20, 15
+        x, y = self._health_anchor
         
         # Health label
-        health_text = self.font_medium.render("HEALTH", True, self.text_color)
-        surface.blit(health_text, (x, y))
+        health_text = self._static_text["HEALTH"]
+        blit_list.append((health_text, (x, y)))
         
-        # Health bar background
+        # Health bar (background and border are in the chrome)
         bar_x, bar_y = x + 80, y + 2
         bar_width, bar_height = 150, 14
         
-        pygame.draw.rect(surface, Config.DARK_RED, (bar_x, bar_y, bar_width, bar_height))
-        pygame.draw.rect(surface, Config.WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
-        
         # Health bar fill
         health_ratio = max(0, player.health / player.max_health)
         fill_width = int(bar_width * health_ratio)
@@ -128,29 +355,29 @@ class HUD:
             health_color = Config.RED
             
         if fill_width > 0:
-            pygame.draw.rect(surface, health_color, (bar_x, bar_y, fill_width, bar_height))
+            blit_list.append(self._get_fill_blit(health_color, (bar_x, bar_y), fill_width, bar_height))
             
         # Health text
         health_value = f"{int(player.health)}/{int(player.max_health)}"
-        health_num_text = self.font_small.render(health_value, True, self.text_color)
-        surface.blit(health_num_text, (bar_x + bar_width + 10, bar_y + 1))
+        health_num_text = self._render_text(health_value, self.font_small, self.text_color)
+        blit_list.append((health_num_text, (bar_x + bar_width + 10, bar_y + 1)))
         
         # Critical health warning
         if player.health <= 25:
-            warning_text = self.font_small.render("CRITICAL!", True, Config.RED)
-            surface.blit(warning_text, (bar_x + bar_width + 80, bar_y + 1))
+            warning_text = self._static_text["CRITICAL!"]
+            blit_list.append((warning_text, (bar_x + bar_width + 80, bar_y + 1)))
             
-    def _render_ammo(self, surface: pygame.Surface, player: 'Player'):
+    def _render_ammo(self, blit_list: list, player: 'Player'):
         """Render ammo information"""
-        x, y = 20, 35
+        x, y = self._ammo_anchor
         
         current_weapon = player.get_current_weapon()
         if not current_weapon:
             return
             
         # Ammo label
-        ammo_text = self.font_medium.render("AMMO", True, self.text_color)
-        surface.blit(ammo_text, (x, y))
+        ammo_text = self._static_text["AMMO"]
+        blit_list.append((ammo_text, (x, y)))
         
         # Ammo count
         ammo_x = x + 80
@@ -161,18 +388,18 @@ class HUD:
             ammo_color = Config.RED
             
         ammo_count = f"{current_weapon.ammo}/{current_weapon.max_ammo}"
-        ammo_count_text = self.font_medium.render(ammo_count, True, ammo_color)
-        surface.blit(ammo_count_text, (ammo_x, y))
+        ammo_count_text = self._render_text(ammo_count, self.font_medium, ammo_color)
+        blit_list.append((ammo_count_text, (ammo_x, y)))
         
         # Reserve ammo
-        if hasattr(player, 'reserve_ammo'):
+        if self._caps & self.CAP_RESERVE_AMMO:
             reserve_text = f"[{player.reserve_ammo.get(current_weapon.weapon_type.name, 0)}]"
-            reserve_ammo_text = self.font_small.render(reserve_text, True, Config.GRAY)
-            surface.blit(reserve_ammo_text, (ammo_x + 80, y + 2))
+            reserve_ammo_text = self._render_text(reserve_text, self.font_small, Config.GRAY)
+            blit_list.append((reserve_ammo_text, (ammo_x + 80, y + 2)))
             
-    def _render_weapon_info(self, surface: pygame.Surface, player: 'Player'):
+    def _render_weapon_info(self, blit_list: list, player: 'Player'):
         """Render current weapon information"""
-        x, y = 400, 15
+        x, y = self._weapon_anchor
         
         current_weapon = player.get_current_weapon()
         if not current_weapon:
@@ -180,179 +407,181 @@ class HUD:
             
         # Weapon name
         weapon_name = current_weapon.weapon_type.name.upper()
-        weapon_text = self.font_medium.render(weapon_name, True, self.text_color)
-        surface.blit(weapon_text, (x, y))
+        weapon_text = self._render_text(weapon_name, self.font_medium, self.text_color)
+        blit_list.append((weapon_text, (x, y)))
         
         # Weapon icon/sprite (placeholder)
-        icon_rect = pygame.Rect(x, y + 20, 32, 16)
-        pygame.draw.rect(surface, Config.GRAY, icon_rect)
-        pygame.draw.rect(surface, Config.WHITE, icon_rect, 1)
+        blit_list.append((self._weapon_icon, (x, y + 20)))
         
         # Fire rate indicator
-        if current_weapon.cooldown_timer > 0:
-            cooldown_ratio = current_weapon.cooldown_timer / current_weapon.fire_rate
+        cooldown_remaining = current_weapon.get_cooldown_remaining()
+        if cooldown_remaining > 0:
+            cooldown_ratio = cooldown_remaining / current_weapon.fire_rate
             cooldown_width = int(32 * cooldown_ratio)
-            pygame.draw.rect(surface, Config.YELLOW, (x, y + 37, cooldown_width, 3))
+            if cooldown_width > 0:
+                blit_list.append(self._get_fill_blit(Config.YELLOW, (x, y + 37), cooldown_width, 3))
             
-    def _render_utilities(self, surface: pygame.Surface, player: 'Player'):
+    def _render_utilities(self, blit_list: list, player: 'Player'):
         """Render utility items status"""
-        x, y = 20, Config.SCREEN_HEIGHT - 70
+        x, y = self._utilities_anchor
         
         # Jetpack fuel
-        if hasattr(player, 'jetpack_fuel'):
-            jetpack_text = self.font_small.render("JETPACK", True, self.text_color)
-            surface.blit(jetpack_text, (x, y))
+        if self._caps & self.CAP_JETPACK:
+            jetpack_text = self._static_text["JETPACK"]
+            blit_list.append((jetpack_text, (x, y)))
             
+            # Fuel bar (background and border are in the chrome)
             fuel_bar_x, fuel_bar_y = x + 60, y + 2
             fuel_bar_width, fuel_bar_height = 80, 8
             
-            pygame.draw.rect(surface, Config.DARK_BLUE, (fuel_bar_x, fuel_bar_y, fuel_bar_width, fuel_bar_height))
-            pygame.draw.rect(surface, Config.WHITE, (fuel_bar_x, fuel_bar_y, fuel_bar_width, fuel_bar_height), 1)
-            
             fuel_ratio = player.jetpack_fuel / player.max_jetpack_fuel
             fuel_fill = int(fuel_bar_width * fuel_ratio)
             
             if fuel_fill > 0:
-                pygame.draw.rect(surface, Config.BLUE, (fuel_bar_x, fuel_bar_y, fuel_fill, fuel_bar_height))
+                blit_list.append(self._get_fill_blit(Config.BLUE, (fuel_bar_x, fuel_bar_y), fuel_fill, fuel_bar_height))
                 
         # Flashlight status
-        if hasattr(player, 'flashlight_active') and player.flashlight_active:
-            flashlight_text = self.font_small.render("FLASHLIGHT: ON", True, Config.YELLOW)
-            surface.blit(flashlight_text, (x, y + 15))
+        if self._caps & self.CAP_FLASHLIGHT and player.flashlight_active:
+            flashlight_text = self._static_text["FLASHLIGHT: ON"]
+            blit_list.append((flashlight_text, (x, y + 15)))
             
         # Scanner status
-        if hasattr(player, 'scanner_active') and player.scanner_active:
-            scanner_text = self.font_small.render("SCANNER: ACTIVE", True, Config.GREEN)
-            surface.blit(scanner_text, (x, y + 30))
+        if self._caps & self.CAP_SCANNER and player.scanner_active:
+            scanner_text = self._static_text["SCANNER: ACTIVE"]
+            blit_list.append((scanner_text, (x, y + 30)))
             
-    def _render_collectibles(self, surface: pygame.Surface, player: 'Player'):
+    def _render_collectibles(self, blit_list: list, player: 'Player'):
         """Render collected items count"""
-        x, y = Config.SCREEN_WIDTH - 200, 15
+        x, y = self._collectibles_anchor
         
         # Score/points
-        if hasattr(player, 'score'):
-            score_text = self.font_medium.render(f"SCORE: {player.score:06d}", True, self.text_color)
-            surface.blit(score_text, (x, y))
+        if self._caps & self.CAP_SCORE:
+            score_text = self._render_text(f"SCORE: {player.score:06d}", self.font_medium, self.text_color)
+            blit_list.append((score_text, (x, y)))
             
         # Keys collected
-        if hasattr(player, 'keys'):
-            keys_text = self.font_small.render(f"KEYS: {player.keys}", True, Config.YELLOW)
-            surface.blit(keys_text, (x, y + 20))
+        if self._caps & self.CAP_KEYS:
+            keys_text = self._render_text(f"KEYS: {player.keys}", self.font_small, Config.YELLOW)
+            blit_list.append((keys_text, (x, y + 20)))
             
         # Power-ups (show active ones)
-        if hasattr(player, 'active_powerups'):
+        if self._caps & self.CAP_POWERUPS:
             powerup_y = y + 35
-            for powerup, timer in player.active_powerups.items():
-                if timer > 0:
-                    powerup_text = self.font_small.render(f"{powerup.upper()}: {timer:.1f}s", True, Config.MAGENTA)
-                    surface.blit(powerup_text, (x, powerup_y))
-                    powerup_y += 12
+            for label in self._powerup_labels:
+                powerup_text = self._render_text(label, self.font_small, Config.MAGENTA)
+                blit_list.append((powerup_text, (x, powerup_y)))
+                powerup_y += 12
                     
     def _render_damage_indicator(self, surface: pygame.Surface):
         """Render damage indicator (red screen flash)"""
         if self.damage_indicator_timer > 0:
             alpha = int(100 * (self.damage_indicator_timer / 1.0))
-            damage_surface = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
-            damage_surface.set_alpha(alpha)
-            damage_surface.fill(Config.RED)
-            surface.blit(damage_surface, (0, 0))
+            self._damage_surface.set_alpha(alpha)
+            surface.blit(self._damage_surface, (0, 0))
             
     def _render_crosshair(self, surface: pygame.Surface):
         """Render crosshair in center of screen"""
-        center_x = Config.SCREEN_WIDTH // 2
-        center_y = Config.SCREEN_HEIGHT // 2
+        surface.blit(self._crosshair, self._crosshair_pos)
         
-        # Simple crosshair
+    def _build_crosshair(self) -> pygame.Surface:
+        """Draw the crosshair once on a small transparent sprite"""
+        # Simple crosshair, with a pixel of margin for the 2px-wide lines
         crosshair_size = 8
         crosshair_color = Config.WHITE
+        center = crosshair_size + 1
+        crosshair = pygame.Surface((center * 2 + 1, center * 2 + 1), pygame.SRCALPHA)
         
         # Horizontal line
-        pygame.draw.line(surface, crosshair_color, 
-                        (center_x - crosshair_size, center_y), 
-                        (center_x + crosshair_size, center_y), 2)
+        pygame.draw.line(crosshair, crosshair_color, 
+                        (center - crosshair_size, center), 
+                        (center + crosshair_size, center), 2)
         
         # Vertical line
-        pygame.draw.line(surface, crosshair_color, 
-                        (center_x, center_y - crosshair_size), 
-                        (center_x, center_y + crosshair_size), 2)
+        pygame.draw.line(crosshair, crosshair_color, 
+                        (center, center - crosshair_size), 
+                        (center, center + crosshair_size), 2)
         
         # Center dot
-        pygame.draw.circle(surface, crosshair_color, (center_x, center_y), 1)
+        pygame.draw.circle(crosshair, crosshair_color, (center, center), 1)
+        return crosshair.convert_alpha()
         
     def render_minimap(self, surface: pygame.Surface, player: 'Player', level):
         """Render minimap (optional feature)"""
         if not hasattr(self, 'show_minimap') or not self.show_minimap:
             return
             
-        minimap_size = 120
-        minimap_x = Config.SCREEN_WIDTH - minimap_size - 10
-        minimap_y = Config.SCREEN_HEIGHT - minimap_size - 10
-        
         # Minimap background
-        minimap_rect = pygame.Rect(minimap_x, minimap_y, minimap_size, minimap_size)
+        minimap_rect = self._minimap_rect
         pygame.draw.rect(surface, (0, 0, 0, 150), minimap_rect)
         pygame.draw.rect(surface, Config.CYAN, minimap_rect, 2)
         
         # Player position (center of minimap)
-        player_x = minimap_x + minimap_size // 2
-        player_y = minimap_y + minimap_size // 2
+        player_x, player_y = minimap_rect.center
         pygame.draw.circle(surface, Config.GREEN, (player_x, player_y), 3)
         
         # Player direction indicator
         direction_x = player_x + (10 if player.facing_right else -10)
         pygame.draw.line(surface, Config.GREEN, (player_x, player_y), (direction_x, player_y), 2)
     
-    def _render_permanent_upgrades(self, surface: pygame.Surface, player: 'Player'):
+    def _build_upgrades_surface(self, upgrades: tuple) -> pygame.Surface:
+        """Stack the upgrade names, 12px apart, on one transparent surface"""
+        lines = [self._render_text(f"• {upgrade.name.replace('_', ' ').title()}", self.font_small, Config.GREEN)
+                 for upgrade in upgrades]
+        width = max(line.get_width() for line in lines)
+        height = 12 * (len(lines) - 1) + lines[-1].get_height()
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        
+        # RGBA_MAX onto the empty surface copies the text pixels unchanged
+        for index, line in enumerate(lines):
+            surface.blit(line, (0, 12 * index), special_flags=pygame.BLEND_RGBA_MAX)
+        return surface
+        
+    def _render_permanent_upgrades(self, blit_list: list, player: 'Player'):
         """Render permanent upgrades acquired by player"""
-        if not hasattr(player, 'item_manager'):
+        if not self._caps & self.CAP_ITEM_MANAGER:
             return
             
-        x, y = Config.SCREEN_WIDTH - 150, Config.SCREEN_HEIGHT - 120
-        
-        # Background panel for upgrades
-        panel_width, panel_height = 140, 100
-        panel_rect = pygame.Rect(x - 10, y - 10, panel_width, panel_height)
-        pygame.draw.rect(surface, (0, 0, 0, 120), panel_rect)
-        pygame.draw.rect(surface, Config.CYAN, panel_rect, 1)
+        # Background panel for upgrades is in the chrome
+        x, y = self._upgrades_anchor
         
         # Title
-        title_text = self.font_small.render("UPGRADES", True, Config.CYAN)
-        surface.blit(title_text, (x, y))
+        title_text = self._static_text["UPGRADES"]
+        blit_list.append((title_text, (x, y)))
         
         # List permanent upgrades
         upgrade_y = y + 15
         upgrades = player.item_manager.permanent_upgrades
         
         if not upgrades:
-            no_upgrades_text = self.font_small.render("None", True, Config.GRAY)
-            surface.blit(no_upgrades_text, (x, upgrade_y))
+            no_upgrades_text = self._static_text["None"]
+            blit_list.append((no_upgrades_text, (x, upgrade_y)))
         else:
-            for upgrade in upgrades:
-                upgrade_name = upgrade.name.replace('_', ' ').title()
-                upgrade_text = self.font_small.render(f"• {upgrade_name}", True, Config.GREEN)
-                surface.blit(upgrade_text, (x, upgrade_y))
-                upgrade_y += 12
+            # One composite surface for the whole list, rebuilt when the set changes
+            upgrades_key = tuple(upgrades)
+            if upgrades_key != self._upgrades_key:
+                self._upgrades_key = upgrades_key
+                self._upgrades_surface = self._build_upgrades_surface(upgrades_key)
+            blit_list.append((self._upgrades_surface, (x, upgrade_y)))
+            upgrade_y += 12 * len(upgrades_key)
         
         # Show active power-ups with timers
-        if player.item_manager.active_powerups:
+        if self._active_powerup_labels:
             powerup_y = upgrade_y + 10
-            powerup_title = self.font_small.render("ACTIVE:", True, Config.YELLOW)
-            surface.blit(powerup_title, (x, powerup_y))
+            powerup_title = self._static_text["ACTIVE:"]
+            blit_list.append((powerup_title, (x, powerup_y)))
             powerup_y += 12
             
-            for powerup in player.item_manager.active_powerups.values():
-                time_left = powerup.remaining_time
-                powerup_name = powerup.effect.name.replace('_', ' ').title()
-                powerup_text = self.font_small.render(f"• {powerup_name}: {time_left:.1f}s", True, Config.MAGENTA)
-                surface.blit(powerup_text, (x, powerup_y))
+            for label in self._active_powerup_labels:
+                powerup_text = self._render_text(label, self.font_small, Config.MAGENTA)
+                blit_list.append((powerup_text, (x, powerup_y)))
                 powerup_y += 12
         
         # Show credits and keycards
         info_y = y + 75
-        if hasattr(player, 'credits'):
-            credits_text = self.font_small.render(f"Credits: {player.credits}", True, Config.YELLOW)
-            surface.blit(credits_text, (x, info_y))
+        if self._caps & self.CAP_CREDITS:
+            credits_text = self._render_text(f"Credits: {player.credits}", self.font_small, Config.YELLOW)
+            blit_list.append((credits_text, (x, info_y)))
         
-        if hasattr(player, 'keycards'):
-            keycards_text = self.font_small.render(f"Keycards: {player.keycards}", True, Config.CYAN)
-            surface.blit(keycards_text, (x, info_y + 12))
\ No newline at end of file
+        if self._caps & self.CAP_KEYCARDS:
+            keycards_text = self._render_text(f"Keycards: {player.keycards}", self.font_small, Config.CYAN)
+            blit_list.append((keycards_text, (x, info_y + 12)))
\ No newline at end of file
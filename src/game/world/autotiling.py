@@ -1,7 +1,23 @@
 import pygame
-from typing import List, Dict, Tuple, Optional
+import numpy as np
+from typing import Dict, Tuple
 from enum import IntEnum
 
+# Direzioni dei vicini e relativi bit. Ordine: NW, N, NE, W, E, SW, S, SE
+_DIRS: Tuple[Tuple[int, int], ...] = (
+    (-1, -1), (0, -1), (1, -1),  # Top row
+    (-1, 0),           (1, 0),   # Middle row (escluso centro)
+    (-1, 1),  (0, 1),  (1, 1)    # Bottom row
+)
+_BITS: Tuple[int, ...] = (1, 2, 4, 8, 16, 32, 64, 128)
+
+def _build_bitmask_lut(bitmask_to_tile: Dict[int, int]) -> np.ndarray:
+    """Espande la mappa bitmask -> tile in una tabella densa da 256 voci (default 0)"""
+    lut = np.zeros(256, dtype=np.int16)
+    for bitmask, tile_index in bitmask_to_tile.items():
+        lut[bitmask] = tile_index
+    return lut
+
 class AutotileType(IntEnum):
     """Tipi di autotile supportati"""
     GROUND = 0
@@ -67,113 +83,118 @@ class AutotilingSystem:
         192: 45
     }
     
+    # Stessa mappa come tabella indicizzata direttamente dal bitmask
+    BITMASK_LUT = _build_bitmask_lut(BITMASK_TO_TILE)
+    
     def __init__(self):
         pass
     
-    def calculate_bitmask(self, grid: List[List[bool]], x: int, y: int) -> int:
-        """Calcola il bitmask per un tile alla posizione (x, y)"""
-        if not grid or y < 0 or y >= len(grid) or x < 0 or x >= len(grid[0]):
+    def calculate_bitmask(self, grid: np.ndarray, x: int, y: int) -> int:
+        """Calcola il bitmask per un tile alla posizione (x, y) di una griglia booleana 2D"""
+        grid = np.asarray(grid, dtype=bool)
+        if grid.ndim != 2:
+            return 0
+        height, width = grid.shape
+        if y < 0 or y >= height or x < 0 or x >= width:
             return 0
         
         # Se il tile corrente è vuoto, non calcolare il bitmask
-        if not grid[y][x]:
+        if not grid.item(y, x):
             return 0
         
         bitmask = 0
         
         # Controlla i tile adiacenti (8 direzioni)
-        # Ordine: NW, N, NE, W, E, SW, S, SE
-        directions = [
-            (-1, -1), (0, -1), (1, -1),  # Top row
-            (-1, 0),           (1, 0),   # Middle row (escluso centro)
-            (-1, 1),  (0, 1),  (1, 1)   # Bottom row
-        ]
-        
-        bit_values = [1, 2, 4, 8, 16, 32, 64, 128]
-        
-        for i, (dx, dy) in enumerate(directions):
+        for (dx, dy), bit in zip(_DIRS, _BITS):
             nx, ny = x + dx, y + dy
             
             # Controlla se la posizione è valida e contiene un tile
-            if (0 <= ny < len(grid) and 0 <= nx < len(grid[ny]) and grid[ny][nx]):
-                bitmask |= bit_values[i]
+            if 0 <= ny < height and 0 <= nx < width and grid.item(ny, nx):
+                bitmask |= bit
         
         return bitmask
     
-    def get_autotile_index(self, grid: List[List[bool]], x: int, y: int) -> int:
+    def get_autotile_index(self, grid: np.ndarray, x: int, y: int) -> int:
         """Ottieni l'indice del tile autotile per la posizione data"""
         bitmask = self.calculate_bitmask(grid, x, y)
-        return self.BITMASK_TO_TILE.get(bitmask, 0)  # Default al primo tile se non trovato
+        return int(self.BITMASK_LUT[bitmask])  # Default al primo tile se non mappato
     
-    def generate_autotile_grid(self, solid_grid: List[List[bool]], tile_type: AutotileType) -> List[List[int]]:
-        """Genera una griglia di indici autotile da una griglia booleana"""
-        if not solid_grid:
-            return []
-        
-        height = len(solid_grid)
-        width = len(solid_grid[0]) if height > 0 else 0
-        
-        autotile_grid = []
-        
-        for y in range(height):
-            row = []
-            for x in range(width):
-                if solid_grid[y][x]:
-                    tile_index = self.get_autotile_index(solid_grid, x, y)
-                    row.append(tile_index)
-                else:
-                    row.append(-1)  # -1 indica nessun tile
-            autotile_grid.append(row)
-        
+    def generate_autotile_grid(self, solid_grid: np.ndarray, tile_type: AutotileType,
+                               return_bitmasks: bool = False):
+        """Genera una griglia di indici autotile (int16, -1 = nessun tile) da una griglia booleana
+        
+        Con return_bitmasks=True restituisce (indici, bitmask), con i bitmask uint8
+        uguali a quelli di calculate_bitmask (0 per le celle vuote).
+        """
+        grid = np.asarray(solid_grid, dtype=bool)
+        if grid.size == 0:
+            empty = np.empty((0, 0), dtype=np.int16)
+            return (empty, empty.astype(np.uint8)) if return_bitmasks else empty
+        height, width = grid.shape
+        
+        # Bitmask di tutte le celle in un colpo: griglia bordata di vuoto, spostata per ogni vicino
+        # Un solo buffer temporaneo riusato per tutti gli 8 vicini, nessuna allocazione nel ciclo
+        padded = np.pad(grid, 1).astype(np.uint8)
+        bitmask = np.zeros((height, width), dtype=np.uint8)
+        neighbour = np.empty_like(bitmask)
+        for (dx, dy), bit in zip(_DIRS, _BITS):
+            np.multiply(padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width], np.uint8(bit), out=neighbour)
+            bitmask |= neighbour
+        
+        autotile_grid = self.BITMASK_LUT[bitmask]
+        autotile_grid[~grid] = -1  # -1 indica nessun tile
+        
+        if return_bitmasks:
+            bitmask[~grid] = 0
+            return autotile_grid, bitmask
         return autotile_grid
     
-    def create_test_pattern(self, width: int, height: int) -> List[List[bool]]:
+    def create_test_pattern(self, width: int, height: int) -> np.ndarray:
         """Crea un pattern di test per verificare l'autotiling"""
-        grid = [[False for _ in range(width)] for _ in range(height)]
+        grid = np.zeros((height, width), dtype=bool)
         
         # Crea un rettangolo con alcuni buchi per testare tutti i casi
-        for y in range(2, height - 2):
-            for x in range(2, width - 2):
-                grid[y][x] = True
+        grid[2:height - 2, 2:width - 2] = True
         
         # Aggiungi alcuni pattern specifici
         if width > 10 and height > 10:
             # Rimuovi alcuni tile per creare angoli interni
-            grid[4][4] = False
-            grid[4][width-5] = False
-            grid[height-5][4] = False
-            grid[height-5][width-5] = False
+            grid[4, 4] = False
+            grid[4, width-5] = False
+            grid[height-5, 4] = False
+            grid[height-5, width-5] = False
             
             # Aggiungi alcune protuberanze per T-junction
             if height > 15:
-                for x in range(width//2 - 2, width//2 + 3):
-                    grid[height//2][x] = True
-                for y in range(height//2 - 2, height//2 + 3):
-                    grid[y][width//2] = True
+                grid[height//2, width//2 - 2:width//2 + 3] = True
+                grid[height//2 - 2:height//2 + 3, width//2] = True
         
         return grid
     
-    def debug_print_bitmasks(self, grid: List[List[bool]], max_width: int = 20, max_height: int = 10):
-        """Stampa i bitmask per debug (limitato per leggibilità)"""
-        height = min(len(grid), max_height)
-        width = min(len(grid[0]) if grid else 0, max_width)
+    def debug_print_bitmasks(self, grid: np.ndarray, max_width: int = 20, max_height: int = 10):
+        """Stampa gli indici autotile per debug (limitato per leggibilità)
+        
+        grid può essere la griglia booleana oppure la griglia di indici già
+        calcolata da generate_autotile_grid, che così non viene ricalcolata.
+        """
+        grid = np.asarray(grid)
+        if grid.dtype == bool:
+            grid = self.generate_autotile_grid(grid, AutotileType.GROUND)
+        view = grid[:max_height, :max_width] if grid.ndim == 2 else np.empty((0, 0), dtype=np.int16)
+        height, width = view.shape
         
         print("\nBitmask Grid (primi {}x{} tile):".format(width, height))
-        for y in range(height):
-            row_str = ""
-            for x in range(width):
-                if grid[y][x]:
-                    bitmask = self.calculate_bitmask(grid, x, y)
-                    tile_idx = self.BITMASK_TO_TILE.get(bitmask, 0)
-                    row_str += f"{tile_idx:2d} "
-                else:
-                    row_str += "   "
-            print(row_str)
+        for row in view.tolist():
+            print("".join(f"{tile_idx:2d} " if tile_idx != -1 else "   " for tile_idx in row))
         print()
 
 class AutotilePalette:
     """Gestisce le palette di ID per diversi set di autotile"""
     
+    # Tile per riga nel spritesheet e indici coperti dalle tabelle precalcolate
+    TILES_PER_ROW = 16
+    TABLE_SIZE = 64
+    
     def __init__(self):
         self.palettes = {
             AutotileType.GROUND: {
@@ -185,17 +206,30 @@ class AutotilePalette:
                 'name': 'wall_autotile'
             }
         }
+        
+        # Tabella (indice autotile -> (row, col)) per ogni palette, int16 di forma (TABLE_SIZE, 2)
+        indices = np.arange(self.TABLE_SIZE)
+        self._coords: Dict[AutotileType, np.ndarray] = {
+            tile_type: np.stack([palette['base_row'] + indices // self.TILES_PER_ROW,
+                                 indices % self.TILES_PER_ROW], axis=1).astype(np.int16)
+            for tile_type, palette in self.palettes.items()
+        }
     
     def get_tile_coords(self, tile_type: AutotileType, autotile_index: int) -> Tuple[int, int]:
         """Converte un indice autotile in coordinate (row, col) del spritesheet"""
-        if tile_type not in self.palettes:
+        coords = self._coords.get(tile_type)
+        if coords is None:
             return (0, 0)
         
+        if 0 <= autotile_index < self.TABLE_SIZE:
+            row, col = coords[autotile_index].tolist()
+            return (row, col)
+        
         base_row = self.palettes[tile_type]['base_row']
         
         # Assumendo che ogni riga abbia 47 tile (o meno)
         # Se l'indice supera la larghezza della riga, va alla riga successiva
-        tiles_per_row = 16  # Assumendo 16 tile per riga nel spritesheet
+        tiles_per_row = self.TILES_PER_ROW  # Assumendo 16 tile per riga nel spritesheet
         
         row_offset = autotile_index // tiles_per_row
         col = autotile_index % tiles_per_row
@@ -203,6 +237,13 @@ class AutotilePalette:
         
         return (row, col)
     
+    def get_tile_coords_batch(self, tile_type: AutotileType, autotile_indices: np.ndarray) -> np.ndarray:
+        """Converte un array di indici autotile (0..TABLE_SIZE-1) in coordinate (row, col), forma (N, 2)"""
+        coords = self._coords.get(tile_type)
+        if coords is None:
+            return np.zeros((len(autotile_indices), 2), dtype=np.int16)
+        return coords[autotile_indices]
+    
     def get_palette_info(self, tile_type: AutotileType) -> Dict:
         """Ottieni informazioni sulla palette"""
         return self.palettes.get(tile_type, {})
\ No newline at end of file
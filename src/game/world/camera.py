@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 from typing import Tuple
 from ...core.config import Config
 
@@ -13,23 +14,32 @@ class Camera:
         self.target_x = 0.0
         self.target_y = 0.0
         self.smoothing = 0.1  # Camera smoothing factor
+        self._one_minus_smoothing = 1.0 - self.smoothing
         
-    def update(self, dt: float, target_x: float, target_y: float, level_width: int = None, level_height: int = None):
+        # Camera position limits (min_x, max_x, min_y, max_y), unbounded until set_level_bounds
+        self._limits = (float('-inf'), float('inf'), float('-inf'), float('inf'))
+        
+    def set_level_bounds(self, level_width: int, level_height: int):
+        """Keep the view inside a level of the given pixel size"""
+        self._limits = (0.0, max(0.0, float(level_width - self.width)),
+                        0.0, max(0.0, float(level_height - self.height)))
+        
+    def update(self, dt: float, target_x: float, target_y: float):
         """Update camera position to follow target"""
         # Calculate target position (center target on screen)
         self.target_x = target_x - self.width // 2
         self.target_y = target_y - self.height // 2
         
         # Apply smoothing
-        self.x += (self.target_x - self.x) * self.smoothing
-        self.y += (self.target_y - self.y) * self.smoothing
+        smoothing = self.smoothing
+        x = self.x * self._one_minus_smoothing + self.target_x * smoothing
+        y = self.y * self._one_minus_smoothing + self.target_y * smoothing
+        
+        # Clamp camera to level bounds - four comparisons, no min/max calls
+        min_x, max_x, min_y, max_y = self._limits
+        self.x = min_x if x < min_x else (max_x if x > max_x else x)
+        self.y = min_y if y < min_y else (max_y if y > max_y else y)
         
-        # Clamp camera to level bounds if provided
-        if level_width:
-            self.x = max(0, min(self.x, level_width - self.width))
-        if level_height:
-            self.y = max(0, min(self.y, level_height - self.height))
-            
     def get_offset(self) -> Tuple[int, int]:
         """Get camera offset for rendering"""
         return (int(self.x), int(self.y))
@@ -53,6 +63,21 @@ class Camera:
                    y + height < self.y or 
                    y > self.y + self.height)
     
+    def cull_mask(self, bounds: np.ndarray, margin: float = 0) -> np.ndarray:
+        """Vectorized is_visible for many rectangles at once
+        
+        Args:
+            bounds: (N, 4) array of edges (left, top, right, bottom)
+            margin: Extra distance around the view still counted as visible
+            
+        Returns:
+            Boolean mask, True for the rectangles in view
+        """
+        left = self.x - margin
+        top = self.y - margin
+        return ~((bounds[:, 2] < left) | (bounds[:, 0] > left + self.width + 2 * margin) |
+                 (bounds[:, 3] < top) | (bounds[:, 1] > top + self.height + 2 * margin))
+    
     def set_position(self, x: float, y: float):
         """Set camera position directly"""
         self.x = x
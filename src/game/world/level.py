@@ -8,41 +8,91 @@ PIETRO's levels challenge warriors with intricate designs!
 """
 
 import pygame
+import math
 import random
+import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
 from ...core.config import Config
 
-class Tile:
-    """Individual tile in the level"""
-    
-    def __init__(self, x: int, y: int, tile_type: str):
-        self.x = x
-        self.y = y
-        self.tile_type = tile_type
-        self.solid = tile_type in ['wall', 'platform', 'ground']
-        self.destructible = tile_type in ['crate', 'barrel']
-        self.interactive = tile_type in ['door', 'switch', 'terminal']
-        
-    def get_rect(self) -> pygame.Rect:
-        """Get tile collision rectangle"""
-        return pygame.Rect(self.x * Config.TILE_SIZE, self.y * Config.TILE_SIZE, 
-                          Config.TILE_SIZE, Config.TILE_SIZE)
+# Tile type names by id, as stored in Level.tile_types (0 = no tile).
+# Unknown names are appended on first use by get_tile_type_id.
+TILE_TYPES: List[Optional[str]] = [None, 'ground', 'wall', 'platform', 'crate', 'barrel',
+                                   'door', 'switch', 'terminal']
+TILE_ID: Dict[Optional[str], int] = {tile_type: tile_id for tile_id, tile_type in enumerate(TILE_TYPES)}
+GROUND_ID = TILE_ID['ground']
+WALL_ID = TILE_ID['wall']
+PLATFORM_ID = TILE_ID['platform']
+
+# Per-id property tables, indexed by tile type id
+SOLID_LUT = np.zeros(256, dtype=bool)
+SOLID_LUT[[WALL_ID, PLATFORM_ID, GROUND_ID]] = True
+DESTRUCTIBLE_LUT = np.zeros(256, dtype=bool)
+DESTRUCTIBLE_LUT[[TILE_ID['crate'], TILE_ID['barrel']]] = True
+INTERACTIVE_LUT = np.zeros(256, dtype=bool)
+INTERACTIVE_LUT[[TILE_ID['door'], TILE_ID['switch'], TILE_ID['terminal']]] = True
+
+# Side of a pre-rendered tile chunk, in tiles
+CHUNK_TILES = 16
+
+def get_tile_type_id(tile_type: Optional[str]) -> int:
+    """Get the id of a tile type name, registering unknown names (never solid)"""
+    tile_id = TILE_ID.get(tile_type)
+    if tile_id is None:
+        if len(TILE_TYPES) >= 256:
+            raise ValueError(f"Too many tile types, cannot add {tile_type!r}")
+        tile_id = TILE_ID[tile_type] = len(TILE_TYPES)
+        TILE_TYPES.append(tile_type)
+    return tile_id
 
 class Level:
     """Game level with tiles, entities, and collision detection"""
     
-    def __init__(self, width: int, height: int, asset_manager):
+    # Pre-rendered tile sprites by tile type id and collectible sprites by
+    # item type, built on first render
+    _tile_sprites: Optional[List[Optional[pygame.Surface]]] = None
+    _item_sprites: Optional[Dict[str, pygame.Surface]] = None
+    
+    def __init__(self, width: int, height: int, asset_manager, rng: Optional[random.Random] = None):
         self.width = width
         self.height = height
         self.asset_manager = asset_manager
         
-        # Level data
-        self.tiles: Dict[Tuple[int, int], Tile] = {}
-        self.spawn_points: List[Tuple[int, int]] = []
-        self.enemy_spawns: List[Tuple[int, int, str]] = []  # x, y, enemy_type
-        self.collectibles: List[Dict[str, Any]] = []
+        # Private random stream for generation and spawn picks (pass a seeded one to reproduce a level)
+        self._rng = rng if rng is not None else random.Random()
+        
+        # Level data - one tile type id per cell, indexed [x, y]
+        self.tile_types = np.zeros((width, height), dtype=np.uint8)
+        
+        # Pre-rendered tile chunks keyed by chunk coordinates, built on first render
+        self._chunks: Dict[Tuple[int, int], pygame.Surface] = {}
+        
+        # World pixel origin of each chunk column and row
+        chunk_size = CHUNK_TILES * Config.TILE_SIZE
+        self._chunk_col_px = np.arange(0, width * Config.TILE_SIZE, chunk_size, dtype=np.int64)
+        self._chunk_row_px = np.arange(0, height * Config.TILE_SIZE, chunk_size, dtype=np.int64)
+        
+        # Debug grid line overlays (vertical, horizontal), built on first use
+        self._grid_overlays: Optional[Tuple[pygame.Surface, pygame.Surface]] = None
+        
+        # Player and enemy spawn points in pixel space, as parallel arrays
+        self._spawn_xs = np.empty(0, dtype=np.int32)
+        self._spawn_ys = np.empty(0, dtype=np.int32)
+        self._enemy_spawn_xs = np.empty(0, dtype=np.int32)
+        self._enemy_spawn_ys = np.empty(0, dtype=np.int32)
+        self._enemy_spawn_types: List[str] = []
+        self._enemy_spawns: Optional[List[Tuple[int, int, str]]] = None  # get_enemy_spawns cache
+        
+        # Collectibles partitioned by state; a collected item is swap-removed
+        # from _active so per-frame loops only see live items
+        self._active: List[Dict[str, Any]] = []
+        self._collected: List[Dict[str, Any]] = []
         self.secrets: List[Dict[str, Any]] = []
         
+        # Uncollected collectibles bucketed by grid cell, as parallel lists of
+        # rects and indices into self._active
+        self._collectible_cell = 2 * Config.TILE_SIZE
+        self._collectible_grid: Dict[Tuple[int, int], Tuple[List[pygame.Rect], List[int]]] = {}
+        
         # Level properties
         self.background_color = Config.BLACK
         self.ambient_light = 0.8
@@ -53,23 +103,20 @@ class Level:
         
     def _generate_basic_structure(self):
         """Generate basic level structure"""
-        # Create ground
+        # Create ground (nothing is rendered yet, so slices are written straight
+        # into the tile array with no chunk invalidation)
         ground_y = self.height - 3
-        for x in range(self.width):
-            self.set_tile(x, ground_y, 'ground')
-            self.set_tile(x, ground_y + 1, 'ground')
-            self.set_tile(x, ground_y + 2, 'ground')
+        self.tile_types[:, max(0, ground_y):] = GROUND_ID
             
         # Create walls
-        for y in range(self.height):
-            self.set_tile(0, y, 'wall')
-            self.set_tile(self.width - 1, y, 'wall')
+        self.tile_types[0, :] = WALL_ID
+        self.tile_types[self.width - 1, :] = WALL_ID
             
         # Add some platforms
         self._add_platforms()
         
         # Add spawn points
-        self.spawn_points.append((2, ground_y - 1))
+        self.add_spawn_point(2, ground_y - 1)
         
         # Add enemy spawns
         self._add_enemy_spawns()
@@ -82,288 +129,499 @@ class Level:
         ground_y = self.height - 3
         
         # Add some random platforms
-        for _ in range(random.randint(3, 6)):
-            platform_x = random.randint(5, self.width - 10)
-            platform_y = random.randint(ground_y - 15, ground_y - 5)
-            platform_length = random.randint(3, 8)
+        for _ in range(self._rng.randrange(3, 7)):
+            platform_x = self._rng.randrange(5, self.width - 9)
+            platform_y = self._rng.randrange(ground_y - 15, ground_y - 4)
+            platform_length = self._rng.randrange(3, 9)
             
-            for i in range(platform_length):
-                if platform_x + i < self.width - 1:
-                    self.set_tile(platform_x + i, platform_y, 'platform')
+            # Platforms stop before the right wall
+            if 0 <= platform_y < self.height:
+                self.tile_types[platform_x:min(platform_x + platform_length, self.width - 1), platform_y] = PLATFORM_ID
                     
-        # Add some stairs
-        stair_x = random.randint(10, self.width - 15)
+        # Add some stairs (step i is a column of i + 1 tiles above the ground)
+        stair_x = self._rng.randrange(10, self.width - 14)
         for i in range(5):
-            for j in range(i + 1):
-                if stair_x + i < self.width - 1 and ground_y - j - 1 > 0:
-                    self.set_tile(stair_x + i, ground_y - j - 1, 'platform')
+            if stair_x + i < self.width - 1:
+                self.tile_types[stair_x + i, max(1, ground_y - i - 1):max(1, ground_y)] = PLATFORM_ID
                     
     def _add_enemy_spawns(self):
         """Add enemy spawn points"""
         ground_y = self.height - 3
         
         # Add standard enemy spawns (nuovo nemico principale)
-        for _ in range(random.randint(3, 5)):
-            spawn_x = random.randint(5, self.width - 5)
-            self.enemy_spawns.append((spawn_x, ground_y - 1, 'standard'))
+        for _ in range(self._rng.randrange(3, 6)):
+            spawn_x = self._rng.randrange(5, self.width - 4)
+            self.add_enemy_spawn(spawn_x, ground_y - 1, 'standard')
             
         # Add standard enemies on platforms
-        for _ in range(random.randint(1, 3)):
-            spawn_x = random.randint(5, self.width - 5)
-            spawn_y = random.randint(ground_y - 10, ground_y - 5)
-            self.enemy_spawns.append((spawn_x, spawn_y, 'standard'))
+        for _ in range(self._rng.randrange(1, 4)):
+            spawn_x = self._rng.randrange(5, self.width - 4)
+            spawn_y = self._rng.randrange(ground_y - 10, ground_y - 4)
+            self.add_enemy_spawn(spawn_x, spawn_y, 'standard')
             
         # Add occasional mutant spawns
-        for _ in range(random.randint(0, 1)):
-            spawn_x = random.randint(10, self.width - 10)
-            self.enemy_spawns.append((spawn_x, ground_y - 1, 'mutant'))
+        for _ in range(self._rng.randrange(0, 2)):
+            spawn_x = self._rng.randrange(10, self.width - 9)
+            self.add_enemy_spawn(spawn_x, ground_y - 1, 'mutant')
             
     def _add_collectibles(self):
         """Add collectible items to the level"""
-        ground_y = self.height - 3
+        tile_size = Config.TILE_SIZE
+        item_y = (self.height - 4) * tile_size  # One tile above the ground
+        
+        # Positions and subtypes of each item class come from one vector draw,
+        # on a numpy stream seeded from the level's own
+        np_rng = np.random.default_rng(self._rng.getrandbits(64))
         
         # Add health packs
-        for _ in range(random.randint(2, 4)):
-            item_x = random.randint(3, self.width - 3)
-            item_y = ground_y - 1
-            self.collectibles.append({
+        xs = np_rng.integers(3, self.width - 2, size=self._rng.randrange(2, 5)) * tile_size
+        for item_x in xs.tolist():
+            self.add_collectible({
                 'type': 'health_pack',
-                'x': item_x * Config.TILE_SIZE,
-                'y': item_y * Config.TILE_SIZE,
+                'x': item_x,
+                'y': item_y,
                 'value': 25,
                 'collected': False
             })
             
         # Add ammo boxes
-        for _ in range(random.randint(3, 5)):
-            item_x = random.randint(3, self.width - 3)
-            item_y = ground_y - 1
-            ammo_type = random.choice(['pistol', 'shotgun', 'rocket'])
-            self.collectibles.append({
+        count = self._rng.randrange(3, 6)
+        xs = np_rng.integers(3, self.width - 2, size=count) * tile_size
+        ammo_types = np_rng.choice(['pistol', 'shotgun', 'rocket'], size=count)
+        for item_x, ammo_type in zip(xs.tolist(), ammo_types.tolist()):
+            self.add_collectible({
                 'type': 'ammo',
                 'subtype': ammo_type,
-                'x': item_x * Config.TILE_SIZE,
-                'y': item_y * Config.TILE_SIZE,
+                'x': item_x,
+                'y': item_y,
                 'value': 20,
                 'collected': False
             })
             
         # Add power-ups
-        for _ in range(random.randint(1, 2)):
-            item_x = random.randint(5, self.width - 5)
-            item_y = ground_y - 1
-            powerup_type = random.choice(['speed_boost', 'damage_boost', 'invincibility'])
-            self.collectibles.append({
+        count = self._rng.randrange(1, 3)
+        xs = np_rng.integers(5, self.width - 4, size=count) * tile_size
+        powerup_types = np_rng.choice(['speed_boost', 'damage_boost', 'invincibility'], size=count)
+        for item_x, powerup_type in zip(xs.tolist(), powerup_types.tolist()):
+            self.add_collectible({
                 'type': 'powerup',
                 'subtype': powerup_type,
-                'x': item_x * Config.TILE_SIZE,
-                'y': item_y * Config.TILE_SIZE,
+                'x': item_x,
+                'y': item_y,
                 'duration': 10.0,
                 'collected': False
             })
             
-    def set_tile(self, x: int, y: int, tile_type: str):
-        """Set tile at position"""
+    def set_tile(self, x: int, y: int, tile_type: Optional[str]):
+        """Set tile at position (None clears it)"""
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.tiles[(x, y)] = Tile(x, y, tile_type)
+            self.tile_types[x, y] = get_tile_type_id(tile_type)
+            self._invalidate_tiles(x, x + 1, y, y + 1)
             
-    def get_tile(self, x: int, y: int) -> Optional[Tile]:
-        """Get tile at position"""
-        return self.tiles.get((x, y))
+    def fill_tiles(self, x: int, y: int, width: int, height: int, tile_type: Optional[str]):
+        """Set every tile of a rectangular block, clipped to the level (None clears it)"""
+        start_x = max(0, x)
+        end_x = min(self.width, x + width)
+        start_y = max(0, y)
+        end_y = min(self.height, y + height)
+        if start_x < end_x and start_y < end_y:
+            self.tile_types[start_x:end_x, start_y:end_y] = get_tile_type_id(tile_type)
+            self._invalidate_tiles(start_x, end_x, start_y, end_y)
+            
+    def fill_mask(self, mask: np.ndarray, tile_type: Optional[str], x: int = 0, y: int = 0):
+        """Set every tile where a boolean mask is True (None clears it)
+        
+        The mask is indexed [x, y] like tile_types and covers the block whose
+        top-left tile is (x, y); the block must lie inside the level.
+        """
+        width, height = mask.shape
+        self.tile_types[x:x + width, y:y + height][mask] = get_tile_type_id(tile_type)
+        self._invalidate_tiles(x, x + width, y, y + height)
         
-    def get_tile_at_pixel(self, pixel_x: float, pixel_y: float) -> Optional[Tile]:
+    def remove_tile(self, x: int, y: int):
+        """Clear tile at position"""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.tile_types[x, y] = 0
+            self._invalidate_tiles(x, x + 1, y, y + 1)
+            
+    def clear_tiles(self):
+        """Remove every tile"""
+        self.tile_types.fill(0)
+        self._chunks.clear()
+            
+    def get_tile(self, x: int, y: int) -> Optional[int]:
+        """Get the tile type id at position (None if empty or outside the level)"""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            tile_id = int(self.tile_types[x, y])
+            if tile_id:
+                return tile_id
+        return None
+        
+    def tile_rect(self, x: int, y: int) -> pygame.Rect:
+        """Get the world rectangle of the tile at position"""
+        shift = Config.TILE_SHIFT
+        tile_size = Config.TILE_SIZE
+        return pygame.Rect(x << shift, y << shift, tile_size, tile_size)
+        
+    def get_tile_at_pixel(self, pixel_x: float, pixel_y: float) -> Optional[int]:
         """Get tile at pixel coordinates"""
-        tile_x = int(pixel_x // Config.TILE_SIZE)
-        tile_y = int(pixel_y // Config.TILE_SIZE)
-        return self.get_tile(tile_x, tile_y)
+        shift = Config.TILE_SHIFT
+        return self.get_tile(math.floor(pixel_x) >> shift, math.floor(pixel_y) >> shift)
         
     def is_solid_at(self, x: int, y: int) -> bool:
         """Check if tile at position is solid"""
-        tile = self.get_tile(x, y)
-        return tile is not None and tile.solid
+        return 0 <= x < self.width and 0 <= y < self.height and bool(SOLID_LUT[self.tile_types[x, y]])
         
     def is_solid_at_pixel(self, pixel_x: float, pixel_y: float) -> bool:
         """Check if position in pixels is solid"""
-        tile_x = int(pixel_x // Config.TILE_SIZE)
-        tile_y = int(pixel_y // Config.TILE_SIZE)
-        return self.is_solid_at(tile_x, tile_y)
+        shift = Config.TILE_SHIFT
+        return self.is_solid_at(math.floor(pixel_x) >> shift, math.floor(pixel_y) >> shift)
         
     def is_solid_at_rect(self, rect: pygame.Rect) -> bool:
         """Check if any part of rectangle intersects solid tiles"""
-        start_x = int(rect.left // Config.TILE_SIZE)
-        end_x = int(rect.right // Config.TILE_SIZE)
-        start_y = int(rect.top // Config.TILE_SIZE)
-        end_y = int(rect.bottom // Config.TILE_SIZE)
-        
-        for x in range(start_x, end_x + 1):
-            for y in range(start_y, end_y + 1):
-                if self.is_solid_at(x, y):
-                    return True
-                    
-        return False
+        shift = Config.TILE_SHIFT
+        start_x = max(0, rect.left >> shift)
+        end_x = min(self.width, max(0, (rect.right >> shift) + 1))
+        start_y = max(0, rect.top >> shift)
+        end_y = min(self.height, max(0, (rect.bottom >> shift) + 1))
+        
+        # One slice lookup instead of a Python loop per covered tile
+        return bool(SOLID_LUT[self.tile_types[start_x:end_x, start_y:end_y]].any())
         
     def get_collision_rects(self, area_rect: pygame.Rect) -> List[pygame.Rect]:
         """Get all solid tile rectangles in the given area"""
-        collision_rects = []
-        
-        start_x = max(0, int(area_rect.left // Config.TILE_SIZE))
-        end_x = min(self.width, int(area_rect.right // Config.TILE_SIZE) + 1)
-        start_y = max(0, int(area_rect.top // Config.TILE_SIZE))
-        end_y = min(self.height, int(area_rect.bottom // Config.TILE_SIZE) + 1)
-        
-        for x in range(start_x, end_x):
-            for y in range(start_y, end_y):
-                tile = self.get_tile(x, y)
-                if tile and tile.solid:
-                    collision_rects.append(tile.get_rect())
+        tile_size = Config.TILE_SIZE
+        shift = Config.TILE_SHIFT
+        start_x = max(0, area_rect.left >> shift)
+        end_x = min(self.width, max(0, (area_rect.right >> shift) + 1))
+        start_y = max(0, area_rect.top >> shift)
+        end_y = min(self.height, max(0, (area_rect.bottom >> shift) + 1))
+        
+        # Only solid tiles reach Python, in the same x-major order as a nested loop
+        xs, ys = np.nonzero(SOLID_LUT[self.tile_types[start_x:end_x, start_y:end_y]])
+        return [pygame.Rect(x * tile_size, y * tile_size, tile_size, tile_size)
+                for x, y in zip((xs + start_x).tolist(), (ys + start_y).tolist())]
+        
+    @property
+    def collectibles(self) -> List[Dict[str, Any]]:
+        """Get all collectible items, uncollected first"""
+        return self._active + self._collected
+        
+    def add_collectible(self, item: Dict[str, Any]):
+        """Add a collectible item to the level"""
+        self._attach_collectible_rect(item)
+        if item.get('collected', False):
+            self._collected.append(item)
+        else:
+            self._active.append(item)
+            self._bucket_collectible(len(self._active) - 1, item)
+            
+    def set_collectibles(self, items: List[Dict[str, Any]]):
+        """Replace all collectible items and rebuild the collectible grid"""
+        self._active = []
+        self._collected = []
+        self._collectible_grid.clear()
+        for item in items:
+            self.add_collectible(item)
+                
+    def _attach_collectible_rect(self, item: Dict[str, Any]):
+        """Cache the item's world rect; 'x'/'y' stay as the saved position"""
+        tile_size = Config.TILE_SIZE
+        item['rect'] = pygame.Rect(item['x'], item['y'], tile_size, tile_size)
+                
+    def _collectible_cells(self, rect: pygame.Rect) -> List[Tuple[int, int]]:
+        """Get the collectible grid cells covered by a rectangle"""
+        cell = self._collectible_cell
+        return [(cx, cy)
+                for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1)
+                for cx in range(rect.left // cell, (rect.right - 1) // cell + 1)]
+        
+    def _bucket_collectible(self, index: int, item: Dict[str, Any]):
+        """Insert a collectible index in every grid cell its rectangle covers"""
+        item_rect = item['rect']
+        for key in self._collectible_cells(item_rect):
+            rects, indices = self._collectible_grid.setdefault(key, ([], []))
+            rects.append(item_rect)
+            indices.append(index)
+            
+    def _unbucket_collectible(self, index: int, item: Dict[str, Any]):
+        """Remove a collected item from the grid so it is never tested again"""
+        for key in self._collectible_cells(item['rect']):
+            bucket = self._collectible_grid.get(key)
+            if bucket and index in bucket[1]:
+                rects, indices = bucket
+                position = indices.index(index)
+                del rects[position]
+                del indices[position]
+                if not indices:
+                    del self._collectible_grid[key]
                     
-        return collision_rects
+    def _rebucket_collectible(self, old_index: int, new_index: int, item: Dict[str, Any]):
+        """Update the grid after an item moved to another slot of _active"""
+        for key in self._collectible_cells(item['rect']):
+            indices = self._collectible_grid[key][1]
+            indices[indices.index(old_index)] = new_index
+            
+    def _collect(self, index: int) -> Dict[str, Any]:
+        """Mark the item at an _active slot collected and swap-remove it"""
+        active = self._active
+        item = active[index]
+        item['collected'] = True
+        self._unbucket_collectible(index, item)
+        
+        last = active.pop()
+        if index < len(active):
+            active[index] = last
+            self._rebucket_collectible(len(active), index, last)
+        self._collected.append(item)
+        return item
         
     def check_collectible_collision(self, rect: pygame.Rect) -> List[Dict[str, Any]]:
         """Check collision with collectible items"""
         collected_items = []
         
-        for item in self.collectibles:
-            if item['collected']:
-                continue
-                
-            item_rect = pygame.Rect(item['x'], item['y'], Config.TILE_SIZE, Config.TILE_SIZE)
-            if rect.colliderect(item_rect):
-                item['collected'] = True
-                collected_items.append(item)
+        # Only items sharing a grid cell with rect can be touched; each cell is
+        # tested with one collidelistall call
+        grid = self._collectible_grid
+        hits = set()
+        for key in self._collectible_cells(rect):
+            bucket = grid.get(key)
+            if bucket:
+                rects, indices = bucket
+                hits.update(indices[hit] for hit in rect.collidelistall(rects))
                 
+        # Highest slot first: a swap-remove only moves the last item, which
+        # has then already been handled
+        for index in sorted(hits, reverse=True):
+            collected_items.append(self._collect(index))
+            
+        collected_items.reverse()
         return collected_items
         
     def damage_tile(self, x: int, y: int, damage: int) -> bool:
         """Damage a tile (for destructible tiles)"""
-        tile = self.get_tile(x, y)
-        if tile and tile.destructible:
+        if 0 <= x < self.width and 0 <= y < self.height and DESTRUCTIBLE_LUT[self.tile_types[x, y]]:
             # Remove destructible tile
-            del self.tiles[(x, y)]
+            self.tile_types[x, y] = 0
+            self._invalidate_tiles(x, x + 1, y, y + 1)
             return True
         return False
         
     def render(self, surface: pygame.Surface, camera_offset: Tuple[int, int]):
         """Render the level"""
-        # Calculate visible tile range
-        start_x = max(0, int(camera_offset[0] // Config.TILE_SIZE) - 1)
-        end_x = min(self.width, int((camera_offset[0] + Config.SCREEN_WIDTH) // Config.TILE_SIZE) + 2)
-        start_y = max(0, int(camera_offset[1] // Config.TILE_SIZE) - 1)
-        end_y = min(self.height, int((camera_offset[1] + Config.SCREEN_HEIGHT) // Config.TILE_SIZE) + 2)
+        # Camera position as whole pixels, shared by every layer below
+        camera_x = math.floor(camera_offset[0])
+        camera_y = math.floor(camera_offset[1])
         
         # Render background
         surface.fill(self.background_color)
         
-        # Render grid (debug)
+        # Render tiles - one batched blit of the chunks overlapping the screen
+        get_chunk = self._get_chunk
+        chunk_size = CHUNK_TILES * Config.TILE_SIZE
+        start_cx = max(0, camera_x // chunk_size)
+        end_cx = min((self.width - 1) // CHUNK_TILES, (camera_x + Config.SCREEN_WIDTH - 1) // chunk_size)
+        start_cy = max(0, camera_y // chunk_size)
+        end_cy = min((self.height - 1) // CHUNK_TILES, (camera_y + Config.SCREEN_HEIGHT - 1) // chunk_size)
+        
+        # Screen positions of the visible chunk columns and rows, one subtract each
+        screen_xs = (self._chunk_col_px[start_cx:max(0, end_cx + 1)] - camera_x).tolist()
+        screen_ys = (self._chunk_row_px[start_cy:max(0, end_cy + 1)] - camera_y).tolist()
+        surface.blits([(get_chunk(cx, cy), (screen_x, screen_y))
+                       for cy, screen_y in enumerate(screen_ys, start_cy)
+                       for cx, screen_x in enumerate(screen_xs, start_cx)], doreturn=False)
+        
+        # Render grid (debug, drawn over the tiles)
         if Config.DEBUG_DRAW_GRID:
-            self._render_grid(surface, camera_offset, start_x, end_x, start_y, end_y)
-            
-        # Render tiles
-        for x in range(start_x, end_x):
-            for y in range(start_y, end_y):
-                tile = self.get_tile(x, y)
-                if tile:
-                    self._render_tile(surface, tile, camera_offset)
+            self._render_grid(surface, camera_x, camera_y)
                     
         # Render collectibles
-        self._render_collectibles(surface, camera_offset)
-        
-    def _render_grid(self, surface: pygame.Surface, camera_offset: Tuple[int, int], 
-                    start_x: int, end_x: int, start_y: int, end_y: int):
-        """Render debug grid"""
-        grid_color = (40, 40, 40)
-        
-        # Vertical lines
-        for x in range(start_x, end_x + 1):
-            screen_x = x * Config.TILE_SIZE - camera_offset[0]
-            pygame.draw.line(surface, grid_color, 
-                           (screen_x, 0), (screen_x, Config.SCREEN_HEIGHT))
-                           
-        # Horizontal lines
-        for y in range(start_y, end_y + 1):
-            screen_y = y * Config.TILE_SIZE - camera_offset[1]
-            pygame.draw.line(surface, grid_color, 
-                           (0, screen_y), (Config.SCREEN_WIDTH, screen_y))
-                           
-    def _render_tile(self, surface: pygame.Surface, tile: Tile, camera_offset: Tuple[int, int]):
-        """Render individual tile"""
-        screen_x = tile.x * Config.TILE_SIZE - camera_offset[0]
-        screen_y = tile.y * Config.TILE_SIZE - camera_offset[1]
-        
-        # Skip if off-screen
-        if (screen_x < -Config.TILE_SIZE or screen_x > Config.SCREEN_WIDTH or
-            screen_y < -Config.TILE_SIZE or screen_y > Config.SCREEN_HEIGHT):
+        self._render_collectibles(surface, camera_x, camera_y)
+        
+    def _render_grid(self, surface: pygame.Surface, camera_x: int, camera_y: int):
+        """Render debug grid - one blit per line direction, clipped to the level's tile range"""
+        vertical_lines, horizontal_lines = self._get_grid_overlays()
+        tile_size = Config.TILE_SIZE
+        previous_clip = surface.get_clip()
+        
+        # Vertical lines, one per tile column boundary (0..width)
+        surface.set_clip(previous_clip.clip(
+            pygame.Rect(-camera_x, 0, self.width * tile_size + 1, Config.SCREEN_HEIGHT)))
+        surface.blit(vertical_lines, (-(camera_x % tile_size), 0))
+        
+        # Horizontal lines, one per tile row boundary (0..height)
+        surface.set_clip(previous_clip.clip(
+            pygame.Rect(0, -camera_y, Config.SCREEN_WIDTH, self.height * tile_size + 1)))
+        surface.blit(horizontal_lines, (0, -(camera_y % tile_size)))
+        
+        surface.set_clip(previous_clip)
+        
+    def _get_grid_overlays(self) -> Tuple[pygame.Surface, pygame.Surface]:
+        """Get the cached screen-sized grid line overlays, drawing them on first use"""
+        if self._grid_overlays is None:
+            grid_color = (40, 40, 40)
+            tile_size = Config.TILE_SIZE
+            width = Config.SCREEN_WIDTH
+            height = Config.SCREEN_HEIGHT
+            
+            # One tile wider/taller than the screen so any camera phase is covered
+            vertical_lines = pygame.Surface((width + tile_size, height), pygame.SRCALPHA)
+            for x in range(0, width + tile_size, tile_size):
+                pygame.draw.line(vertical_lines, grid_color, (x, 0), (x, height))
+            horizontal_lines = pygame.Surface((width, height + tile_size), pygame.SRCALPHA)
+            for y in range(0, height + tile_size, tile_size):
+                pygame.draw.line(horizontal_lines, grid_color, (0, y), (width, y))
+                
+            self._grid_overlays = (vertical_lines.convert_alpha(), horizontal_lines.convert_alpha())
+        return self._grid_overlays
+        
+    def _get_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """Get a pre-rendered chunk of tiles, drawing it on first use"""
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            tile_size = Config.TILE_SIZE
+            start_x = cx * CHUNK_TILES
+            start_y = cy * CHUNK_TILES
+            end_x = min(self.width, start_x + CHUNK_TILES)
+            end_y = min(self.height, start_y + CHUNK_TILES)
+            chunk = pygame.Surface(((end_x - start_x) * tile_size, (end_y - start_y) * tile_size)).convert()
+            chunk.fill(self.background_color)
+            
+            sprites = self._get_tile_sprites()
+            block = self.tile_types[start_x:end_x, start_y:end_y]
+            xs, ys = np.nonzero(block)
+            blits = [(sprites[tile_id], (x, y))
+                     for x, y, tile_id in zip((xs * tile_size).tolist(), (ys * tile_size).tolist(),
+                                              block[xs, ys].tolist())
+                     if sprites[tile_id] is not None]
+            chunk.blits(blits, doreturn=False)
+            self._chunks[(cx, cy)] = chunk
+        return chunk
+        
+    def _invalidate_tiles(self, start_x: int, end_x: int, start_y: int, end_y: int):
+        """Drop the pre-rendered chunks showing a block of tiles"""
+        if not self._chunks:
             return
             
-        tile_rect = pygame.Rect(screen_x, screen_y, Config.TILE_SIZE, Config.TILE_SIZE)
-        
-        # Render based on tile type
-        if tile.tile_type == 'ground':
-            pygame.draw.rect(surface, Config.BROWN, tile_rect)
-            pygame.draw.rect(surface, Config.DARK_BROWN, tile_rect, 2)
-        elif tile.tile_type == 'wall':
-            pygame.draw.rect(surface, Config.GRAY, tile_rect)
-            pygame.draw.rect(surface, Config.DARK_GRAY, tile_rect, 2)
-        elif tile.tile_type == 'platform':
-            pygame.draw.rect(surface, Config.BLUE, tile_rect)
-            pygame.draw.rect(surface, Config.DARK_BLUE, tile_rect, 2)
-        elif tile.tile_type == 'crate':
-            pygame.draw.rect(surface, Config.BROWN, tile_rect)
-            pygame.draw.rect(surface, Config.BLACK, tile_rect, 2)
-            # Draw X pattern
-            pygame.draw.line(surface, Config.BLACK, 
-                           (screen_x, screen_y), 
-                           (screen_x + Config.TILE_SIZE, screen_y + Config.TILE_SIZE), 2)
-            pygame.draw.line(surface, Config.BLACK, 
-                           (screen_x + Config.TILE_SIZE, screen_y), 
-                           (screen_x, screen_y + Config.TILE_SIZE), 2)
-                           
-    def _render_collectibles(self, surface: pygame.Surface, camera_offset: Tuple[int, int]):
-        """Render collectible items"""
-        for item in self.collectibles:
-            if item['collected']:
-                continue
+        for cy in range(start_y // CHUNK_TILES, (end_y - 1) // CHUNK_TILES + 1):
+            for cx in range(start_x // CHUNK_TILES, (end_x - 1) // CHUNK_TILES + 1):
+                self._chunks.pop((cx, cy), None)
+        
+    @classmethod
+    def _get_tile_sprites(cls) -> List[Optional[pygame.Surface]]:
+        """Get the cached tile sprites indexed by tile type id, drawing them on first use"""
+        if cls._tile_sprites is None:
+            tile_size = Config.TILE_SIZE
+            tile_rect = pygame.Rect(0, 0, tile_size, tile_size)
+            
+            def paint(fill_color, border_color) -> pygame.Surface:
+                sprite = pygame.Surface(tile_rect.size)
+                sprite.fill(fill_color)
+                pygame.draw.rect(sprite, border_color, tile_rect, 2)
+                return sprite
                 
-            screen_x = item['x'] - camera_offset[0]
-            screen_y = item['y'] - camera_offset[1]
+            crate = paint(Config.BROWN, Config.BLACK)
+            # Draw X pattern
+            pygame.draw.line(crate, Config.BLACK, (0, 0), (tile_size, tile_size), 2)
+            pygame.draw.line(crate, Config.BLACK, (tile_size, 0), (0, tile_size), 2)
             
-            # Skip if off-screen
-            if (screen_x < -Config.TILE_SIZE or screen_x > Config.SCREEN_WIDTH or
-                screen_y < -Config.TILE_SIZE or screen_y > Config.SCREEN_HEIGHT):
+            # Types without a look (barrels, doors, ...) stay None and are not drawn
+            sprites: List[Optional[pygame.Surface]] = [None] * 256
+            sprites[TILE_ID['ground']] = paint(Config.BROWN, Config.DARK_BROWN).convert()
+            sprites[TILE_ID['wall']] = paint(Config.GRAY, Config.DARK_GRAY).convert()
+            sprites[TILE_ID['platform']] = paint(Config.BLUE, Config.DARK_BLUE).convert()
+            sprites[TILE_ID['crate']] = crate.convert()
+            cls._tile_sprites = sprites
+        return cls._tile_sprites
+        
+    def _render_collectibles(self, surface: pygame.Surface, camera_x: int, camera_y: int):
+        """Render collectible items with a single Surface.blits call"""
+        sprites = self._get_item_sprites()
+        min_x = camera_x - Config.TILE_SIZE
+        max_x = camera_x + Config.SCREEN_WIDTH
+        min_y = camera_y - Config.TILE_SIZE
+        max_y = camera_y + Config.SCREEN_HEIGHT
+        
+        blits = []
+        for item in self._active:
+            # Skip if off-screen or of a type with no sprite
+            item_x, item_y = item['rect'].topleft
+            sprite = sprites.get(item['type'])
+            if sprite is None or not (min_x <= item_x <= max_x and min_y <= item_y <= max_y):
                 continue
                 
-            item_rect = pygame.Rect(screen_x, screen_y, Config.TILE_SIZE, Config.TILE_SIZE)
+            blits.append((sprite, (item_x - camera_x, item_y - camera_y)))
             
-            # Render based on item type
-            if item['type'] == 'health_pack':
-                pygame.draw.rect(surface, Config.RED, item_rect)
-                pygame.draw.rect(surface, Config.WHITE, item_rect, 2)
-                # Draw cross
-                center_x = screen_x + Config.TILE_SIZE // 2
-                center_y = screen_y + Config.TILE_SIZE // 2
-                pygame.draw.line(surface, Config.WHITE, 
-                               (center_x - 8, center_y), (center_x + 8, center_y), 3)
-                pygame.draw.line(surface, Config.WHITE, 
-                               (center_x, center_y - 8), (center_x, center_y + 8), 3)
-                               
-            elif item['type'] == 'ammo':
-                pygame.draw.rect(surface, Config.YELLOW, item_rect)
-                pygame.draw.rect(surface, Config.BLACK, item_rect, 2)
-                
-            elif item['type'] == 'powerup':
-                pygame.draw.rect(surface, Config.MAGENTA, item_rect)
-                pygame.draw.rect(surface, Config.WHITE, item_rect, 2)
-                
+        if blits:
+            surface.blits(blits, doreturn=False)
+            
+    @classmethod
+    def _get_item_sprites(cls) -> Dict[str, pygame.Surface]:
+        """Get the cached collectible sprites by item type, drawing them on first use"""
+        if cls._item_sprites is None:
+            tile_size = Config.TILE_SIZE
+            tile_rect = pygame.Rect(0, 0, tile_size, tile_size)
+            center = tile_size // 2
+            
+            health_pack = pygame.Surface(tile_rect.size)
+            health_pack.fill(Config.RED)
+            pygame.draw.rect(health_pack, Config.WHITE, tile_rect, 2)
+            # Draw cross
+            pygame.draw.line(health_pack, Config.WHITE, (center - 8, center), (center + 8, center), 3)
+            pygame.draw.line(health_pack, Config.WHITE, (center, center - 8), (center, center + 8), 3)
+            
+            ammo = pygame.Surface(tile_rect.size)
+            ammo.fill(Config.YELLOW)
+            pygame.draw.rect(ammo, Config.BLACK, tile_rect, 2)
+            
+            powerup = pygame.Surface(tile_rect.size)
+            powerup.fill(Config.MAGENTA)
+            pygame.draw.rect(powerup, Config.WHITE, tile_rect, 2)
+            
+            cls._item_sprites = {
+                'health_pack': health_pack.convert(),
+                'ammo': ammo.convert(),
+                'powerup': powerup.convert()
+            }
+        return cls._item_sprites
+        
+    def add_spawn_point(self, x: int, y: int):
+        """Add a player spawn point at tile position"""
+        shift = Config.TILE_SHIFT
+        self._spawn_xs = np.append(self._spawn_xs, np.int32(x << shift))
+        self._spawn_ys = np.append(self._spawn_ys, np.int32(y << shift))
+        
+    def add_enemy_spawn(self, x: int, y: int, enemy_type: str):
+        """Add an enemy spawn point at tile position"""
+        shift = Config.TILE_SHIFT
+        self._enemy_spawn_xs = np.append(self._enemy_spawn_xs, np.int32(x << shift))
+        self._enemy_spawn_ys = np.append(self._enemy_spawn_ys, np.int32(y << shift))
+        self._enemy_spawn_types.append(enemy_type)
+        self._enemy_spawns = None
+        
+    def clear_spawns(self):
+        """Remove every player and enemy spawn point"""
+        self._spawn_xs = self._spawn_xs[:0]
+        self._spawn_ys = self._spawn_ys[:0]
+        self._enemy_spawn_xs = self._enemy_spawn_xs[:0]
+        self._enemy_spawn_ys = self._enemy_spawn_ys[:0]
+        self._enemy_spawn_types.clear()
+        self._enemy_spawns = None
+        
+    def get_spawn_points(self) -> List[Tuple[int, int]]:
+        """Get all player spawn points (pixels)"""
+        return list(zip(self._spawn_xs.tolist(), self._spawn_ys.tolist()))
+        
     def get_spawn_point(self) -> Tuple[int, int]:
         """Get player spawn point"""
-        if self.spawn_points:
-            spawn = random.choice(self.spawn_points)
-            return (spawn[0] * Config.TILE_SIZE, spawn[1] * Config.TILE_SIZE)
+        if len(self._spawn_xs):
+            index = self._rng.randrange(len(self._spawn_xs))
+            return (int(self._spawn_xs[index]), int(self._spawn_ys[index]))
         return (Config.TILE_SIZE * 2, Config.TILE_SIZE * (self.height - 5))
         
     def get_enemy_spawns(self) -> List[Tuple[int, int, str]]:
-        """Get enemy spawn points"""
-        spawns = []
-        for spawn in self.enemy_spawns:
-            spawns.append((spawn[0] * Config.TILE_SIZE, spawn[1] * Config.TILE_SIZE, spawn[2]))
-        return spawns
\ No newline at end of file
+        """Get enemy spawn points (pixels, enemy type)"""
+        if self._enemy_spawns is None:
+            self._enemy_spawns = list(zip(self._enemy_spawn_xs.tolist(), self._enemy_spawn_ys.tolist(),
+                                          self._enemy_spawn_types))
+        return self._enemy_spawns
\ No newline at end of file
@@ -8,10 +8,10 @@ PIETRO's generator creates infinite worlds for endless adventures!
 """
 
 import random
-import math
+import numpy as np
 from typing import List, Tuple, Dict, Any
 from ...core.config import Config
-from .level import Level, Tile
+from .level import Level, SOLID_LUT
 
 class LevelGenerator:
     """Procedural level generator"""
@@ -31,10 +31,13 @@ class LevelGenerator:
         self.collectible_density = 0.2
         self.secret_chance = 0.1
         
+        # Private random stream, shared with the levels it builds
+        self._rng = random.Random()
+        
     def generate_level(self, difficulty: int = 1, seed: int = None) -> Level:
         """Generate a new level"""
         if seed is not None:
-            random.seed(seed)
+            self._rng.seed(seed)
             
         # Determine level size based on difficulty
         width = self.min_width + (difficulty * 5)
@@ -43,8 +46,8 @@ class LevelGenerator:
         height = min(height, self.max_height)
         
         # Create level
-        level = Level(width, height, self.asset_manager)
-        level.tiles.clear()  # Clear default tiles
+        level = Level(width, height, self.asset_manager, self._rng)
+        level.clear_tiles()  # Clear default tiles
         
         # Generate level structure
         self._generate_terrain(level, difficulty)
@@ -52,44 +55,37 @@ class LevelGenerator:
         self._generate_structures(level, difficulty)
         self._generate_secrets(level, difficulty)
         self._place_spawns(level, difficulty)
-        self._place_collectibles(level, difficulty)
-        self._place_enemies(level, difficulty)
+        
+        # Item and enemy placement share one scan of the finished tile grid
+        standing_cells = self._find_standing_cells(level)
+        self._place_collectibles(level, difficulty, standing_cells)
+        self._place_enemies(level, difficulty, standing_cells)
         
         return level
         
     def _generate_terrain(self, level: Level, difficulty: int):
         """Generate basic terrain (ground, walls, ceiling)"""
-        # Create ground with variation
+        # Create ground with variation - top ground row per column, then every
+        # cell at or below it in one masked assignment
         ground_height = level.height - 4
         ground_variation = 2
         
-        for x in range(level.width):
-            # Vary ground height
-            variation = int(math.sin(x * 0.3) * ground_variation)
-            current_ground = ground_height + variation
-            
-            # Fill ground
-            for y in range(current_ground, level.height):
-                if y == current_ground:
-                    level.set_tile(x, y, 'ground')
-                else:
-                    level.set_tile(x, y, 'ground')
+        variation = (np.sin(np.arange(level.width) * 0.3) * ground_variation).astype(np.int32)
+        ground_rows = ground_height + variation
+        level.fill_mask(np.arange(level.height) >= ground_rows[:, None], 'ground')
                     
         # Create walls
-        for y in range(level.height):
-            level.set_tile(0, y, 'wall')
-            level.set_tile(level.width - 1, y, 'wall')
+        level.fill_tiles(0, 0, 1, level.height, 'wall')
+        level.fill_tiles(level.width - 1, 0, 1, level.height, 'wall')
             
         # Create ceiling in some areas
         if difficulty >= 2:
-            ceiling_sections = random.randint(1, 3)
+            ceiling_sections = self._rng.randrange(1, 4)
             for _ in range(ceiling_sections):
-                start_x = random.randint(5, level.width - 15)
-                length = random.randint(5, 10)
+                start_x = self._rng.randrange(5, level.width - 14)
+                length = self._rng.randrange(5, 11)
                 
-                for x in range(start_x, min(start_x + length, level.width - 1)):
-                    level.set_tile(x, 0, 'wall')
-                    level.set_tile(x, 1, 'wall')
+                level.fill_tiles(start_x, 0, min(length, level.width - 1 - start_x), 2, 'wall')
                     
     def _generate_platforms(self, level: Level, difficulty: int):
         """Generate platforms throughout the level"""
@@ -98,38 +94,35 @@ class LevelGenerator:
         
         for _ in range(platform_count):
             # Random platform position
-            platform_x = random.randint(3, level.width - 8)
-            platform_y = random.randint(5, ground_y - 3)
-            platform_length = random.randint(2, 6)
+            platform_x = self._rng.randrange(3, level.width - 7)
+            platform_y = self._rng.randrange(5, ground_y - 2)
+            platform_length = self._rng.randrange(2, 7)
             
             # Check if area is clear
-            clear = True
-            for i in range(platform_length):
-                if level.get_tile(platform_x + i, platform_y):
-                    clear = False
-                    break
-                    
-            if clear:
+            if not level.tile_types[platform_x:platform_x + platform_length, platform_y].any():
                 # Create platform
-                for i in range(platform_length):
-                    if platform_x + i < level.width - 1:
-                        level.set_tile(platform_x + i, platform_y, 'platform')
+                level.fill_tiles(platform_x, platform_y,
+                                 min(platform_length, level.width - 1 - platform_x), 1, 'platform')
                         
                 # Add support pillars occasionally
-                if random.random() < 0.3:
+                if self._rng.random() < 0.3:
                     support_x = platform_x + platform_length // 2
-                    for y in range(platform_y + 1, ground_y):
-                        if not level.get_tile(support_x, y):
-                            level.set_tile(support_x, y, 'wall')
-                        else:
-                            break
-                            
+                    self._create_pillar(level, support_x, platform_y + 1, ground_y)
+                    
+    def _create_pillar(self, level: Level, x: int, top: int, bottom: int):
+        """Fill a wall column down from top until the first tile (or bottom)"""
+        column = level.tile_types[x, top:bottom]
+        filled = np.flatnonzero(column)
+        length = int(filled[0]) if len(filled) else len(column)
+        level.fill_tiles(x, top, 1, length, 'wall')
+        
+
     def _generate_structures(self, level: Level, difficulty: int):
         """Generate special structures (stairs, towers, etc.)"""
-        structure_count = random.randint(1, 3)
+        structure_count = self._rng.randrange(1, 4)
         
         for _ in range(structure_count):
-            structure_type = random.choice(['stairs', 'tower', 'bridge', 'maze'])
+            structure_type = self._rng.choice(['stairs', 'tower', 'bridge', 'maze'])
             
             if structure_type == 'stairs':
                 self._create_stairs(level)
@@ -142,77 +135,68 @@ class LevelGenerator:
                 
     def _create_stairs(self, level: Level):
         """Create stair structure"""
-        start_x = random.randint(5, level.width - 15)
+        start_x = self._rng.randrange(5, level.width - 14)
         start_y = level.height - 5
-        stair_height = random.randint(4, 8)
-        going_up = random.choice([True, False])
+        stair_height = self._rng.randrange(4, 9)
+        going_up = self._rng.choice([True, False])
         
         for i in range(stair_height):
             step_y = start_y - i if going_up else start_y + i
-            if 0 < step_y < level.height - 1:
-                # Create step
-                for j in range(i + 1):
-                    step_x = start_x + (i if going_up else -i)
-                    if 0 < step_x < level.width - 1:
-                        level.set_tile(step_x, step_y - j, 'platform')
+            step_x = start_x + (i if going_up else -i)
+            if 0 < step_y < level.height - 1 and 0 < step_x < level.width - 1:
+                # Create step (a column of i + 1 tiles ending at step_y)
+                level.fill_tiles(step_x, step_y - i, 1, i + 1, 'platform')
                         
     def _create_tower(self, level: Level):
         """Create tower structure"""
-        tower_x = random.randint(8, level.width - 8)
-        tower_height = random.randint(6, 12)
-        tower_width = random.randint(3, 5)
+        tower_x = self._rng.randrange(8, level.width - 7)
+        tower_height = self._rng.randrange(6, 13)
+        tower_width = self._rng.randrange(3, 6)
         
         ground_y = level.height - 4
         tower_base = ground_y - tower_height
         
         if tower_base > 2:
             # Create tower walls
-            for y in range(tower_base, ground_y):
-                level.set_tile(tower_x, y, 'wall')
-                level.set_tile(tower_x + tower_width - 1, y, 'wall')
+            level.fill_tiles(tower_x, tower_base, 1, tower_height, 'wall')
+            level.fill_tiles(tower_x + tower_width - 1, tower_base, 1, tower_height, 'wall')
                 
             # Create tower floors
             floor_count = tower_height // 4
             for i in range(1, floor_count):
-                floor_y = tower_base + (i * 4)
-                for x in range(tower_x, tower_x + tower_width):
-                    level.set_tile(x, floor_y, 'platform')
+                level.fill_tiles(tower_x, tower_base + (i * 4), tower_width, 1, 'platform')
                     
             # Create tower top
-            for x in range(tower_x, tower_x + tower_width):
-                level.set_tile(x, tower_base, 'wall')
+            level.fill_tiles(tower_x, tower_base, tower_width, 1, 'wall')
                 
     def _create_bridge(self, level: Level):
         """Create bridge between platforms"""
-        bridge_y = random.randint(8, level.height - 8)
-        bridge_start = random.randint(5, level.width // 2)
-        bridge_end = random.randint(level.width // 2, level.width - 5)
+        bridge_y = self._rng.randrange(8, level.height - 7)
+        bridge_start = self._rng.randrange(5, level.width // 2 + 1)
+        bridge_end = self._rng.randrange(level.width // 2, level.width - 4)
         
         # Create bridge
-        for x in range(bridge_start, bridge_end):
-            level.set_tile(x, bridge_y, 'platform')
+        level.fill_tiles(bridge_start, bridge_y, bridge_end - bridge_start, 1, 'platform')
             
         # Add support pillars
         pillar_spacing = 6
         for x in range(bridge_start, bridge_end, pillar_spacing):
-            for y in range(bridge_y + 1, level.height - 1):
-                if level.get_tile(x, y):
-                    break
-                level.set_tile(x, y, 'wall')
+            self._create_pillar(level, x, bridge_y + 1, level.height - 1)
                 
     def _create_maze_section(self, level: Level):
         """Create small maze section"""
-        maze_x = random.randint(10, level.width - 20)
-        maze_y = random.randint(5, level.height - 15)
+        maze_x = self._rng.randrange(10, level.width - 19)
+        maze_y = self._rng.randrange(5, level.height - 14)
         maze_width = 10
         maze_height = 8
         
-        # Create maze walls
-        for x in range(maze_x, maze_x + maze_width):
-            for y in range(maze_y, maze_y + maze_height):
-                if (x - maze_x) % 2 == 0 or (y - maze_y) % 2 == 0:
-                    if random.random() < 0.7:  # 70% chance for wall
-                        level.set_tile(x, y, 'wall')
+        # Create maze walls - on every even row and column of the section, with
+        # a 70% chance per cell drawn in one go from a stream seeded by ours
+        np_rng = np.random.default_rng(self._rng.getrandbits(64))
+        xs = np.arange(maze_width)[:, None]
+        ys = np.arange(maze_height)
+        lattice = (xs % 2 == 0) | (ys % 2 == 0)
+        level.fill_mask(lattice & (np_rng.random((maze_width, maze_height)) < 0.7), 'wall', maze_x, maze_y)
                         
         # Ensure entrance and exit
         level.set_tile(maze_x, maze_y + maze_height // 2, None)
@@ -220,10 +204,10 @@ class LevelGenerator:
         
     def _generate_secrets(self, level: Level, difficulty: int):
         """Generate secret areas and passages"""
-        secret_count = random.randint(1, 2) if difficulty >= 2 else 0
+        secret_count = self._rng.randrange(1, 3) if difficulty >= 2 else 0
         
         for _ in range(secret_count):
-            secret_type = random.choice(['hidden_room', 'secret_passage', 'treasure_room'])
+            secret_type = self._rng.choice(['hidden_room', 'secret_passage', 'treasure_room'])
             
             if secret_type == 'hidden_room':
                 self._create_hidden_room(level)
@@ -234,31 +218,26 @@ class LevelGenerator:
                 
     def _create_hidden_room(self, level: Level):
         """Create hidden room behind wall"""
-        room_x = random.randint(5, level.width - 10)
-        room_y = random.randint(5, level.height - 10)
-        room_width = random.randint(4, 6)
-        room_height = random.randint(3, 5)
+        room_x = self._rng.randrange(5, level.width - 9)
+        room_y = self._rng.randrange(5, level.height - 9)
+        room_width = self._rng.randrange(4, 7)
+        room_height = self._rng.randrange(3, 6)
         
         # Clear room area
-        for x in range(room_x, room_x + room_width):
-            for y in range(room_y, room_y + room_height):
-                level.tiles.pop((x, y), None)
+        level.fill_tiles(room_x, room_y, room_width, room_height, None)
                 
         # Create room walls
-        for x in range(room_x, room_x + room_width):
-            level.set_tile(x, room_y, 'wall')
-            level.set_tile(x, room_y + room_height - 1, 'wall')
-            
-        for y in range(room_y, room_y + room_height):
-            level.set_tile(room_x, y, 'wall')
-            level.set_tile(room_x + room_width - 1, y, 'wall')
+        level.fill_tiles(room_x, room_y, room_width, 1, 'wall')
+        level.fill_tiles(room_x, room_y + room_height - 1, room_width, 1, 'wall')
+        level.fill_tiles(room_x, room_y, 1, room_height, 'wall')
+        level.fill_tiles(room_x + room_width - 1, room_y, 1, room_height, 'wall')
             
         # Create secret entrance
-        entrance_side = random.choice(['left', 'right', 'top', 'bottom'])
+        entrance_side = self._rng.choice(['left', 'right', 'top', 'bottom'])
         if entrance_side == 'left':
-            level.tiles.pop((room_x, room_y + room_height // 2), None)
+            level.remove_tile(room_x, room_y + room_height // 2)
         elif entrance_side == 'right':
-            level.tiles.pop((room_x + room_width - 1, room_y + room_height // 2), None)
+            level.remove_tile(room_x + room_width - 1, room_y + room_height // 2)
             
         # Add secret marker
         level.secrets.append({
@@ -271,37 +250,31 @@ class LevelGenerator:
         
     def _create_secret_passage(self, level: Level):
         """Create secret passage through walls"""
-        passage_y = random.randint(5, level.height - 5)
-        passage_start = random.randint(5, level.width // 2)
-        passage_end = random.randint(level.width // 2, level.width - 5)
+        passage_y = self._rng.randrange(5, level.height - 4)
+        passage_start = self._rng.randrange(5, level.width // 2 + 1)
+        passage_end = self._rng.randrange(level.width // 2, level.width - 4)
         
         # Create hidden passage
-        for x in range(passage_start, passage_end):
-            level.tiles.pop((x, passage_y), None)
-            level.tiles.pop((x, passage_y + 1), None)
+        level.fill_tiles(passage_start, passage_y, passage_end - passage_start, 2, None)
             
     def _create_treasure_room(self, level: Level):
         """Create treasure room with valuable items"""
-        room_x = random.randint(8, level.width - 12)
-        room_y = random.randint(8, level.height - 8)
+        room_x = self._rng.randrange(8, level.width - 11)
+        room_y = self._rng.randrange(8, level.height - 7)
         room_size = 4
         
-        # Create room
-        for x in range(room_x, room_x + room_size):
-            for y in range(room_y, room_y + room_size):
-                if x == room_x or x == room_x + room_size - 1 or y == room_y or y == room_y + room_size - 1:
-                    level.set_tile(x, y, 'wall')
-                else:
-                    level.tiles.pop((x, y), None)
+        # Create room (wall border around an empty interior)
+        level.fill_tiles(room_x, room_y, room_size, room_size, 'wall')
+        level.fill_tiles(room_x + 1, room_y + 1, room_size - 2, room_size - 2, None)
                     
         # Create entrance
-        level.tiles.pop((room_x + room_size // 2, room_y + room_size - 1), None)
+        level.remove_tile(room_x + room_size // 2, room_y + room_size - 1)
         
         # Add treasure
         treasure_x = (room_x + room_size // 2) * Config.TILE_SIZE
         treasure_y = (room_y + room_size // 2) * Config.TILE_SIZE
         
-        level.collectibles.append({
+        level.add_collectible({
             'type': 'powerup',
             'subtype': 'mega_health',
             'x': treasure_x,
@@ -313,43 +286,45 @@ class LevelGenerator:
     def _place_spawns(self, level: Level, difficulty: int):
         """Place player and enemy spawn points"""
         # Clear existing spawns
-        level.spawn_points.clear()
-        level.enemy_spawns.clear()
-        
-        # Find suitable spawn locations
-        spawn_candidates = []
-        
-        for x in range(2, level.width - 2):
-            for y in range(2, level.height - 2):
-                # Check if position is clear and has ground below
-                if (not level.get_tile(x, y) and 
-                    not level.get_tile(x, y - 1) and 
-                    level.is_solid_at(x, y + 1)):
-                    spawn_candidates.append((x, y))
+        level.clear_spawns()
+        
+        # Find suitable spawn locations - clear cells with a clear cell above
+        # and ground below, in x-major order
+        empty = level.tile_types == 0
+        solid = SOLID_LUT[level.tile_types]
+        clear = (empty[2:level.width - 2, 2:level.height - 2] &
+                 empty[2:level.width - 2, 1:level.height - 3] &
+                 solid[2:level.width - 2, 3:level.height - 1])
+        xs, ys = np.nonzero(clear)
+        spawn_candidates = list(zip((xs + 2).tolist(), (ys + 2).tolist()))
                     
         # Place player spawn (prefer left side)
         player_spawns = [pos for pos in spawn_candidates if pos[0] < level.width // 3]
         if player_spawns:
-            level.spawn_points.append(random.choice(player_spawns))
+            level.add_spawn_point(*self._rng.choice(player_spawns))
         elif spawn_candidates:
-            level.spawn_points.append(spawn_candidates[0])
+            level.add_spawn_point(*spawn_candidates[0])
             
-    def _place_collectibles(self, level: Level, difficulty: int):
+    def _find_standing_cells(self, level: Level) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the inner cells that are clear with a solid tile below, as x and y arrays in x-major order"""
+        clear = ((level.tile_types[1:level.width - 1, 1:level.height - 1] == 0) &
+                 SOLID_LUT[level.tile_types[1:level.width - 1, 2:level.height]])
+        xs, ys = np.nonzero(clear)
+        return xs + 1, ys + 1
+        
+    def _place_collectibles(self, level: Level, difficulty: int,
+                            standing_cells: Tuple[np.ndarray, np.ndarray]):
         """Place collectible items"""
-        level.collectibles.clear()
+        level.set_collectibles([])
         
         collectible_count = int(level.width * level.height * self.collectible_density)
         
         # Find suitable positions
-        positions = []
-        for x in range(1, level.width - 1):
-            for y in range(1, level.height - 1):
-                if (not level.get_tile(x, y) and 
-                    level.is_solid_at(x, y + 1)):
-                    positions.append((x, y))
+        xs, ys = standing_cells
+        positions = list(zip(xs.tolist(), ys.tolist()))
                     
         # Place collectibles
-        random.shuffle(positions)
+        self._rng.shuffle(positions)
         
         for i, pos in enumerate(positions[:collectible_count]):
             item_type = self._choose_collectible_type(difficulty)
@@ -363,7 +338,7 @@ class LevelGenerator:
             
             # Add type-specific properties
             collectible.update(item_type)
-            level.collectibles.append(collectible)
+            level.add_collectible(collectible)
             
     def _choose_collectible_type(self, difficulty: int) -> Dict[str, Any]:
         """Choose collectible type based on difficulty"""
@@ -385,35 +360,33 @@ class LevelGenerator:
                 {'type': 'powerup', 'subtype': 'invincibility', 'duration': 5.0},
             ])
             
-        return random.choice(types)
+        return self._rng.choice(types)
         
-    def _place_enemies(self, level: Level, difficulty: int):
+    def _place_enemies(self, level: Level, difficulty: int,
+                       standing_cells: Tuple[np.ndarray, np.ndarray]):
         """Place enemy spawn points"""
         enemy_count = int(level.width * level.height * self.enemy_density * difficulty)
         
         # Find suitable positions (away from player spawn)
-        player_spawn = level.spawn_points[0] if level.spawn_points else (5, 5)
-        
-        positions = []
-        for x in range(1, level.width - 1):
-            for y in range(1, level.height - 1):
-                if (not level.get_tile(x, y) and 
-                    level.is_solid_at(x, y + 1) and
-                    abs(x - player_spawn[0]) > 5):  # Keep distance from player
-                    positions.append((x, y))
+        spawn_points = level.get_spawn_points()
+        player_spawn_x = spawn_points[0][0] >> Config.TILE_SHIFT if spawn_points else 5
+        
+        xs, ys = standing_cells
+        away = np.abs(xs - player_spawn_x) > 5  # Keep distance from player
+        positions = list(zip(xs[away].tolist(), ys[away].tolist()))
                     
         # Place enemies
-        random.shuffle(positions)
+        self._rng.shuffle(positions)
         
         for i, pos in enumerate(positions[:enemy_count]):
             enemy_type = self._choose_enemy_type(difficulty)
-            level.enemy_spawns.append((pos[0], pos[1], enemy_type))
+            level.add_enemy_spawn(pos[0], pos[1], enemy_type)
             
     def _choose_enemy_type(self, difficulty: int) -> str:
         """Choose enemy type based on difficulty"""
         if difficulty == 1:
-            return random.choice(['standard', 'standard', 'mutant'])
+            return self._rng.choice(['standard', 'standard', 'mutant'])
         elif difficulty == 2:
-            return random.choice(['standard', 'standard', 'mutant', 'robot'])
+            return self._rng.choice(['standard', 'standard', 'mutant', 'robot'])
         else:
-            return random.choice(['standard', 'mutant', 'robot', 'mercenary'])
\ No newline at end of file
+            return self._rng.choice(['standard', 'mutant', 'robot', 'mercenary'])
\ No newline at end of file
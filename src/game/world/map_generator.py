@@ -1,5 +1,5 @@
 import random
-from typing import List, Tuple
+import numpy as np
 from .tilemap import Tilemap, TileLayer, TileType
 from .autotiling import AutotileType
 
@@ -36,62 +36,52 @@ class MapGenerator:
         
         print("Stanza di test generata con successo!")
     
-    def _create_floor_pattern(self, width: int, height: int) -> List[List[bool]]:
+    def _create_floor_pattern(self, width: int, height: int) -> np.ndarray:
         """Crea pattern booleano per i pavimenti (area interna)"""
-        pattern = [[False for _ in range(width)] for _ in range(height)]
+        pattern = np.zeros((height, width), dtype=bool)
         
         # Riempi l'area interna (lasciando spazio per i muri)
-        for y in range(1, height - 1):
-            for x in range(1, width - 1):
-                pattern[y][x] = True
+        pattern[1:height - 1, 1:width - 1] = True
         
         return pattern
     
-    def _create_wall_pattern(self, width: int, height: int) -> List[List[bool]]:
+    def _create_wall_pattern(self, width: int, height: int) -> np.ndarray:
         """Crea pattern booleano per i muri (perimetro)"""
-        pattern = [[False for _ in range(width)] for _ in range(height)]
+        pattern = np.zeros((height, width), dtype=bool)
         
         # Muri perimetrali
-        for x in range(width):
-            pattern[0][x] = True          # Muro superiore
-            pattern[height-1][x] = True   # Muro inferiore
-        
-        for y in range(height):
-            pattern[y][0] = True          # Muro sinistro
-            pattern[y][width-1] = True    # Muro destro
+        pattern[0, :] = True          # Muro superiore
+        pattern[height-1, :] = True   # Muro inferiore
+        pattern[:, 0] = True          # Muro sinistro
+        pattern[:, width-1] = True    # Muro destro
         
         # Aggiungi alcuni muri interni per varietà
         # Pilastro centrale
         center_x, center_y = width // 2, height // 2
         if center_x > 2 and center_y > 2:
-            pattern[center_y][center_x] = True
-            pattern[center_y][center_x + 1] = True
-            pattern[center_y + 1][center_x] = True
-            pattern[center_y + 1][center_x + 1] = True
+            pattern[center_y:center_y + 2, center_x:center_x + 2] = True
         
         # Alcuni muri sparsi
         for _ in range(3):
             x = random.randint(5, width - 6)
             y = random.randint(3, height - 4)
-            pattern[y][x] = True
-            pattern[y][x + 1] = True
+            pattern[y, x:x + 2] = True
         
         return pattern
     
-    def _apply_walls_over_floor(self, wall_pattern: List[List[bool]], width: int, height: int):
+    def _apply_walls_over_floor(self, wall_pattern: np.ndarray, width: int, height: int):
         """Applica i muri sopra i pavimenti dove necessario"""
         # Applica autotiling per muri
         self.tilemap.apply_autotiling(TileLayer.SOLID, AutotileType.WALLS, wall_pattern)
         
         # Sovrascrive manualmente i tile dove ci sono muri
-        for y in range(height):
-            for x in range(width):
-                if wall_pattern[y][x]:
-                    # Usa tile muro base per ora (l'autotiling ha già impostato le coordinate corrette)
-                    current_tile = self.tilemap.get_tile(TileLayer.SOLID, x, y)
-                    if current_tile:
-                        current_tile.tile_id = TileType.WALL_BASIC
-                        current_tile.solid = True
+        ys, xs = np.nonzero(wall_pattern)
+        for y, x in zip(ys.tolist(), xs.tolist()):
+            # Usa tile muro base per ora (l'autotiling ha già impostato le coordinate corrette)
+            current_tile = self.tilemap.get_tile(TileLayer.SOLID, x, y)
+            if current_tile:
+                current_tile.tile_id = TileType.WALL_BASIC
+                current_tile.solid = True
     
     def _add_decorations(self, width: int, height: int):
         """Aggiunge decorazioni alla stanza"""
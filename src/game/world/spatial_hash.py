@@ -0,0 +1,78 @@
+import pygame
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+# Risultato condiviso per le celle vuote
+_EMPTY_CELL: tuple = ()
+
+class SpatialHash:
+    """Griglia uniforme per ridurre i test di collisione ai soli rettangoli vicini"""
+
+    def __init__(self, cell_size: int = 64):
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[pygame.Rect]] = {}
+        
+        # Livello dinamico (entità in movimento), ricostruito ogni frame
+        self.dynamic_cells: Dict[Tuple[int, int], List[Any]] = {}
+
+    def clear(self):
+        """Svuota la griglia"""
+        self.cells.clear()
+        self.dynamic_cells.clear()
+
+    def insert(self, rect: pygame.Rect):
+        """Inserisce un rettangolo in tutte le celle che copre"""
+        cell_size = self.cell_size
+        for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+            for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                self.cells.setdefault((cx, cy), []).append(rect)
+
+    def build(self, rects: Iterable[pygame.Rect]):
+        """Ricostruisce la griglia da una lista di rettangoli"""
+        self.clear()
+        for rect in rects:
+            self.insert(rect)
+
+    def clear_dynamic(self):
+        """Svuota solo il livello dinamico"""
+        self.dynamic_cells.clear()
+
+    def insert_dynamic(self, entity: Any, rect: pygame.Rect):
+        """Inserisce un'entità nelle celle coperte dal suo rettangolo"""
+        cell_size = self.cell_size
+        for cy in range(rect.top // cell_size, (rect.bottom - 1) // cell_size + 1):
+            for cx in range(rect.left // cell_size, (rect.right - 1) // cell_size + 1):
+                self.dynamic_cells.setdefault((cx, cy), []).append(entity)
+
+    def nearby(self, rect: pygame.Rect) -> Sequence[Any]:
+        """Restituisce le entità dinamiche nelle celle toccate da rect
+
+        Un'entità che copre più celle può comparire più volte.
+        """
+        return self._gather(self.dynamic_cells, rect)
+
+    def query(self, rect: pygame.Rect) -> Sequence[pygame.Rect]:
+        """Restituisce i rettangoli nelle celle toccate da rect
+
+        Un rettangolo che copre più celle può comparire più volte.
+        """
+        return self._gather(self.cells, rect)
+
+    def _gather(self, cells: Dict[Tuple[int, int], List[Any]], rect: pygame.Rect) -> Sequence[Any]:
+        """Raccoglie il contenuto delle celle toccate da rect"""
+        cell_size = self.cell_size
+        min_cx = rect.left // cell_size
+        max_cx = (rect.right - 1) // cell_size
+        min_cy = rect.top // cell_size
+        max_cy = (rect.bottom - 1) // cell_size
+
+        # Caso comune: una sola cella, nessuna allocazione
+        if min_cx == max_cx and min_cy == max_cy:
+            return cells.get((min_cx, min_cy), _EMPTY_CELL)
+
+        candidates = []
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    candidates.extend(cell)
+        return candidates
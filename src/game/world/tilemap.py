@@ -1,10 +1,12 @@
 import pygame
 import json
 import csv
+import numpy as np
 from typing import List, Dict, Tuple, Optional, Set
 from enum import Enum
 from .spritesheet_loader import SpritesheetLoader, TilemapConfig
 from .autotiling import AutotilingSystem, AutotileType, AutotilePalette
+from .spatial_hash import SpatialHash
 
 class TileLayer(Enum):
     """Layer del tilemap"""
@@ -73,6 +75,13 @@ class Tilemap:
         # Cache per collisioni
         self.collision_rects = []
         self.hazard_rects = []
+        self.collision_rows: Dict[int, List[pygame.Rect]] = {}  # Indice per riga tile
+        self.collision_hash = SpatialHash(self.TILE_SIZE * 2)  # Broadphase per proiettili
+        
+        # Bordi (left, top, right, bottom) in array NumPy per test AABB vettoriali
+        self._solid_bounds = np.empty((0, 4), dtype=np.int32)
+        self._hazard_bounds = np.empty((0, 4), dtype=np.int32)
+        self._hazard_damage = np.empty(0, dtype=np.int32)
         self._collision_cache_dirty = True
         
         # Debug mode
@@ -111,22 +120,20 @@ class Tilemap:
         self.set_tile(layer, x, y, tile)
     
     def apply_autotiling(self, layer: TileLayer, tile_type: AutotileType, 
-                        solid_pattern: List[List[bool]]):
+                        solid_pattern: np.ndarray):
         """Applica autotiling a un'area del tilemap"""
         autotile_grid = self.autotiling.generate_autotile_grid(solid_pattern, tile_type)
         
-        for y in range(len(autotile_grid)):
-            for x in range(len(autotile_grid[y])):
-                if autotile_grid[y][x] != -1:
-                    # Converti indice autotile in coordinate sprite
-                    sprite_row, sprite_col = self.autotile_palette.get_tile_coords(
-                        tile_type, autotile_grid[y][x]
-                    )
-                    
-                    # Determina il tile_id basato sul tipo
-                    tile_id = TileType.GROUND_BASE if tile_type == AutotileType.GROUND else TileType.WALL_BASIC
-                    
-                    self.set_tile_by_id(layer, x, y, tile_id, sprite_row, sprite_col)
+        # Determina il tile_id basato sul tipo
+        tile_id = TileType.GROUND_BASE if tile_type == AutotileType.GROUND else TileType.WALL_BASIC
+        
+        # Solo le celle con un tile (-1 indica nessun tile), in ordine di riga
+        ys, xs = np.nonzero(autotile_grid != -1)
+        
+        # Converti tutti gli indici autotile in coordinate sprite in un colpo
+        sprite_coords = self.autotile_palette.get_tile_coords_batch(tile_type, autotile_grid[ys, xs])
+        for y, x, (sprite_row, sprite_col) in zip(ys.tolist(), xs.tolist(), sprite_coords.tolist()):
+            self.set_tile_by_id(layer, x, y, tile_id, sprite_row, sprite_col)
     
     def place_door(self, x: int, y: int, door_type: str = "standard"):
         """Piazza una porta del tipo specificato"""
@@ -155,6 +162,8 @@ class Tilemap:
         
         self.collision_rects.clear()
         self.hazard_rects.clear()
+        self.collision_rows.clear()
+        self.collision_hash.clear()
         
         # Genera rettangoli di collisione per tile SOLID
         for y in range(self.height):
@@ -164,6 +173,8 @@ class Tilemap:
                     rect = pygame.Rect(x * self.TILE_SIZE, y * self.TILE_SIZE, 
                                      self.TILE_SIZE, self.TILE_SIZE)
                     self.collision_rects.append(rect)
+                    self.collision_rows.setdefault(y, []).append(rect)
+                    self.collision_hash.insert(rect)
                 
                 # Genera rettangoli per hazard
                 hazard_tile = self.layers[TileLayer.HAZARD][y][x]
@@ -172,6 +183,10 @@ class Tilemap:
                                      self.TILE_SIZE, self.TILE_SIZE)
                     self.hazard_rects.append((rect, hazard_tile.damage))
         
+        self._solid_bounds = self._rects_to_bounds(self.collision_rects)
+        self._hazard_bounds = self._rects_to_bounds([rect for rect, _ in self.hazard_rects])
+        self._hazard_damage = np.array([damage for _, damage in self.hazard_rects], dtype=np.int32)
+        
         self._collision_cache_dirty = False
         print(f"Cache collisioni aggiornata: {len(self.collision_rects)} tile solidi, {len(self.hazard_rects)} hazard")
     
@@ -180,24 +195,53 @@ class Tilemap:
         self._update_collision_cache()
         return self.collision_rects
     
+    def get_collision_rows(self) -> Dict[int, List[pygame.Rect]]:
+        """Ottieni i rettangoli di collisione raggruppati per riga tile"""
+        self._update_collision_cache()
+        return self.collision_rows
+    
+    def get_collision_hash(self) -> SpatialHash:
+        """Ottieni la griglia spaziale dei rettangoli di collisione"""
+        self._update_collision_cache()
+        return self.collision_hash
+    
     def get_hazard_rects(self) -> List[Tuple[pygame.Rect, int]]:
         """Ottieni tutti i rettangoli hazard con il loro danno"""
         self._update_collision_cache()
         return self.hazard_rects
     
+    @staticmethod
+    def _rects_to_bounds(rects: List[pygame.Rect]) -> np.ndarray:
+        """Converte una lista di rettangoli in un array (N, 4) di bordi"""
+        return np.array([(r.left, r.top, r.right, r.bottom) for r in rects],
+                        dtype=np.int32).reshape(-1, 4)
+    
+    @staticmethod
+    def _overlap_mask(bounds: np.ndarray, rect: pygame.Rect) -> np.ndarray:
+        """Test AABB vettoriale con la stessa semantica di Rect.colliderect"""
+        return ((bounds[:, 0] < rect.right) & (bounds[:, 2] > rect.left) &
+                (bounds[:, 1] < rect.bottom) & (bounds[:, 3] > rect.top))
+    
     def check_collision(self, rect: pygame.Rect) -> bool:
         """Controlla collisione con tile solidi"""
-        collision_rects = self.get_collision_rects()
-        return any(rect.colliderect(tile_rect) for tile_rect in collision_rects)
+        self._update_collision_cache()
+        if rect.width <= 0 or rect.height <= 0:
+            return False
+        return bool(self._overlap_mask(self._solid_bounds, rect).any())
     
     def check_hazard_collision(self, rect: pygame.Rect) -> int:
         """Controlla collisione con hazard e restituisce il danno totale"""
-        hazard_rects = self.get_hazard_rects()
-        total_damage = 0
-        for hazard_rect, damage in hazard_rects:
-            if rect.colliderect(hazard_rect):
-                total_damage += damage
-        return total_damage
+        return self.check_hazard_box(rect.left, rect.top, rect.right, rect.bottom)
+    
+    def check_hazard_box(self, left: int, top: int, right: int, bottom: int) -> int:
+        """Come check_hazard_collision, ma su bordi interi senza creare un Rect"""
+        self._update_collision_cache()
+        if right <= left or bottom <= top or not len(self._hazard_damage):
+            return 0
+        bounds = self._hazard_bounds
+        hit = ((bounds[:, 0] < right) & (bounds[:, 2] > left) &
+               (bounds[:, 1] < bottom) & (bounds[:, 3] > top))
+        return int(self._hazard_damage[hit].sum())
     
     def render(self, surface: pygame.Surface, camera_offset: Tuple[int, int] = (0, 0)):
         """Renderizza il tilemap con culling della camera"""
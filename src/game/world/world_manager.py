@@ -1,10 +1,11 @@
 import pygame
-from typing import Tuple, Optional, List
+from typing import Tuple, Optional, List, Dict
 from .tilemap import Tilemap, TileLayer
 from .camera import Camera
 from .parallax_background import ParallaxBackground, ParallaxManager
 from .tilemap_editor import TilemapEditor
 from .map_generator import MapGenerator
+from .spatial_hash import SpatialHash
 
 class WorldManager:
     """Manager principale per il sistema mondo del gioco"""
@@ -159,6 +160,14 @@ class WorldManager:
         """Ottieni rettangoli di collisione per il player"""
         return self.tilemap.get_collision_rects()
     
+    def get_collision_rows(self) -> Dict[int, List[pygame.Rect]]:
+        """Ottieni rettangoli di collisione indicizzati per riga tile"""
+        return self.tilemap.get_collision_rows()
+    
+    def get_collision_hash(self) -> SpatialHash:
+        """Ottieni griglia spaziale dei rettangoli di collisione"""
+        return self.tilemap.get_collision_hash()
+    
     def get_hazard_rects(self) -> List[Tuple[pygame.Rect, int]]:
         """Ottieni rettangoli hazard con danno"""
         return self.tilemap.get_hazard_rects()
@@ -171,6 +180,10 @@ class WorldManager:
         """Controlla collisione con hazard e restituisce danno"""
         return self.tilemap.check_hazard_collision(rect)
     
+    def check_hazard_box(self, left: int, top: int, right: int, bottom: int) -> int:
+        """Controlla collisione con hazard su bordi interi (nessun Rect allocato)"""
+        return self.tilemap.check_hazard_box(left, top, right, bottom)
+    
     def world_to_screen(self, world_pos: Tuple[float, float]) -> Tuple[float, float]:
         """Converte coordinate mondo in coordinate schermo"""
         return self.camera.world_to_screen(world_pos[0], world_pos[1])